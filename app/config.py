@@ -0,0 +1,36 @@
+import json
+import os
+
+# Constants
+DATA_FILE = os.environ.get("GUJARATI_API_DATA_FILE", "data/gujarati_words_google_enhanced.json")
+WARMUP_ON_STARTUP = os.environ.get("GUJARATI_API_WARMUP", "1") != "0"  # Build indexes when the app starts
+
+# Manifest of the content-addressed audio store; audio routes resolve entries through it
+AUDIO_MANIFEST_FILE = os.environ.get("GUJARATI_API_AUDIO_MANIFEST", "audio/store/manifest.json")
+
+# Token required by admin routes (X-Admin-Token header); admin routes are disabled when empty
+ADMIN_TOKEN = os.environ.get("GUJARATI_API_ADMIN_TOKEN", "")
+
+# Per-request profiling
+PROFILING_ENABLED = os.environ.get("GUJARATI_API_PROFILING", "0") == "1"
+PROFILING_MODE = os.environ.get("GUJARATI_API_PROFILING_MODE", "cprofile")  # "cprofile" or "sampler"
+PROFILING_SAMPLE_RATE = float(os.environ.get("GUJARATI_API_PROFILING_SAMPLE_RATE", "0"))  # Fraction of requests profiled
+PROFILING_DIR = os.environ.get("GUJARATI_API_PROFILING_DIR", "profiles")
+PROFILING_INTERVAL = float(os.environ.get("GUJARATI_API_PROFILING_INTERVAL", "0.001"))  # Sampler interval in seconds
+
+# Admission control: per route class concurrency limits and bounded queues.
+# Lower priority numbers are admitted first when requests are queued.
+ADMISSION_ENABLED = os.environ.get("GUJARATI_API_ADMISSION", "1") != "0"
+ADMISSION_TOTAL_CONCURRENCY = int(os.environ.get("GUJARATI_API_ADMISSION_TOTAL", "32"))  # Across every route class
+ADMISSION_QUEUE_TIMEOUT = float(os.environ.get("GUJARATI_API_ADMISSION_QUEUE_TIMEOUT", "2"))  # Seconds a request may wait
+ADMISSION_LIMITS = {
+    "lookup": {"priority": 0, "concurrency": 32, "queue": 128},
+    "list": {"priority": 1, "concurrency": 8, "queue": 32},
+    "audio": {"priority": 1, "concurrency": 16, "queue": 64},
+    "search": {"priority": 2, "concurrency": 4, "queue": 16},
+    "write": {"priority": 2, "concurrency": 4, "queue": 16},
+    "export": {"priority": 3, "concurrency": 2, "queue": 2},
+}
+# Overrides as JSON, e.g. '{"search": {"concurrency": 2}}'
+for _name, _limits in json.loads(os.environ.get("GUJARATI_API_ADMISSION_LIMITS", "{}")).items():
+    ADMISSION_LIMITS.setdefault(_name, {"priority": 1, "concurrency": 8, "queue": 32}).update(_limits)
@@ -0,0 +1,48 @@
+import json
+from ..services.admission import AdmissionController, AdmissionRejected
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying per route class admission control.
+    
+    Rejected requests get a 429 (class queue full) or 503 (timed out in
+    the queue) JSON response with a ``Retry-After`` header.
+    """
+    
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        name = self.controller.classify(scope["path"], scope["method"])
+        if name is None:
+            await self.app(scope, receive, send)
+            return
+        
+        try:
+            await self.controller.acquire(name)
+        except AdmissionRejected as e:
+            await self._reject(send, e)
+            return
+        
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(name)
+    
+    async def _reject(self, send, rejection: AdmissionRejected):
+        body = json.dumps({"detail": rejection.detail}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": rejection.status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(rejection.retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
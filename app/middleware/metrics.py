@@ -0,0 +1,41 @@
+import time
+from ..services.metrics import http_request_duration, http_requests_in_progress, http_response_size
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency and response size histograms.
+    
+    Requests are labelled with the route template (e.g. ``/api/v1/words/{word_id}``)
+    rather than the raw path so label cardinality stays bounded.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        status = 500
+        size = 0
+        start = time.perf_counter()
+        
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+        
+        http_requests_in_progress.inc(method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_requests_in_progress.inc(method, amount=-1)
+            route = getattr(scope.get("route"), "path", "unmatched")
+            http_request_duration.observe(elapsed, method, route, str(status))
+            http_response_size.observe(size, method, route, str(status))
@@ -0,0 +1,74 @@
+import cProfile
+import hmac
+import random
+import threading
+from ..services.profiling import ProfileStore, StackSampler
+
+# Header that forces profiling of a request when it carries the admin token
+PROFILE_HEADER = b"x-profile-request"
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling a sample of requests.
+    
+    A request is profiled when it sends the admin token in the
+    ``X-Profile-Request`` header, or at random with ``sample_rate``
+    probability. Profiles cover the event loop thread, so requests running
+    concurrently with a profiled one can show up in its profile.
+    """
+    
+    def __init__(
+        self,
+        app,
+        store: ProfileStore,
+        mode: str = "cprofile",
+        sample_rate: float = 0.0,
+        token: str = "",
+        interval: float = 0.001
+    ):
+        self.app = app
+        self.store = store
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.token = token.encode()
+        self.interval = interval
+        # Only one request is profiled at a time
+        self._active = threading.Lock()
+    
+    def _should_profile(self, scope) -> bool:
+        if self.token:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER and hmac.compare_digest(value, self.token):
+                    return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        if not self._active.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            self._active.release()
+    
+    async def _profile(self, scope, receive, send):
+        name = f"{scope['method']} {scope['path']}"
+        if self.mode == "sampler":
+            sampler = StackSampler(threading.get_ident(), self.interval)
+            sampler.start()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                sampler.stop()
+                self.store.add_samples(sampler, name)
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                profiler.disable()
+                self.store.add_cprofile(profiler, name)
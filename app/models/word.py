@@ -1,5 +1,5 @@
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
 class WordDefinition(BaseModel):
@@ -8,6 +8,12 @@ class WordDefinition(BaseModel):
     definition: str
 
 
+class RelatedWord(BaseModel):
+    """Model for an entry with a near-duplicate definition, example or translation."""
+    id: str
+    similarity: float  # Estimated Jaccard similarity of the most similar field
+
+
 class Word(BaseModel):
     """Model for Gujarati words."""
     word: str
@@ -19,3 +25,25 @@ class Word(BaseModel):
     example_translation: Optional[str] = None  # English translation of the example sentence
     example_audio: Optional[str] = None  # Path to the example audio file
     word_audio: Optional[str] = None  # Path to the word audio file
+    related: List[RelatedWord] = []  # Near-duplicate entries, most similar first; computed by find_duplicates.py
+
+
+class WordUpdate(BaseModel):
+    """Model for partial updates of Gujarati words; unset fields are left unchanged."""
+    word: Optional[str] = None
+    ipa: Optional[str] = None
+    romanization: Optional[str] = None
+    definitions: Optional[List[WordDefinition]] = None
+    example: Optional[str] = None
+    example_romanization: Optional[str] = None
+    example_translation: Optional[str] = None
+    example_audio: Optional[str] = None
+    word_audio: Optional[str] = None
+    
+    @field_validator("word", "definitions")
+    @classmethod
+    def reject_null(cls, value):
+        """Reject null for the fields a Word requires; they can only be left unset."""
+        if value is None:
+            raise ValueError("may be left out but not null")
+        return value
@@ -0,0 +1,58 @@
+import hmac
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from ..config import ADMIN_TOKEN, DATA_FILE
+from ..services.admission import admission
+from ..services.profiling import profile_store
+from ..services.warmup import tracker
+
+# Dependency to check the admin token
+def require_admin(x_admin_token: str = Header("", description="Admin token")):
+    """Reject requests that don't carry the configured admin token."""
+    # Compared as bytes: compare_digest rejects non-ASCII str, and header
+    # values are decoded as latin-1, so any byte may reach it
+    if not ADMIN_TOKEN or not hmac.compare_digest(x_admin_token.encode("utf-8"), ADMIN_TOKEN.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+@router.get("/profiles")
+async def get_profiles(
+    limit: int = Query(25, description="Maximum number of functions to return"),
+    sort: str = Query("cumulative_seconds", description="Sort by calls, self_seconds or cumulative_seconds")
+):
+    """Get the top functions aggregated across every profiled request."""
+    if sort not in ("calls", "self_seconds", "cumulative_seconds"):
+        raise HTTPException(status_code=400, detail="Invalid sort field")
+    return {
+        "profiled_requests": profile_store.profiled_requests,
+        "directory": str(profile_store.directory),
+        "files": list(profile_store.files),
+        "top_functions": profile_store.top_functions(limit=limit, sort=sort),
+    }
+
+@router.delete("/profiles")
+async def reset_profiles():
+    """Reset the aggregated profile data."""
+    profile_store.reset()
+    return {"status": "reset"}
+
+@router.get("/admission")
+async def get_admission():
+    """Get the admission limits, current queue lengths and rejection counts."""
+    return admission.status()
+
+# A plain def, so waiting for the service and the fsync'd writes run in a
+# worker thread instead of blocking the event loop
+@router.post("/compact")
+def compact_changelog():
+    """Fold the change log into the data file."""
+    dict_service = tracker.get_service(DATA_FILE)
+    return dict_service.compact()
+
+# Reading and hashing the file and the patching run in a worker thread like
+# the other writes; only the patching holds the service's write lock
+@router.post("/reload")
+def reload_dictionary():
+    """Reload the data file, reindexing only the entries that changed."""
+    dict_service = tracker.get_service(DATA_FILE)
+    return dict_service.reload()
@@ -0,0 +1,115 @@
+import csv
+import io
+import json
+import zlib
+from typing import Iterator
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from ..services.dictionary import DictionaryService
+from .words import get_dictionary_service
+
+router = APIRouter(prefix="/api/v1", tags=["export"])
+
+# Approximate number of bytes buffered before a chunk is sent
+CHUNK_SIZE = 64 * 1024
+
+# Columns of the CSV export
+CSV_COLUMNS = [
+    "id", "version", "deleted", "word", "ipa", "romanization", "pos", "definition", "example",
+    "example_romanization", "example_translation", "example_audio", "word_audio"
+]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+def iter_ndjson(dict_service: DictionaryService, since_version: int) -> Iterator[str]:
+    """Yield one JSON object per entry, each on its own line."""
+    for word_id, version, word in dict_service.iter_entries(since_version):
+        row = {"id": word_id, "version": version}
+        if word is None:
+            row["deleted"] = True
+        else:
+            row.update(word.model_dump())
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+def iter_csv(dict_service: DictionaryService, since_version: int) -> Iterator[str]:
+    """Yield a CSV header followed by one row per entry."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    for word_id, version, word in dict_service.iter_entries(since_version):
+        if word is None:
+            writer.writerow([word_id, version, 1] + [""] * (len(CSV_COLUMNS) - 3))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            continue
+        definition = word.definitions[0] if word.definitions else None
+        writer.writerow([
+            word_id, version, "", word.word, word.ipa, word.romanization,
+            definition.pos if definition else "", definition.definition if definition else "",
+            word.example, word.example_romanization, word.example_translation,
+            word.example_audio, word.word_audio
+        ])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+def iter_chunks(rows: Iterator[str], compress: bool) -> Iterator[bytes]:
+    """Group rows into chunks of about CHUNK_SIZE bytes, optionally gzipped."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    pending = []
+    pending_size = 0
+    for row in rows:
+        data = row.encode("utf-8")
+        pending.append(data)
+        pending_size += len(data)
+        if pending_size >= CHUNK_SIZE:
+            chunk = b"".join(pending)
+            pending = []
+            pending_size = 0
+            if compressor:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+    chunk = b"".join(pending)
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+@router.get("/export")
+def export_words(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="Export format: ndjson or csv"),
+    since_version: int = Query(0, ge=0, description="Only export entries changed after this version"),
+    accept_encoding: str = Header("", include_in_schema=False),
+    dict_service: DictionaryService = Depends(get_dictionary_service)
+):
+    """Stream the whole dictionary, or the entries changed since a version.
+    
+    The response is generated while it is sent, so memory use doesn't grow
+    with the dictionary. It is gzipped when the client accepts gzip. The
+    X-Dictionary-Version header holds the version to pass as since_version
+    on the next export to only fetch later changes; with since_version,
+    entries deleted since then are included and marked as deleted. Returns
+    410 if since_version is older than the deletions kept by compaction,
+    as the export would miss deletions; the client must export everything.
+    """
+    if since_version and since_version < dict_service.tombstones_since:
+        raise HTTPException(
+            status_code=410,
+            detail=f"Deletions before version {dict_service.tombstones_since} were compacted; export without since_version"
+        )
+    compress = "gzip" in accept_encoding.lower()
+    rows = iter_csv(dict_service, since_version) if format == "csv" else iter_ndjson(dict_service, since_version)
+    headers = {
+        "Content-Disposition": f'attachment; filename="gujarati_words.{format}"',
+        "X-Dictionary-Version": str(dict_service.version),
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(iter_chunks(rows, compress), media_type=MEDIA_TYPES[format], headers=headers)
@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from ..services.warmup import tracker
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+@router.get("/live")
+async def liveness():
+    """Report that the process is up, whether or not the dictionary is warm."""
+    status = tracker.status()
+    return {
+        "status": "alive",
+        "uptime_seconds": status["uptime_seconds"],
+        "components": status["components"],
+    }
+
+@router.get("/ready")
+async def readiness():
+    """Report whether every dictionary component is built.
+
+    Returns 503 until the warmup has finished so load balancers keep
+    traffic away from cold workers.
+    """
+    status = tracker.status()
+    status["status"] = "ready" if status["ready"] else "warming"
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
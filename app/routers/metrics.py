@@ -0,0 +1,84 @@
+from typing import List
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from ..services.admission import admission
+from ..services.metrics import Counter, Gauge, registry
+from ..services.warmup import tracker
+
+router = APIRouter(tags=["metrics"])
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def collect_dictionary_metrics() -> List:
+    """Build gauges and counters describing the shared dictionary service."""
+    status = tracker.status()
+    warm_seconds = Gauge(
+        "gujarati_api_warmup_component_seconds",
+        "Time spent building each dictionary component.",
+        ("component",),
+    )
+    warm_ready = Gauge(
+        "gujarati_api_warmup_component_ready",
+        "Whether each dictionary component has been built.",
+        ("component",),
+    )
+    for name, component in status["components"].items():
+        warm_seconds.set(component["elapsed_seconds"] or 0, name)
+        warm_ready.set(1 if component["state"] == "ready" else 0, name)
+    metrics = [warm_seconds, warm_ready]
+    
+    service = tracker.service
+    if service is None:
+        return metrics
+    stats = service.stats
+    
+    load_seconds = Gauge("gujarati_api_snapshot_load_seconds", "Time spent loading the data file.")
+    load_seconds.set(service.load_seconds)
+    entries = Gauge("gujarati_api_dictionary_entries", "Number of entries in the dictionary.")
+    entries.set(len(service.word_data))
+    index_size = Gauge("gujarati_api_index_size", "Number of items in each derived structure.", ("index",))
+    for name, size in service.index_sizes().items():
+        index_size.set(size, name)
+    
+    audio_files = Counter("gujarati_api_audio_files_served_total", "Audio files served.")
+    audio_files.inc(amount=stats["audio_files_served"])
+    audio_bytes = Counter("gujarati_api_audio_bytes_served_total", "Bytes of audio served.")
+    audio_bytes.inc(amount=stats["audio_bytes_served"])
+    
+    cache_lookups = Counter("gujarati_api_cache_lookups_total", "Cache lookups by cache and result.", ("cache", "result"))
+    cache_lookups.inc("models", "hit", amount=stats["model_cache_hits"])
+    cache_lookups.inc("models", "miss", amount=stats["model_cache_misses"])
+    lookups = stats["model_cache_hits"] + stats["model_cache_misses"]
+    hit_ratio = Gauge("gujarati_api_cache_hit_ratio", "Fraction of cache lookups that were hits.", ("cache",))
+    hit_ratio.set(stats["model_cache_hits"] / lookups if lookups else 0, "models")
+    
+    metrics.extend([load_seconds, entries, index_size, audio_files, audio_bytes, cache_lookups, hit_ratio])
+    return metrics
+
+def collect_admission_metrics() -> List:
+    """Build gauges and counters describing admission control."""
+    status = admission.status()
+    limit = Gauge("gujarati_api_admission_concurrency_limit", "Concurrency limit of each route class.", ("route_class",))
+    active = Gauge("gujarati_api_admission_active", "Requests running in each route class.", ("route_class",))
+    queued = Gauge("gujarati_api_admission_queued", "Requests waiting in each route class queue.", ("route_class",))
+    rejected = Counter(
+        "gujarati_api_admission_rejected_total",
+        "Requests rejected by admission control.",
+        ("route_class", "reason"),
+    )
+    for name, values in status["classes"].items():
+        limit.set(values["concurrency"], name)
+        active.set(values["active"], name)
+        queued.set(values["queued"], name)
+        rejected.inc(name, "queue_full", amount=values["rejected"])
+        rejected.inc(name, "timeout", amount=values["timed_out"])
+    return [limit, active, queued, rejected]
+
+registry.add_collector(collect_dictionary_metrics)
+registry.add_collector(collect_admission_metrics)
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Expose metrics in the Prometheus text format."""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Query
+from pipeline.transliteration import transliterate
+
+router = APIRouter(prefix="/api/v1", tags=["transliteration"])
+
+@router.get("/transliterate")
+async def transliterate_text(
+    text: str = Query(..., max_length=2000, description="Gujarati text to romanize")
+):
+    """Romanize Gujarati text locally, without a call to a translation service."""
+    return {"text": text, "romanization": transliterate(text)}
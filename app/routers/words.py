@@ -1,15 +1,17 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
-from ..models.word import Word
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from ..config import DATA_FILE
+from ..models.word import Word, WordUpdate
 from ..services.dictionary import DictionaryService
+from ..services.warmup import tracker
+from .admin import require_admin
 
 router = APIRouter(prefix="/api/v1", tags=["words"])
 
 # Dependency to get the dictionary service
 def get_dictionary_service():
-    """Get an instance of the dictionary service."""
-    return DictionaryService("data/gujarati_words_google_enhanced.json")
+    """Get the shared dictionary service, waiting for it to warm up if needed."""
+    return tracker.get_service(DATA_FILE)
 
 @router.get("/words", response_model=List[Word])
 async def get_words(
@@ -42,17 +44,65 @@ async def get_word(
         raise HTTPException(status_code=404, detail="Word not found")
     return word
 
+# Writes are plain defs, so the fsync'd change log append and the index
+# patching run in a worker thread. The service serializes them and updates
+# each list in one step, so reads on the event loop never see a half-patched
+# index
+@router.put("/words/{word_id}", response_model=Word, dependencies=[Depends(require_admin)])
+def put_word(
+    word_id: str,
+    word: Word,
+    response: Response,
+    dict_service: DictionaryService = Depends(get_dictionary_service)
+):
+    """Create or replace a word."""
+    if len(word.definitions) != 1:
+        raise HTTPException(status_code=422, detail="A word must have exactly one definition")
+    version = dict_service.put_entry(word_id, dict_service.convert_to_entry(word))
+    response.headers["X-Dictionary-Version"] = str(version)
+    return dict_service.get_word_by_id(word_id)
+
+@router.patch("/words/{word_id}", response_model=Word, dependencies=[Depends(require_admin)])
+def patch_word(
+    word_id: str,
+    update: WordUpdate,
+    response: Response,
+    dict_service: DictionaryService = Depends(get_dictionary_service)
+):
+    """Update some fields of a word."""
+    word = dict_service.get_word_by_id(word_id)
+    if not word:
+        raise HTTPException(status_code=404, detail="Word not found")
+    updated = word.model_copy(update=update.model_dump(exclude_unset=True))
+    updated = Word.model_validate(updated.model_dump())
+    if len(updated.definitions) != 1:
+        raise HTTPException(status_code=422, detail="A word must have exactly one definition")
+    version = dict_service.put_entry(word_id, dict_service.convert_to_entry(updated))
+    response.headers["X-Dictionary-Version"] = str(version)
+    return dict_service.get_word_by_id(word_id)
+
+@router.delete("/words/{word_id}", status_code=204, dependencies=[Depends(require_admin)])
+def delete_word(
+    word_id: str,
+    dict_service: DictionaryService = Depends(get_dictionary_service)
+):
+    """Delete a word."""
+    version = dict_service.delete_entry(word_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Word not found")
+    return Response(status_code=204, headers={"X-Dictionary-Version": str(version)})
+
 @router.get("/audio/word/{word_id}")
 async def get_word_audio(
     word_id: str,
     dict_service: DictionaryService = Depends(get_dictionary_service)
 ):
     """Get the audio file for a word."""
-    word = dict_service.get_word_by_id(word_id)
-    if not word or not word.word_audio:
+    audio_path = dict_service.resolve_audio(word_id, "word")
+    if not audio_path:
         raise HTTPException(status_code=404, detail="Word audio not found")
     
-    audio_response = dict_service.get_audio_file(word.word_audio)
+    audio_response = dict_service.get_audio_file(audio_path)
     if not audio_response:
         raise HTTPException(status_code=404, detail="Audio file not found")
     
@@ -64,11 +114,11 @@ async def get_example_audio(
     dict_service: DictionaryService = Depends(get_dictionary_service)
 ):
     """Get the audio file for an example sentence."""
-    word = dict_service.get_word_by_id(word_id)
-    if not word or not word.example_audio:
+    audio_path = dict_service.resolve_audio(word_id, "example")
+    if not audio_path:
         raise HTTPException(status_code=404, detail="Example audio not found")
     
-    audio_response = dict_service.get_audio_file(word.example_audio)
+    audio_response = dict_service.get_audio_file(audio_path)
     if not audio_response:
         raise HTTPException(status_code=404, detail="Audio file not found")
     
@@ -0,0 +1,197 @@
+import asyncio
+import bisect
+import itertools
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+from ..config import ADMISSION_LIMITS, ADMISSION_QUEUE_TIMEOUT, ADMISSION_TOTAL_CONCURRENCY
+
+# HTTP methods that modify the dictionary; writes to word routes get their
+# own class rather than the priority of the lookups sharing their path
+WRITE_METHODS = {"PUT", "PATCH", "DELETE", "POST"}
+WRITE_ROUTES: Pattern = re.compile(r"^/api/v1/words/")
+
+# Path patterns mapped to route classes; unmatched paths (health checks,
+# metrics, admin, docs) bypass admission control
+ROUTE_CLASSES: List[Tuple[Pattern, str]] = [
+    (re.compile(r"^/api/v1/words/search/?$"), "search"),
+    (re.compile(r"^/api/v1/export/?$"), "export"),
+    (re.compile(r"^/api/v1/audio/"), "audio"),
+    (re.compile(r"^/api/v1/words/?$"), "list"),
+    (re.compile(r"^/api/v1/words/[^/]+/?$"), "lookup"),
+]
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is not admitted."""
+    
+    def __init__(self, status_code: int, detail: str, retry_after: int):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class RouteClass:
+    """Limits and counters of one class of routes."""
+    
+    def __init__(self, name: str, priority: int, concurrency: int, queue: int):
+        self.name = name
+        self.priority = priority
+        self.concurrency = concurrency
+        self.queue = queue
+        self.active = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+    
+    def to_dict(self) -> Dict:
+        """Get the limits and counters as a JSON-serializable dict."""
+        return {
+            "priority": self.priority,
+            "concurrency": self.concurrency,
+            "queue": self.queue,
+            "active": self.active,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+class AdmissionController:
+    """Per route class concurrency limits with bounded priority queues.
+    
+    A request runs when both its class and the process as a whole have a
+    free slot. Otherwise it waits in its class queue; when a slot frees up
+    the waiting request with the lowest priority number is admitted first,
+    so cheap lookups overtake queued searches and exports. Requests are
+    rejected when their class queue is full or they wait too long.
+    
+    Must only be used from the event loop thread.
+    """
+    
+    def __init__(
+        self,
+        limits: Dict[str, Dict[str, int]],
+        total_concurrency: int,
+        queue_timeout: float
+    ):
+        """Initialize the controller.
+        
+        Args:
+            limits: Route class name -> {"priority", "concurrency", "queue"}
+            total_concurrency: Maximum requests running across every class
+            queue_timeout: Seconds a request may wait before being rejected
+        """
+        self.classes = {
+            name: RouteClass(name, values["priority"], values["concurrency"], values["queue"])
+            for name, values in limits.items()
+        }
+        self.total_concurrency = total_concurrency
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._sequence = itertools.count()
+        # Sorted list of (priority, sequence, class name, future)
+        self._waiters: List[Tuple[int, int, str, asyncio.Future]] = []
+    
+    def classify(self, path: str, method: str = "GET") -> Optional[str]:
+        """Get the route class of a request, or None if it isn't limited."""
+        if method in WRITE_METHODS and WRITE_ROUTES.match(path):
+            return "write" if "write" in self.classes else None
+        for pattern, name in ROUTE_CLASSES:
+            if pattern.match(path) and name in self.classes:
+                return name
+        return None
+    
+    async def acquire(self, name: str):
+        """Wait for a slot in a route class.
+        
+        Args:
+            name: Route class name
+            
+        Raises:
+            AdmissionRejected: If the class queue is full or the wait times out
+        """
+        route_class = self.classes[name]
+        if route_class.queued == 0 and self._has_room(route_class):
+            self._admit(route_class)
+            return
+        
+        if route_class.queued >= route_class.queue:
+            route_class.rejected += 1
+            raise AdmissionRejected(429, f"Too many queued '{name}' requests", self._retry_after())
+        
+        future = asyncio.get_running_loop().create_future()
+        waiter = (route_class.priority, next(self._sequence), name, future)
+        bisect.insort(self._waiters, waiter)
+        route_class.queued += 1
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            route_class.timed_out += 1
+            raise AdmissionRejected(503, f"Timed out waiting for a '{name}' slot", self._retry_after())
+        except asyncio.CancelledError:
+            # The slot may have been granted just before the cancellation
+            if future.done() and not future.cancelled():
+                self.release(name)
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                route_class.queued -= 1
+    
+    def release(self, name: str):
+        """Free a slot in a route class and admit waiting requests.
+        
+        Args:
+            name: Route class name
+        """
+        self.classes[name].active -= 1
+        self.active -= 1
+        self._dispatch()
+    
+    def status(self) -> Dict:
+        """Get the limits, current usage and counters of every route class."""
+        return {
+            "total_concurrency": self.total_concurrency,
+            "queue_timeout_seconds": self.queue_timeout,
+            "active": self.active,
+            "queued": len(self._waiters),
+            "classes": {name: route_class.to_dict() for name, route_class in self.classes.items()},
+        }
+    
+    def _has_room(self, route_class: RouteClass) -> bool:
+        return route_class.active < route_class.concurrency and self.active < self.total_concurrency
+    
+    def _admit(self, route_class: RouteClass):
+        route_class.active += 1
+        route_class.admitted += 1
+        self.active += 1
+    
+    def _dispatch(self):
+        """Admit queued requests, highest priority first, while slots are free."""
+        i = 0
+        while i < len(self._waiters) and self.active < self.total_concurrency:
+            waiter = self._waiters[i]
+            route_class = self.classes[waiter[2]]
+            future = waiter[3]
+            if future.done():
+                # Timed out or cancelled; acquire() removes it
+                i += 1
+                continue
+            if not self._has_room(route_class):
+                i += 1
+                continue
+            del self._waiters[i]
+            route_class.queued -= 1
+            self._admit(route_class)
+            future.set_result(None)
+    
+    def _retry_after(self) -> int:
+        """Get the number of seconds clients should wait before retrying."""
+        return max(1, int(round(self.queue_timeout)))
+
+
+# Shared controller for the application process
+admission = AdmissionController(ADMISSION_LIMITS, ADMISSION_TOTAL_CONCURRENCY, ADMISSION_QUEUE_TIMEOUT)
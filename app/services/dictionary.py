@@ -1,21 +1,344 @@
+import hashlib
 import json
 import os
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 from fastapi.responses import FileResponse
-from ..models.word import Word, WordDefinition
+from pipeline.audio_store import AUDIO_FIELDS, AudioStore
+from pipeline.changelog import OP_DELETE, OP_PUT, ChangeLog, apply_records, changelog_path
+from pipeline.files import write_json_atomic
+from pipeline.similarity import load_related, related_path
+from ..config import AUDIO_MANIFEST_FILE
+from ..models.word import RelatedWord, Word, WordDefinition
+
+# Number of entries processed between progress callbacks while building indexes
+PROGRESS_CHUNK = 500
+
+# Callback used to report build progress: (component, done, total)
+ProgressCallback = Callable[[str, int, int], None]
+
 
 class DictionaryService:
     """Service for managing the dictionary data."""
     
-    def __init__(self, data_file: str):
+    # Components built by warm(), in build order
+    COMPONENTS = ("snapshot", "search_index", "models", "audio")
+    
+    def __init__(
+        self,
+        data_file: str,
+        lazy: bool = False,
+        audio_manifest_file: str = AUDIO_MANIFEST_FILE,
+        related_file: Optional[str] = None
+    ):
         """Initialize the dictionary service with a data file.
         
         Args:
             data_file: Path to the JSON data file
+            lazy: If True, don't load the data until warm() is called
+            audio_manifest_file: Path to the manifest of the audio store
+            related_file: Path to the related entries computed by
+                find_duplicates.py (default: next to the data file)
         """
         self.data_file = data_file
+        self.audio_manifest_file = audio_manifest_file
+        self.related_file = related_file or related_path(data_file)
+        self.word_data: Dict = {}
+        self.load_seconds = 0.0
+        
+        # Writes are appended to the change log and replayed on load
+        self.changelog = ChangeLog(changelog_path(data_file))
+        # Serializes writes, which may run in worker threads
+        self._write_lock = threading.Lock()
+        
+        # Every entry loaded from the data file has base_version; entries
+        # changed since then have their own, higher version
+        self.base_version = 1
+        self.version = self.base_version
+        self._entry_versions: Dict[str, int] = {}
+        self._deleted: Dict[str, int] = {}  # ID -> version of the deletion
+        # Deletions before this version were dropped by a compaction
+        self.tombstones_since = 0
+        
+        # Derived structures, all in the same order as word_data. Adding or
+        # removing an entry replaces these lists rather than mutating them,
+        # so iterations that started earlier keep a consistent view.
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}  # ID -> index in the lists
+        self._entries: List[List] = []
+        # Rows carry their ID, so searches don't pair up two lists that a
+        # concurrent write may replace one after the other
+        self._search_index: List[Tuple[str, str, str, str]] = []
+        self._model_cache: Dict[str, Word] = {}
+        self._audio_manifest: Dict[str, int] = {}  # Audio path -> size in bytes
+        self._audio_store: Optional[AudioStore] = None
+        
+        # Near-duplicate entries of each entry, most similar first, and the
+        # entries listing each entry as related (lists are cut to the most
+        # similar, so the two can differ)
+        self._related: Dict[str, List[Dict]] = {}
+        self._related_by: Dict[str, List[str]] = {}
+        
+        # Content hash of each live entry, set by reloads
+        self._entry_hashes: Dict[str, str] = {}
+        
+        # Counters exported through /metrics
+        self.stats: Dict[str, int] = {
+            "model_cache_hits": 0,
+            "model_cache_misses": 0,
+            "audio_files_served": 0,
+            "audio_bytes_served": 0,
+        }
+        
+        if not lazy:
+            self.warm()
+    
+    def warm(self, progress: Optional[ProgressCallback] = None):
+        """Load the data file and build every derived structure.
+        
+        Args:
+            progress: Optional callback receiving (component, done, total)
+        """
+        self.load_snapshot(progress)
+        self.build_search_index(progress)
+        self.build_model_cache(progress)
+        self.build_audio_manifest(progress)
+    
+    def load_snapshot(self, progress: Optional[ProgressCallback] = None):
+        """Load word data from the data file, replay the change log and record its order.
+        
+        Args:
+            progress: Optional callback receiving (component, done, total)
+        """
+        if progress:
+            progress("snapshot", 0, 1)
+        start = time.perf_counter()
         self.word_data = self._load_data()
+        state = apply_records(self.word_data, self.changelog.read())
+        self.base_version = state["base_version"]
+        self.version = state["version"]
+        self._entry_versions = state["entry_versions"]
+        self._deleted = state["deleted"]
+        self.tombstones_since = state["tombstones_since"]
+        self._ids = list(self.word_data.keys())
+        self._positions = {word_id: i for i, word_id in enumerate(self._ids)}
+        self._entries = list(self.word_data.values())
+        self._related = load_related(self.related_file)
+        self._related_by = self._invert_related(self._related)
+        self.load_seconds = time.perf_counter() - start
+        if progress:
+            progress("snapshot", 1, 1)
+    
+    def build_search_index(self, progress: Optional[ProgressCallback] = None):
+        """Precompute the lowercased fields searched by search_word.
+        
+        Args:
+            progress: Optional callback receiving (component, done, total)
+        """
+        total = len(self._entries)
+        index = []
+        for i, (word_id, word_entry) in enumerate(zip(self._ids, self._entries)):
+            index.append((word_id,) + self._search_fields(word_entry))
+            if progress and (i + 1) % PROGRESS_CHUNK == 0:
+                progress("search_index", i + 1, total)
+        self._search_index = index
+        if progress:
+            progress("search_index", total, total)
+    
+    def build_model_cache(self, progress: Optional[ProgressCallback] = None):
+        """Convert every entry to its Word model ahead of time.
+        
+        Args:
+            progress: Optional callback receiving (component, done, total)
+        """
+        total = len(self._ids)
+        cache = {}
+        for i, (word_id, word_entry) in enumerate(zip(self._ids, self._entries)):
+            cache[word_id] = self._convert_to_word_model(word_entry, word_id)
+            if progress and (i + 1) % PROGRESS_CHUNK == 0:
+                progress("models", i + 1, total)
+        self._model_cache = cache
+        if progress:
+            progress("models", total, total)
+    
+    def build_audio_manifest(self, progress: Optional[ProgressCallback] = None):
+        """Record which audio files exist on disk and their sizes.
+        
+        Blobs of the audio store are taken from its manifest; only audio
+        paths of entries the store doesn't cover are looked up on disk.
+        
+        Args:
+            progress: Optional callback receiving (component, done, total)
+        """
+        total = len(self._entries)
+        store = AudioStore(self.audio_manifest_file)
+        manifest = {store.blob_path(key): blob["size"] for key, blob in store.blobs.items()}
+        for i, (word_id, word_entry) in enumerate(zip(self._ids, self._entries)):
+            for kind, field in AUDIO_FIELDS.items():
+                audio_path = word_entry[field] if len(word_entry) > field else ""
+                if not audio_path or audio_path in manifest:
+                    continue
+                if store.resolve(word_id, kind, self._audio_text(word_entry, kind)):
+                    continue
+                try:
+                    manifest[audio_path] = os.path.getsize(audio_path)
+                except OSError:
+                    pass
+            if progress and (i + 1) % PROGRESS_CHUNK == 0:
+                progress("audio", i + 1, total)
+        self._audio_store = store
+        self._audio_manifest = manifest
+        if progress:
+            progress("audio", total, total)
+    
+    def index_sizes(self) -> Dict[str, int]:
+        """Get the number of items held by each derived structure.
+        
+        Returns:
+            Dict mapping structure name to its size
+        """
+        return {
+            "ids": len(self._ids),
+            "search_index": len(self._search_index),
+            "models": len(self._model_cache),
+            "audio_manifest": len(self._audio_manifest),
+        }
+    
+    def diff_snapshot(self) -> Dict:
+        """Compare the data file on disk with the live data.
+        
+        Reads the data file and replays the change log like load_snapshot,
+        and reloads the audio store manifest and related entries, without
+        touching the live data, so it can run outside the event loop.
+        Entries are compared by content hash.
+        
+        Returns:
+            Dict with the live "version" the diff was made against, the
+            "entries" added or changed, the "removed" IDs, the "hashes" of
+            every entry on disk, the "log" state of the change log, the
+            "audio_store", the "related" entries, the "unchanged" count
+            and "seconds" taken
+        """
+        start = time.perf_counter()
+        version = self.version
+        # Copied in one step, as writes may add entries while this runs
+        live_items = list(self.word_data.items())
+        new_data = self._load_data()
+        log_state = apply_records(new_data, self.changelog.read())
+        audio_store = AudioStore(self.audio_manifest_file)
+        related = load_related(self.related_file)
+        
+        # Hashes are only missing for entries written since the last reload
+        live_hashes = dict(self._entry_hashes)
+        for word_id, word_entry in live_items:
+            if word_id not in live_hashes:
+                live_hashes[word_id] = self._entry_hash(word_entry)
+        
+        entries = {}
+        hashes = {}
+        unchanged = 0
+        for word_id, word_entry in new_data.items():
+            entry_hash = self._entry_hash(word_entry)
+            hashes[word_id] = entry_hash
+            if live_hashes.get(word_id) == entry_hash:
+                unchanged += 1
+            else:
+                entries[word_id] = word_entry
+        removed = [word_id for word_id, _ in live_items if word_id not in new_data]
+        
+        return {
+            "version": version,
+            "entries": entries,
+            "hashes": hashes,
+            "removed": removed,
+            "log": {"version": log_state["version"], "tombstones_since": log_state["tombstones_since"]},
+            "audio_store": audio_store,
+            "related": related,
+            "unchanged": unchanged,
+            "seconds": time.perf_counter() - start,
+        }
+    
+    def apply_diff(self, diff: Dict) -> Dict:
+        """Patch the live data with a diff made by diff_snapshot.
+        
+        Only the added, changed and removed entries are touched. They all
+        get one new version, recorded in the change log as the new base so
+        the versions stay monotonic across restarts, along with a deletion
+        for each removed entry so incremental exports still report it after
+        a restart. The new version is also above that of a log that was
+        reset by a script saving the data file. Entries written since the
+        diff was made are left alone.
+        
+        Args:
+            diff: Result of diff_snapshot
+            
+        Returns:
+            Reload report with counts and timings
+        """
+        with self._write_lock:
+            start = time.perf_counter()
+            written = {word_id for word_id, version in self._entry_versions.items() if version > diff["version"]}
+            written.update(word_id for word_id, version in self._deleted.items() if version > diff["version"])
+            
+            added = changed = 0
+            updates = []
+            for word_id, word_entry in diff["entries"].items():
+                if word_id in written:
+                    continue
+                if word_id in self.word_data:
+                    changed += 1
+                else:
+                    added += 1
+                updates.append((word_id, word_entry))
+            removed = [word_id for word_id in diff["removed"] if word_id not in written and word_id in self.word_data]
+            
+            # Blobs are immutable, so the new store only adds paths
+            audio_store = diff["audio_store"]
+            for key, blob in audio_store.blobs.items():
+                self._audio_manifest[audio_store.blob_path(key)] = blob["size"]
+            self._audio_store = audio_store
+            
+            # Models of entries whose related entries changed are rebuilt on demand
+            previous, self._related = self._related, diff["related"]
+            self._related_by = self._invert_related(self._related)
+            for word_id in set(previous) | set(self._related):
+                if previous.get(word_id) != self._related.get(word_id):
+                    self._model_cache.pop(word_id, None)
+            
+            # A script saving the data file resets the log under a new version
+            self.tombstones_since = max(self.tombstones_since, diff["log"]["tombstones_since"])
+            if updates or removed:
+                version = max(self.version, diff["log"]["version"]) + 1
+                self.changelog.append_reload(version, removed)
+                self._apply_puts(updates, version)
+                self._apply_deletes(removed, version)
+                self.version = version
+            # Entries written since the diff get hashed by the next reload
+            self._entry_hashes = {
+                word_id: entry_hash for word_id, entry_hash in diff["hashes"].items() if word_id not in written
+            }
+            
+            apply_seconds = time.perf_counter() - start
+            return {
+                "version": self.version,
+                "added": added,
+                "changed": changed,
+                "removed": len(removed),
+                "unchanged": diff["unchanged"],
+                "skipped": len(written & (set(diff["entries"]) | set(diff["removed"]))),
+                "diff_seconds": round(diff["seconds"], 4),
+                "apply_seconds": round(apply_seconds, 4),
+            }
+    
+    def reload(self) -> Dict:
+        """Reload the data file, patching only the entries that changed.
+        
+        Returns:
+            Reload report with counts and timings
+        """
+        return self.apply_diff(self.diff_snapshot())
     
     def _load_data(self) -> Dict:
         """Load word data from JSON file.
@@ -40,17 +363,15 @@ class DictionaryService:
         Returns:
             List of Word objects
         """
-        words = []
-        word_list = list(self.word_data.values())[skip:skip+limit]
-        
-        for word_entry in word_list:
-            words.append(self._convert_to_word_model(word_entry))
-        
-        return words
+        words = (self._get_model(word_id) for word_id in self._ids[skip:skip+limit])
+        return [word for word in words if word is not None]
     
     def search_word(self, keyword: str) -> List[Word]:
         """Search for words containing the keyword.
         
+        Matches the keyword against the word, its definition and the
+        example translation.
+        
         Args:
             keyword: Keyword to search for
             
@@ -60,20 +381,11 @@ class DictionaryService:
         results = []
         keyword_lower = keyword.lower()
         
-        for word_id, word_entry in self.word_data.items():
-            # Search in word
-            if keyword_lower in word_entry[0].lower():
-                results.append(self._convert_to_word_model(word_entry))
-                continue
-                
-            # Search in definition
-            if len(word_entry) >= 5 and keyword_lower in word_entry[4].lower():
-                results.append(self._convert_to_word_model(word_entry))
-                continue
-                
-            # Search in example translation
-            if len(word_entry) >= 8 and keyword_lower in word_entry[7].lower():
-                results.append(self._convert_to_word_model(word_entry))
+        for word_id, word, definition, translation in self._search_index:
+            if keyword_lower in word or keyword_lower in definition or keyword_lower in translation:
+                model = self._get_model(word_id)
+                if model is not None:
+                    results.append(model)
         
         return results
     
@@ -86,9 +398,194 @@ class DictionaryService:
         Returns:
             Word object if found, None otherwise
         """
-        if word_id in self.word_data:
-            return self._convert_to_word_model(self.word_data[word_id])
-        return None
+        return self._get_model(word_id)
+    
+    def get_entry_version(self, word_id: str) -> int:
+        """Get the version at which an entry last changed.
+        
+        Args:
+            word_id: ID of the word
+            
+        Returns:
+            Version number of the entry
+        """
+        return self._entry_versions.get(word_id, self.base_version)
+    
+    def iter_entries(self, since_version: int = 0) -> Iterator[Tuple[str, int, Optional[Word]]]:
+        """Iterate over entries changed after a version, in dictionary order.
+        
+        The iteration walks the ID list captured when it starts, so it
+        isn't affected by entries being added while it runs; entries
+        deleted while it runs are skipped. When since_version is set,
+        entries deleted after it follow with a Word of None.
+        
+        Args:
+            since_version: Only yield entries whose version is greater than this
+            
+        Yields:
+            Tuples of (word ID, entry version, Word model or None if deleted)
+        """
+        ids = self._ids
+        for word_id in ids:
+            version = self.get_entry_version(word_id)
+            if version <= since_version:
+                continue
+            # Looked up in one step: a delete between a membership check
+            # and the conversion would otherwise raise mid-stream
+            word = self._get_model(word_id)
+            if word is not None:
+                yield word_id, version, word
+        
+        if since_version:
+            for word_id, version in list(self._deleted.items()):
+                if version > since_version:
+                    yield word_id, version, None
+    
+    def put_entry(self, word_id: str, word_entry: List) -> int:
+        """Create or replace an entry.
+        
+        The change is fsync'd to the change log before the in-memory
+        structures are patched, so the cost doesn't grow with the dictionary.
+        
+        Args:
+            word_id: ID of the word
+            word_entry: List containing word data
+            
+        Returns:
+            Version created by the change
+        """
+        with self._write_lock:
+            version = self.version + 1
+            self.changelog.append(version, OP_PUT, word_id, word_entry)
+            self._apply_puts([(word_id, word_entry)], version)
+            self.version = version
+        return version
+    
+    def delete_entry(self, word_id: str) -> Optional[int]:
+        """Delete an entry.
+        
+        Args:
+            word_id: ID of the word
+            
+        Returns:
+            Version created by the change, or None if the word doesn't exist
+        """
+        with self._write_lock:
+            if word_id not in self.word_data:
+                return None
+            version = self.version + 1
+            self.changelog.append(version, OP_DELETE, word_id)
+            self._apply_deletes([word_id], version)
+            self.version = version
+        return version
+    
+    def compact(self) -> Dict:
+        """Write the current data to the data file and empty the change log.
+        
+        Deletions of the last TOMBSTONE_RETENTION versions stay in the log,
+        so incremental exports since those versions still include them.
+        
+        Returns:
+            Dict with the compacted version, entry count and log size before compaction
+        """
+        with self._write_lock:
+            log_bytes = self.changelog.size()
+            write_json_atomic(self.word_data, self.data_file)
+            self.tombstones_since = self.changelog.reset(self.version, self._deleted, self.tombstones_since)
+            self._deleted = {
+                word_id: version for word_id, version in self._deleted.items() if version > self.tombstones_since
+            }
+            return {"version": self.version, "entries": len(self.word_data), "log_bytes": log_bytes}
+    
+    def _apply_puts(self, updates: List[Tuple[str, List]], version: int):
+        """Patch every derived structure for created or replaced entries in one pass."""
+        added_ids = []
+        added_entries = []
+        added_fields = []
+        for word_id, word_entry in updates:
+            fields = (word_id,) + self._search_fields(word_entry)
+            position = self._positions.get(word_id)
+            if position is None:
+                self._positions[word_id] = len(self._ids) + len(added_ids)
+                added_ids.append(word_id)
+                added_entries.append(word_entry)
+                added_fields.append(fields)
+            else:
+                self._entries[position] = word_entry
+                self._search_index[position] = fields
+            self.word_data[word_id] = word_entry
+            self._model_cache[word_id] = self._convert_to_word_model(word_entry, word_id)
+            if position is None:
+                # Rebuilt with the (re)created entry in their related entries
+                for related_id in self._related_by.get(word_id, ()):
+                    self._model_cache.pop(related_id, None)
+            self._entry_versions[word_id] = version
+            self._entry_hashes.pop(word_id, None)
+            self._deleted.pop(word_id, None)
+            # The audio may have been regenerated along with the entry
+            self._update_audio_manifest(word_entry)
+        # New entries are appended with one copy of each list
+        if added_ids:
+            self._ids = self._ids + added_ids
+            self._entries = self._entries + added_entries
+            self._search_index = self._search_index + added_fields
+    
+    def _apply_deletes(self, word_ids: List[str], version: int):
+        """Patch every derived structure for deleted entries in one pass."""
+        if not word_ids:
+            return
+        positions = {self._positions.pop(word_id) for word_id in word_ids}
+        first = min(positions)
+        keep = [i for i in range(len(self._ids)) if i not in positions]
+        self._ids = [self._ids[i] for i in keep]
+        self._entries = [self._entries[i] for i in keep]
+        self._search_index = [self._search_index[i] for i in keep]
+        for i in range(first, len(self._ids)):
+            self._positions[self._ids[i]] = i
+        for word_id in word_ids:
+            word_entry = self.word_data.pop(word_id)
+            self._model_cache.pop(word_id, None)
+            # Rebuilt without the deleted entry in their related entries
+            for related_id in self._related_by.get(word_id, ()):
+                self._model_cache.pop(related_id, None)
+            self._entry_versions.pop(word_id, None)
+            self._entry_hashes.pop(word_id, None)
+            self._deleted[word_id] = version
+            self._update_audio_manifest(word_entry)
+    
+    def _update_audio_manifest(self, word_entry: List):
+        """Refresh the manifest records of the audio files an entry references."""
+        for field in AUDIO_FIELDS.values():
+            audio_path = word_entry[field] if len(word_entry) > field else ""
+            if not audio_path:
+                continue
+            try:
+                self._audio_manifest[audio_path] = os.path.getsize(audio_path)
+            except OSError:
+                self._audio_manifest.pop(audio_path, None)
+    
+    def resolve_audio(self, word_id: str, kind: str) -> Optional[str]:
+        """Get the path of an entry's audio file.
+        
+        The audio store is used if its manifest has a blob for the entry's
+        current text; otherwise the path in the entry is used.
+        
+        Args:
+            word_id: ID of the word
+            kind: "word" or "example"
+            
+        Returns:
+            Path of the audio file, or None if the entry has no audio of that kind
+        """
+        word_entry = self.word_data.get(word_id)
+        if word_entry is None:
+            return None
+        if self._audio_store is not None:
+            blob_path = self._audio_store.resolve(word_id, kind, self._audio_text(word_entry, kind))
+            if blob_path:
+                return blob_path
+        field = AUDIO_FIELDS[kind]
+        return (word_entry[field] if len(word_entry) > field else "") or None
     
     def get_audio_file(self, audio_path: str) -> Optional[FileResponse]:
         """Get an audio file by its path.
@@ -99,20 +596,114 @@ class DictionaryService:
         Returns:
             FileResponse if found, None otherwise
         """
-        if not audio_path or not os.path.exists(audio_path):
+        if not audio_path or audio_path not in self._audio_manifest:
+            return None
+        # The manifest may be stale, e.g. after blobs were cleaned up
+        if not os.path.isfile(audio_path):
             return None
         
+        self.stats["audio_files_served"] += 1
+        self.stats["audio_bytes_served"] += self._audio_manifest[audio_path]
+        
         return FileResponse(
             path=audio_path,
             media_type="audio/mpeg",
             filename=os.path.basename(audio_path)
         )
     
-    def _convert_to_word_model(self, word_entry: List) -> Word:
+    def _get_model(self, word_id: str) -> Optional[Word]:
+        """Get the Word model for an ID, converting it if it isn't cached.
+        
+        Args:
+            word_id: ID of the word
+            
+        Returns:
+            Word model, or None if the word isn't in the data
+        """
+        word = self._model_cache.get(word_id)
+        if word is None:
+            word_entry = self.word_data.get(word_id)
+            if word_entry is None:
+                return None
+            self.stats["model_cache_misses"] += 1
+            word = self._convert_to_word_model(word_entry, word_id)
+            self._model_cache[word_id] = word
+            # A write may have replaced or removed the entry during the
+            # conversion; writers update word_data before the cache, so
+            # checking after storing never leaves a stale model behind
+            if self.word_data.get(word_id) is not word_entry:
+                self._model_cache.pop(word_id, None)
+        else:
+            self.stats["model_cache_hits"] += 1
+        return word
+    
+    @staticmethod
+    def _search_fields(word_entry: List) -> Tuple[str, str, str]:
+        """Get the lowercased (word, definition, example translation) of an entry.
+        
+        Args:
+            word_entry: List containing word data
+            
+        Returns:
+            Tuple of lowercased searchable fields
+        """
+        word = word_entry[0].lower()
+        definition = word_entry[4].lower() if len(word_entry) >= 5 else ""
+        translation = word_entry[7].lower() if len(word_entry) >= 8 else ""
+        return word, definition, translation
+    
+    @staticmethod
+    def _invert_related(related: Dict[str, List[Dict]]) -> Dict[str, List[str]]:
+        """Map each entry to the entries listing it as related."""
+        related_by: Dict[str, List[str]] = {}
+        for word_id, entries in related.items():
+            for entry in entries:
+                related_by.setdefault(entry["id"], []).append(word_id)
+        return related_by
+    
+    @staticmethod
+    def _audio_text(word_entry: List, kind: str) -> str:
+        """Get the text spoken in an entry's audio of one kind."""
+        if kind == "word":
+            return word_entry[0]
+        return word_entry[5] if len(word_entry) > 5 else ""
+    
+    @staticmethod
+    def _entry_hash(word_entry: List) -> str:
+        """Get a hash of the content of an entry."""
+        content = json.dumps(word_entry, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def convert_to_entry(word: Word) -> List:
+        """Convert a Word model to a word entry as stored in the JSON data.
+        
+        Args:
+            word: Word model with exactly one definition
+            
+        Returns:
+            List containing word data
+        """
+        definition = word.definitions[0]
+        return [
+            word.word,
+            word.ipa or "",
+            word.romanization or "",
+            definition.pos,
+            definition.definition,
+            word.example or "",
+            word.example_romanization or "",
+            word.example_translation or "",
+            word.example_audio or "",
+            word.word_audio or ""
+        ]
+    
+    def _convert_to_word_model(self, word_entry: List, word_id: Optional[str] = None) -> Word:
         """Convert a word entry from the JSON data to a Word model.
         
         Args:
             word_entry: List containing word data
+            word_id: ID of the entry, to add its related entries
             
         Returns:
             Word model
@@ -137,6 +728,11 @@ class DictionaryService:
         # Create WordDefinition object
         word_def = WordDefinition(pos=pos, definition=definition)
         
+        # Related entries that still exist
+        related = [
+            RelatedWord(**entry) for entry in self._related.get(word_id, ()) if entry["id"] in self.word_data
+        ] if word_id is not None else []
+        
         return Word(
             word=word,
             ipa=ipa,
@@ -146,5 +742,6 @@ class DictionaryService:
             example_romanization=example_romanization,
             example_translation=example_translation,
             example_audio=example_audio,
-            word_audio=word_audio
+            word_audio=word_audio,
+            related=related
         )
@@ -0,0 +1,170 @@
+import cProfile
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+from ..config import PROFILING_DIR
+
+# Number of recent profile files listed by the admin endpoint
+RECENT_FILES = 50
+
+
+def _frame_label(code) -> str:
+    """Format a code object as a stack frame label."""
+    return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Samples the call stack of one thread at a fixed interval.
+    
+    Unlike cProfile this adds no per-call overhead to the profiled thread,
+    at the cost of only seeing where time is spent statistically.
+    """
+    
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        """Initialize the sampler.
+        
+        Args:
+            thread_id: Identifier of the thread to sample
+            interval: Seconds between samples
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()  # Collapsed stack -> number of samples
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        """Start sampling in a background thread."""
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop sampling and wait for the sampler thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+    
+    def collapsed(self) -> str:
+        """Get the samples in the collapsed-stack format used by flame graph tools."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+
+class ProfileStore:
+    """Writes per-request profiles to disk and aggregates their top functions."""
+    
+    def __init__(self, directory: str):
+        """Initialize the store.
+        
+        Args:
+            directory: Directory where profile files are written
+        """
+        self.directory = Path(directory)
+        self.profiled_requests = 0
+        self.files: List[str] = []
+        # Function label -> {"calls", "self_seconds", "cumulative_seconds"}
+        self.functions: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+    
+    def add_cprofile(self, profiler: cProfile.Profile, name: str) -> str:
+        """Save a cProfile run as a pstats file and add it to the aggregate.
+        
+        Args:
+            profiler: Profiler that has been disabled
+            name: Short description of the profiled request
+            
+        Returns:
+            Path of the written pstats file
+        """
+        path = self._path(name, "pstats")
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(str(path))
+        with self._lock:
+            for (filename, line, func), (_, calls, tottime, cumtime, _) in stats.stats.items():
+                self._add(f"{func} ({filename}:{line})", calls, tottime, cumtime)
+            self._record(path)
+        return str(path)
+    
+    def add_samples(self, sampler: StackSampler, name: str) -> str:
+        """Save sampled stacks as a collapsed-stack file and add them to the aggregate.
+        
+        Args:
+            sampler: Sampler that has been stopped
+            name: Short description of the profiled request
+            
+        Returns:
+            Path of the written collapsed-stack file
+        """
+        path = self._path(name, "collapsed")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(sampler.collapsed())
+        with self._lock:
+            for stack, count in sampler.stacks.items():
+                frames = stack.split(";")
+                seconds = count * sampler.interval
+                self._add(frames[-1], 0, seconds, 0)
+                for label in set(frames):
+                    self._add(label, 0, 0, seconds)
+            self._record(path)
+        return str(path)
+    
+    def top_functions(self, limit: int = 25, sort: str = "cumulative_seconds") -> List[Dict]:
+        """Get the functions with the most time across every profiled request.
+        
+        Args:
+            limit: Maximum number of functions to return
+            sort: Field to sort by ("calls", "self_seconds" or "cumulative_seconds")
+            
+        Returns:
+            List of dicts describing each function
+        """
+        with self._lock:
+            rows = [dict(function=label, **values) for label, values in self.functions.items()]
+        rows.sort(key=lambda row: row.get(sort, 0), reverse=True)
+        for row in rows:
+            row["self_seconds"] = round(row["self_seconds"], 6)
+            row["cumulative_seconds"] = round(row["cumulative_seconds"], 6)
+        return rows[:limit]
+    
+    def reset(self):
+        """Forget the aggregated functions; files on disk are kept."""
+        with self._lock:
+            self.profiled_requests = 0
+            self.files = []
+            self.functions = {}
+    
+    def _add(self, label: str, calls: int, self_seconds: float, cumulative_seconds: float):
+        values = self.functions.setdefault(
+            label, {"calls": 0, "self_seconds": 0.0, "cumulative_seconds": 0.0}
+        )
+        values["calls"] += calls
+        values["self_seconds"] += self_seconds
+        values["cumulative_seconds"] += cumulative_seconds
+    
+    def _record(self, path: Path):
+        self.profiled_requests += 1
+        self.files.append(str(path))
+        del self.files[:-RECENT_FILES]
+    
+    def _path(self, name: str, extension: str) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-") or "root"
+        return self.directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{time.perf_counter_ns() % 1000000:06d}-{slug}.{extension}"
+
+
+# Shared store for the application process
+profile_store = ProfileStore(PROFILING_DIR)
@@ -0,0 +1,137 @@
+import threading
+import time
+from typing import Dict, Optional
+from .dictionary import DictionaryService
+
+
+class ComponentProgress:
+    """Build progress of a single dictionary component."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.state = "pending"  # pending, building, ready or failed
+        self.done = 0
+        self.total = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.error: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """Get the progress as a JSON-serializable dict."""
+        if self.started_at is None:
+            elapsed = None
+        else:
+            elapsed = round((self.finished_at or time.time()) - self.started_at, 3)
+        return {
+            "state": self.state,
+            "done": self.done,
+            "total": self.total,
+            "progress": round(self.done / self.total, 3) if self.total else float(self.state == "ready"),
+            "elapsed_seconds": elapsed,
+            "error": self.error,
+        }
+
+
+class WarmupTracker:
+    """Tracks background loading of the shared dictionary service."""
+    
+    def __init__(self):
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._service: Optional[DictionaryService] = None
+        self.components = {name: ComponentProgress(name) for name in DictionaryService.COMPONENTS}
+    
+    @property
+    def ready(self) -> bool:
+        """Whether every component has been built."""
+        return self._finished.is_set() and self._service is not None
+    
+    @property
+    def service(self) -> Optional[DictionaryService]:
+        """The shared dictionary service, or None until it is ready."""
+        return self._service
+    
+    def start(self, data_file: str) -> threading.Thread:
+        """Start loading the dictionary in a background thread.
+        
+        Calling this again while a warmup is running or finished is a no-op.
+        
+        Args:
+            data_file: Path to the JSON data file
+            
+        Returns:
+            The warmup thread
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, args=(data_file,), name="dictionary-warmup", daemon=True
+                )
+                self._thread.start()
+            return self._thread
+    
+    def get_service(self, data_file: str, timeout: Optional[float] = None) -> DictionaryService:
+        """Get the shared dictionary service, waiting for the warmup if needed.
+        
+        Starts the warmup if it hasn't been started yet.
+        
+        Args:
+            data_file: Path to the JSON data file
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            The warmed dictionary service
+        """
+        if not self._finished.is_set():
+            self.start(data_file)
+            if not self._finished.wait(timeout):
+                raise TimeoutError("Dictionary warmup did not finish in time")
+        if self._service is None:
+            failed = [c for c in self.components.values() if c.state == "failed"]
+            raise RuntimeError(f"Dictionary warmup failed: {failed[0].error if failed else 'unknown error'}")
+        return self._service
+    
+    def status(self) -> Dict:
+        """Get the warmup status of every component."""
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "uptime_seconds": round(time.time() - self.started_at, 3),
+                "components": {name: c.to_dict() for name, c in self.components.items()},
+            }
+    
+    def _progress(self, component: str, done: int, total: int):
+        """Record progress reported by the dictionary service."""
+        with self._lock:
+            progress = self.components[component]
+            if progress.started_at is None:
+                progress.started_at = time.time()
+                progress.state = "building"
+            progress.done = done
+            progress.total = total
+            if done >= total:
+                progress.state = "ready"
+                progress.finished_at = time.time()
+    
+    def _run(self, data_file: str):
+        """Build the dictionary service and publish it once it is ready."""
+        service = DictionaryService(data_file, lazy=True)
+        try:
+            service.warm(self._progress)
+        except Exception as e:
+            with self._lock:
+                for progress in self.components.values():
+                    if progress.state != "ready":
+                        progress.state = "failed"
+                        progress.error = str(e)
+            print(f"Error warming dictionary from '{data_file}': {e}")
+        else:
+            self._service = service
+        finally:
+            self._finished.set()
+
+
+# Shared tracker for the application process
+tracker = WarmupTracker()
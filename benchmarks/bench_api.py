@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+In-process benchmark for the API routes.
+
+Requests are sent straight to the ASGI app, without a server or sockets,
+so the numbers measure routing, the dictionary service and response
+serialization only. Results are written as JSON and can be compared with
+a previous run to catch regressions.
+
+Examples:
+    python -m benchmarks.bench_api
+    python -m benchmarks.bench_api --scales 1 10 100 --output benchmarks/results/latest.json
+    python -m benchmarks.bench_api --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+# Constants
+DEFAULT_DATA_FILE = "data/gujarati_words_google_enhanced.json"
+RESULTS_DIR = "benchmarks/results"
+DEFAULT_REQUESTS = 200  # Requests per scenario
+WARMUP_REQUESTS = 10  # Untimed requests per scenario
+REGRESSION_THRESHOLD = 0.2  # Relative p95 increase reported as a regression
+
+
+class ASGIClient:
+    """Minimal client that calls an ASGI app directly."""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def get(self, path: str, params: Optional[Dict] = None) -> Tuple[int, int]:
+        """Send a GET request.
+        
+        Args:
+            path: Request path
+            params: Optional query parameters
+            
+        Returns:
+            Tuple of (status code, response body size in bytes)
+        """
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": urlencode(params or {}).encode(),
+            "root_path": "",
+            "headers": [(b"host", b"benchmark")],
+            "client": ("127.0.0.1", 0),
+            "server": ("benchmark", 80),
+        }
+        status = 0
+        size = 0
+        request_sent = False
+        disconnected = asyncio.Event()
+        
+        async def receive():
+            # Send the (empty) body once, then block like a client that
+            # stays connected until the response is complete
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+        
+        async def send(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+        
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            disconnected.set()
+        return status, size
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Get a percentile from sorted values using linear interpolation."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def build_scenarios(word_ids: List[str], rng: random.Random) -> Dict[str, List[Tuple[str, Dict]]]:
+    """Build the request list of every scenario.
+    
+    Args:
+        word_ids: IDs present in the loaded data, in order
+        rng: Random source used to pick IDs
+        
+    Returns:
+        Dict mapping scenario name to a list of (path, params) requests
+    """
+    total = len(word_ids)
+    sample = [rng.choice(word_ids) for _ in range(64)]
+    return {
+        "list_first_page": [("/api/v1/words", {"skip": 0, "limit": 25})],
+        "list_middle_page": [("/api/v1/words", {"skip": total // 2, "limit": 25})],
+        "list_last_page": [("/api/v1/words", {"skip": max(total - 25, 0), "limit": 25})],
+        "get_by_id": [(f"/api/v1/words/{word_id}", {}) for word_id in sample],
+        "search_short": [("/api/v1/words/search", {"keyword": "an"})],
+        "search_long": [("/api/v1/words/search", {"keyword": "neither opened nor broken"})],
+        "search_absent": [("/api/v1/words/search", {"keyword": "zqxjv"})],
+        "audio_word": [(f"/api/v1/audio/word/{word_id}", {}) for word_id in sample],
+        "audio_example": [(f"/api/v1/audio/example/{word_id}", {}) for word_id in sample],
+    }
+
+
+async def run_scenario(client: ASGIClient, requests: List[Tuple[str, Dict]], count: int, concurrency: int) -> Dict:
+    """Send `count` requests cycling through `requests` and collect statistics."""
+    for i in range(min(WARMUP_REQUESTS, count)):
+        path, params = requests[i % len(requests)]
+        await client.get(path, params)
+    
+    latencies = []
+    statuses: Dict[str, int] = {}
+    total_bytes = 0
+    queue = list(range(count))
+    
+    async def worker():
+        nonlocal total_bytes
+        while queue:
+            i = queue.pop()
+            path, params = requests[i % len(requests)]
+            start = time.perf_counter()
+            status, size = await client.get(path, params)
+            latencies.append(time.perf_counter() - start)
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+            total_bytes += size
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    
+    latencies.sort()
+    return {
+        "requests": count,
+        "concurrency": concurrency,
+        "throughput_rps": round(count / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(statistics.mean(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+        "mean_response_bytes": round(total_bytes / count),
+        "statuses": statuses,
+    }
+
+
+async def run_benchmark(data_file: str, count: int, concurrency: int, only: Optional[List[str]], seed: int) -> Dict:
+    """Benchmark every route against one data file.
+    
+    The app is imported here so the data file can be chosen through the
+    environment before its configuration is read.
+    """
+    os.environ["GUJARATI_API_DATA_FILE"] = data_file
+    os.environ["GUJARATI_API_WARMUP"] = "1"
+    from main import app
+    from app.services.warmup import tracker
+    
+    client = ASGIClient(app)
+    results = {}
+    async with app.router.lifespan_context(app):
+        start = time.perf_counter()
+        service = await asyncio.get_running_loop().run_in_executor(None, tracker.get_service, data_file)
+        warmup_seconds = time.perf_counter() - start
+        
+        scenarios = build_scenarios(list(service.word_data), random.Random(seed))
+        for name, requests in scenarios.items():
+            if only and name not in only:
+                continue
+            results[name] = await run_scenario(client, requests, count, concurrency)
+            print(
+                f"  {name:<18} {results[name]['throughput_rps']:>10.1f} req/s"
+                f"  p50 {results[name]['p50_ms']:>8.2f} ms"
+                f"  p95 {results[name]['p95_ms']:>8.2f} ms"
+                f"  p99 {results[name]['p99_ms']:>8.2f} ms"
+            )
+    
+    return {
+        "data_file": data_file,
+        "entries": len(service.word_data),
+        "warmup_seconds": round(warmup_seconds, 3),
+        "scenarios": results,
+    }
+
+
+def git_commit() -> str:
+    """Get the current git commit, or an empty string outside a checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Compare two result files and describe p95 regressions.
+    
+    Args:
+        current: Results of this run
+        baseline: Results of a previous run
+        threshold: Relative p95 increase treated as a regression
+        
+    Returns:
+        List of regression descriptions (empty if none)
+    """
+    regressions = []
+    for label, run in current["runs"].items():
+        base_run = baseline.get("runs", {}).get(label)
+        if not base_run:
+            continue
+        for name, stats in run["scenarios"].items():
+            base = base_run["scenarios"].get(name)
+            if not base or not base["p95_ms"]:
+                continue
+            change = (stats["p95_ms"] - base["p95_ms"]) / base["p95_ms"]
+            marker = "REGRESSION" if change > threshold else ""
+            print(f"  {label:<6} {name:<18} p95 {base['p95_ms']:>8.2f} -> {stats['p95_ms']:>8.2f} ms ({change:+.0%}) {marker}")
+            if change > threshold:
+                regressions.append(f"{label}/{name}: p95 {base['p95_ms']} -> {stats['p95_ms']} ms ({change:+.0%})")
+    return regressions
+
+
+def main():
+    """Main function to run the API benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the API routes in-process")
+    parser.add_argument("--data", default=DEFAULT_DATA_FILE, help="Data file to serve (ignored with --scales)")
+    parser.add_argument("--scales", type=int, nargs="+", help="Benchmark synthetic lexicons at these scale factors (1 = real data)")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent in-flight requests")
+    parser.add_argument("--scenario", action="append", help="Only run this scenario (repeatable)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", help=f"Write results to this JSON file (default: {RESULTS_DIR}/<timestamp>.json)")
+    parser.add_argument("--compare", help="Compare with a previous results file")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="Relative p95 increase treated as a regression")
+    parser.add_argument("--single-run", metavar="RESULT_FILE", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    # Each data file is benchmarked in its own process since the app keeps
+    # one dictionary per process
+    if args.single_run:
+        result = asyncio.run(run_benchmark(args.data, args.requests, args.concurrency, args.scenario, args.seed))
+        with open(args.single_run, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        return
+    
+    from benchmarks.generate_lexicon import generate_lexicon, output_path
+    
+    data_files = {}
+    if args.scales:
+        for scale in args.scales:
+            if scale == 1:
+                data_files["x1"] = DEFAULT_DATA_FILE
+                continue
+            path = output_path(scale)
+            if not path.exists():
+                print(f"Generating {path}...")
+                with open(DEFAULT_DATA_FILE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(generate_lexicon(data, scale, args.seed), f, ensure_ascii=False)
+            data_files[f"x{scale}"] = str(path)
+    else:
+        data_files["x1"] = args.data
+    
+    runs = {}
+    result_file = Path(tempfile.mkdtemp()) / "run.json"
+    for label, data_file in data_files.items():
+        print(f"\nBenchmarking {label} ({data_file})")
+        command = [
+            sys.executable, "-m", "benchmarks.bench_api",
+            "--single-run", str(result_file),
+            "--data", data_file,
+            "--requests", str(args.requests),
+            "--concurrency", str(args.concurrency),
+            "--seed", str(args.seed),
+        ]
+        for name in args.scenario or []:
+            command.extend(["--scenario", name])
+        completed = subprocess.run(command)
+        if completed.returncode != 0:
+            sys.exit(completed.returncode)
+        with open(result_file, 'r', encoding='utf-8') as f:
+            runs[label] = json.load(f)
+    shutil.rmtree(result_file.parent)
+    
+    results = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "requests_per_scenario": args.requests,
+        "concurrency": args.concurrency,
+        "runs": runs,
+    }
+    
+    output = Path(args.output or f"{RESULTS_DIR}/{time.strftime('%Y%m%d-%H%M%S')}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\nResults saved to {output}")
+    
+    if args.compare:
+        print(f"\nComparing with {args.compare}")
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Offline throughput benchmark for the enrichment pipelines.
+
+Each pipeline runs over entries of its real input file with the local
+fakes of benchmarks.fakes in place of the translation, text-to-speech,
+search and LLM APIs, so nothing is sent over the network or billed. The
+fakes are passed to the scripts' own entry points (enhance() and
+fix_and_save()), so their concurrency, rate limiting, caching and
+journaling are what is measured; outputs, the cache and audio files go to
+a temporary directory. Fake responses are taken from the enhanced data, so
+the pipelines parse realistic replies. Reports completed entries per
+second, failed entries, provider calls and retries,
+and the wall time of each stage; results are written as JSON and can be
+compared with a previous run to catch regressions.
+
+Examples:
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --pipeline google --limit 0 --latency tts=0.8
+    python -m benchmarks.bench_pipeline --error-rate 0.05 --rate-limit-rate 0.02 --quota translate=4
+    python -m benchmarks.bench_pipeline --compare benchmarks/results/pipeline-baseline.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from benchmarks.bench_api import RESULTS_DIR, git_commit
+from benchmarks.fakes import FakeAnthropic, FakeGenAIClient, FakeProvider, FakeTavily, FakeTranslator, FakeTTS
+from pipeline.cache import ResultCache
+from pipeline.transliteration import VIRAMA, transliterate
+from pipeline.validate import CLUSTER_RE, check_gujarati
+
+# Constants
+DATA_FILE = "data/gujarati_words_google_enhanced.json"  # Enhanced data the fake responses are taken from
+PIPELINES = ["google", "words", "fix"]
+DEFAULT_LIMIT = 100  # Entries per pipeline; 0 for all
+PROVIDERS = ["translate", "tts", "anthropic", "tavily", "gemini"]
+DEFAULT_LATENCY = {"translate": 0.1, "tts": 0.3, "anthropic": 1.5, "tavily": 0.5, "gemini": 2.0}  # Seconds per call
+DEFAULT_QUOTA = {"translate": 10, "tts": 5, "anthropic": 1, "tavily": 2, "gemini": 4}  # Calls per second
+DEFAULT_ERROR_RATE = 0.01
+DEFAULT_MALFORMED_RATE = 0.02
+REGRESSION_THRESHOLD = 0.2  # Relative drop in entries per second reported as a regression
+FAILURE_THRESHOLD = 0.02  # Rise in the fraction of failed entries reported as a regression
+FALLBACK_WORD = "શબ્દ"  # Fake Gemini fix for words with nothing left to fix
+
+
+class Stages:
+    """Wall time spent in each stage of a pipeline run."""
+    
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+    
+    @contextlib.contextmanager
+    def time(self, name: str):
+        """Add the time spent in the block to a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - start
+    
+    def add(self, seconds: Dict[str, float]):
+        """Add the stage times reported by a pipeline."""
+        for name, value in seconds.items():
+            self.seconds[name] = self.seconds.get(name, 0.0) + value
+    
+    def total(self) -> float:
+        """Get the time spent in all stages."""
+        return sum(self.seconds.values())
+
+
+class Reference:
+    """Fake API responses taken from the enhanced data."""
+    
+    def __init__(self, data: Dict[str, List]):
+        """Index the enhanced data by headword and example.
+        
+        Args:
+            data: Word ID -> enhanced entry
+        """
+        self.entries: Dict[str, List] = {}
+        self.translations: Dict[str, str] = {}
+        for entry in data.values():
+            self.entries.setdefault(entry[0], entry)
+            if len(entry) > 7 and entry[5] and entry[7]:
+                self.translations.setdefault(entry[5], entry[7])
+    
+    def translate(self, text: str, src: str, dest: str) -> str:
+        """Translate an example the way the enhanced data did."""
+        return self.translations.get(text, f"[{dest}] {text}")
+    
+    def claude_reply(self, prompt: str) -> str:
+        """Answer the prompt of enhance_gujarati_words.process_word_with_llm."""
+        match = re.search(r"Word: (.*)", prompt)
+        entry = self.entries.get(match.group(1).strip()) if match else None
+        if entry is None:
+            return "IPA: \nPHONETIC: \nDEFINITION: \nEXAMPLE: "
+        return f"IPA: {entry[1]}\nPHONETIC: {entry[2]}\nDEFINITION: {entry[4]}\nEXAMPLE: {entry[5]}"
+    
+    def search_results(self, query: str) -> List[Dict]:
+        """Answer the example search of enhance_gujarati_words.search_for_example."""
+        word = query.rsplit(" ", 1)[-1]
+        entry = self.entries.get(word)
+        if entry is None or len(entry) < 6 or not entry[5]:
+            return []
+        return [{"title": word, "url": f"https://example.org/gu/{word}", "content": entry[5]}]
+    
+    def gemini_reply(self, prompt: str) -> str:
+        """Answer the single-entry and batch prompts of fix_gujarati_spelling."""
+        if "Entries:\n" in prompt:
+            entries, _ = json.JSONDecoder().raw_decode(prompt, prompt.index("Entries:\n") + len("Entries:\n"))
+            return json.dumps([dict(self._fix(item["word"], item["ipa"]), id=item["id"]) for item in entries],
+                              ensure_ascii=False)
+        word = re.search(r'The word "(.*?)" appears', prompt)
+        ipa = re.search(r"- Current IPA pronunciation: (.*)", prompt)
+        return json.dumps(self._fix(word.group(1) if word else "", ipa.group(1) if ipa else ""), ensure_ascii=False)
+    
+    @staticmethod
+    def _fix(word: str, ipa: str) -> Dict[str, str]:
+        """Fix a malformed word by dropping what isn't part of a grapheme cluster."""
+        kept = "".join(match.group() for match in CLUSTER_RE.finditer(word) if match.lastgroup in ("cluster", "vowel"))
+        fixed = kept.rstrip(VIRAMA)
+        if not fixed or check_gujarati(fixed):
+            fixed = FALLBACK_WORD
+        romanization = transliterate(fixed)
+        return {"gujarati": fixed, "ipa": ipa or f"[{romanization}]", "romanization": romanization}
+
+
+def load_json(file_path: str) -> Dict:
+    """Load a JSON file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def limit_items(items: List, limit: int) -> List:
+    """Get the first `limit` items, or all of them for 0."""
+    return items[:limit] if limit else items
+
+
+def bench_google(args: argparse.Namespace, reference: Reference, workdir: str) -> Dict:
+    """Run enhance_gujarati_with_google's translation and text-to-speech stages."""
+    import enhance_gujarati_with_google as google
+    
+    stages = Stages()
+    with stages.time("load"):
+        data = load_json(google.INPUT_FILE)
+        items = limit_items(list(data.items()), args.limit)
+    
+    translator = create_provider(FakeTranslator, "translate", args, translate=reference.translate)
+    tts = create_provider(FakeTTS, "tts", args)
+    cache = ResultCache(os.path.join(workdir, "cache.sqlite"))
+    
+    with quiet(args.verbose):
+        report = google.enhance(
+            items, translator, tts, os.path.join(workdir, "google.json"),
+            os.path.join(workdir, "audio", "manifest.json"), cache, progress=args.verbose
+        )
+    stages.add(report["seconds"])
+    cache.close()
+    
+    return summarize(report["pending"], report["incomplete"], stages, [translator, tts],
+                     {"translate": report["translate"], "tts": report["tts"]})
+
+
+def bench_words(args: argparse.Namespace, reference: Reference, workdir: str) -> Dict:
+    """Run enhance_gujarati_words' LLM clean-up with example search."""
+    import enhance_gujarati_words as words
+    
+    stages = Stages()
+    with stages.time("load"):
+        data = words.load_data(words.INPUT_FILE)
+        items = limit_items(list(data.items()), args.limit)
+    
+    anthropic_client = create_provider(FakeAnthropic, "anthropic", args, respond=reference.claude_reply)
+    tavily_client = create_provider(FakeTavily, "tavily", args, respond=reference.search_results)
+    cache = ResultCache(os.path.join(workdir, "cache.sqlite"))
+    delay = words.DELAY_BETWEEN_CALLS if args.words_delay is None else args.words_delay
+    
+    with quiet(args.verbose):
+        report = words.enhance(
+            items, anthropic_client, tavily_client, os.path.join(workdir, "words.json"), cache, delay,
+            progress=args.verbose
+        )
+    stages.add(report["seconds"])
+    cache.close()
+    
+    return summarize(report["pending"], report["incomplete"], stages, [anthropic_client, tavily_client], {})
+
+
+def bench_fix(args: argparse.Namespace, reference: Reference, workdir: str) -> Dict:
+    """Run fix_gujarati_spelling's batched Gemini fixes, saving progress as its main() does."""
+    import fix_gujarati_spelling as fix
+    
+    stages = Stages()
+    with stages.time("load"):
+        data = fix.load_data(fix.INPUT_FILE)
+    with stages.time("prepare"):
+        word_ids = limit_items(fix.find_problematic_entries(data), args.limit)
+    
+    client = create_provider(FakeGenAIClient, "gemini", args, respond=reference.gemini_reply)
+    cache = ResultCache(os.path.join(workdir, "cache.sqlite"))
+    
+    with quiet(args.verbose):
+        report = fix.fix_and_save(
+            client, data, word_ids, set(), fix.BATCH_SIZE, fix.CONCURRENCY, os.path.join(workdir, "fix.json"),
+            os.path.join(workdir, "fix_progress.json"), cache, progress=args.verbose
+        )
+    stages.add(report["seconds"])
+    cache.close()
+    
+    return summarize(len(word_ids), report["failed"], stages, [client], {"gemini": report["limiter"]})
+
+
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace, Reference, str], Dict]] = {
+    "google": bench_google,
+    "words": bench_words,
+    "fix": bench_fix,
+}
+
+
+def create_provider(cls, name: str, args: argparse.Namespace, **kwargs) -> FakeProvider:
+    """Create a fake provider with the latency and failure settings of the command line."""
+    return cls(
+        latency=args.latency[name] * args.latency_scale,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        quota=args.quota[name] or None,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed + PROVIDERS.index(name),
+        **kwargs
+    )
+
+
+@contextlib.contextmanager
+def quiet(verbose: bool):
+    """Hide what the pipeline prints to stdout and stderr, such as the injected errors, unless verbose."""
+    if verbose:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        yield
+
+
+def summarize(
+    entries: int,
+    failed: int,
+    stages: Stages,
+    providers: List[FakeProvider],
+    limiters: Dict[str, Dict]
+) -> Dict:
+    """Collect the results of a pipeline run.
+    
+    Throughput only counts the entries that completed, so a run doesn't get
+    faster by failing more entries.
+    """
+    total = stages.total()
+    completed = entries - failed
+    provider_stats = {provider.name: provider.stats() for provider in providers}
+    return {
+        "entries": entries,
+        "failed": failed,
+        "seconds": round(total, 3),
+        "entries_per_second": round(completed / total, 3) if total else 0.0,
+        "retries": sum(stats["retries"] for stats in provider_stats.values()),
+        "stages": {name: round(seconds, 3) for name, seconds in stages.seconds.items()},
+        "providers": provider_stats,
+        "limiters": limiters,
+    }
+
+
+def print_result(name: str, result: Dict):
+    """Print the results of a pipeline run."""
+    print(f"  {name:<7} {result['entries']:>6} entries in {result['seconds']:>8.2f}s"
+          f"  {result['entries_per_second']:>8.2f} completed/s  {result['retries']} retries, {result['failed']} failed")
+    print("          stages: " + ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in result["stages"].items()))
+    for provider, stats in result["providers"].items():
+        print(f"          {provider:<9} {stats['calls']:>6} calls  {stats['retries']} retries  {stats['errors']} errors"
+              f"  {stats['rate_limited']} rate limited  {stats['malformed']} malformed"
+              f"  busy {stats['busy_seconds']:.2f}s over {stats['active_seconds']:.2f}s")
+
+
+def failure_rate(result: Dict) -> float:
+    """Get the fraction of the entries of a pipeline run that failed."""
+    return result["failed"] / result["entries"] if result["entries"] else 0.0
+
+
+def compare(current: Dict, baseline: Dict, threshold: float, failure_threshold: float = FAILURE_THRESHOLD) -> List[str]:
+    """Compare two result files and describe throughput and failure regressions.
+    
+    Args:
+        current: Results of this run
+        baseline: Results of a previous run
+        threshold: Relative drop in entries per second treated as a regression
+        failure_threshold: Rise in the fraction of failed entries treated as a regression
+        
+    Returns:
+        List of regression descriptions (empty if none)
+    """
+    regressions = []
+    for name, result in current["pipelines"].items():
+        base = baseline.get("pipelines", {}).get(name)
+        if not base:
+            continue
+        if base["entries_per_second"]:
+            change = (result["entries_per_second"] - base["entries_per_second"]) / base["entries_per_second"]
+            marker = "REGRESSION" if change < -threshold else ""
+            print(f"  {name:<7} {base['entries_per_second']:>8.2f} -> {result['entries_per_second']:>8.2f} entries/s ({change:+.0%}) {marker}")
+            if change < -threshold:
+                regressions.append(f"{name}: {base['entries_per_second']} -> {result['entries_per_second']} entries/s ({change:+.0%})")
+        
+        rise = failure_rate(result) - failure_rate(base)
+        marker = "REGRESSION" if rise > failure_threshold else ""
+        print(f"  {name:<7} {failure_rate(base):>8.1%} -> {failure_rate(result):>8.1%} failed {marker}")
+        if rise > failure_threshold:
+            regressions.append(f"{name}: {base['failed']}/{base['entries']} -> {result['failed']}/{result['entries']} failed ({rise:+.1%})")
+    return regressions
+
+
+def parse_overrides(values: Optional[List[str]], defaults: Dict[str, float]) -> Dict[str, float]:
+    """Apply PROVIDER=VALUE overrides to per-provider defaults."""
+    result = dict(defaults)
+    for value in values or []:
+        name, _, number = value.partition("=")
+        if name not in result or not number:
+            raise argparse.ArgumentTypeError(f"expected PROVIDER=VALUE with a provider of {', '.join(PROVIDERS)}: {value}")
+        result[name] = float(number)
+    return result
+
+
+def main():
+    """Main function to run the pipeline benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the enrichment pipelines against local fake APIs")
+    parser.add_argument("--pipeline", action="append", choices=PIPELINES, help="Only run this pipeline (repeatable)")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Entries per pipeline (0 for all)")
+    parser.add_argument("--reference", default=DATA_FILE, help="Enhanced data the fake responses are taken from")
+    parser.add_argument("--latency", action="append", metavar="PROVIDER=SECONDS", help="Mean latency of a provider (repeatable)")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Factor applied to every latency (quotas and the scripts' pacing are unchanged)")
+    parser.add_argument("--jitter", type=float, default=0.3, help="Fraction of the latency calls randomly vary by")
+    parser.add_argument("--quota", action="append", metavar="PROVIDER=RATE", help="Calls per second a provider accepts before answering 429; 0 for none (repeatable)")
+    parser.add_argument("--error-rate", type=float, default=DEFAULT_ERROR_RATE, help="Fraction of calls failing with a 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of calls rejected with a 429 regardless of the quota")
+    parser.add_argument("--malformed-rate", type=float, default=DEFAULT_MALFORMED_RATE, help="Fraction of calls answered with a truncated response")
+    parser.add_argument("--words-delay", type=float, default=None, help="Pause of enhance_gujarati_words between words (default: its own)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--verbose", action="store_true", help="Show what the pipelines print")
+    parser.add_argument("--output", help=f"Write results to this JSON file (default: {RESULTS_DIR}/pipeline-<timestamp>.json)")
+    parser.add_argument("--compare", help="Compare with a previous results file")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="Relative drop in entries per second treated as a regression")
+    parser.add_argument("--failure-threshold", type=float, default=FAILURE_THRESHOLD, help="Rise in the fraction of failed entries treated as a regression")
+    args = parser.parse_args()
+    try:
+        args.latency = parse_overrides(args.latency, DEFAULT_LATENCY)
+        args.quota = parse_overrides(args.quota, DEFAULT_QUOTA)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    
+    reference = Reference(load_json(args.reference))
+    pipelines = {}
+    workdir = tempfile.mkdtemp(prefix="bench_pipeline_")
+    try:
+        for name in args.pipeline or PIPELINES:
+            print(f"\nBenchmarking {name}")
+            pipeline_dir = os.path.join(workdir, name)
+            os.makedirs(pipeline_dir)
+            pipelines[name] = BENCHMARKS[name](args, reference, pipeline_dir)
+            print_result(name, pipelines[name])
+    finally:
+        shutil.rmtree(workdir)
+    
+    results = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "limit": args.limit,
+            "latency": {name: seconds * args.latency_scale for name, seconds in args.latency.items()},
+            "jitter": args.jitter,
+            "quota": args.quota,
+            "error_rate": args.error_rate,
+            "rate_limit_rate": args.rate_limit_rate,
+            "malformed_rate": args.malformed_rate,
+            "words_delay": args.words_delay,
+            "seed": args.seed,
+        },
+        "pipelines": pipelines,
+    }
+    
+    output = Path(args.output or f"{RESULTS_DIR}/pipeline-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\nResults saved to {output}")
+    
+    if args.compare:
+        print(f"\nComparing with {args.compare}")
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.failure_threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s)")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
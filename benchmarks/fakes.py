@@ -0,0 +1,271 @@
+"""
+Local stand-ins for the translation, text-to-speech, search and LLM APIs.
+
+Each fake has the part of the real client's interface the enrichment
+scripts use (googletrans Translator, gTTS through gtts_save,
+anthropic.Anthropic, TavilyClient and genai.Client) and answers after a
+simulated latency, so the scripts can be run against them by passing them
+in place of the real clients. Server errors, rate-limited (429) responses
+and truncated LLM output are injected at configurable rates, and calls
+above a quota are rejected with 429 the way the real providers do, so the
+pipelines' rate limiting and retries can be measured offline.
+"""
+
+import collections
+import random
+import threading
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+
+class FakeAPIError(Exception):
+    """Error of a fake API call, carrying the HTTP status like the real clients' errors."""
+    
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"{status_code} ({message})")
+        self.status_code = status_code
+        self.code = status_code
+
+
+class FakeProvider:
+    """Simulated API: latency, injected failures, a quota and call accounting.
+    
+    Calls take `latency` seconds, varied by up to `jitter` of it either way.
+    Rejected (429) calls return at once. A call for a request whose last
+    call failed, or got a truncated response, is counted as a retry.
+    """
+    
+    truncates = True  # Whether responses can be truncated (text replies only)
+    
+    def __init__(
+        self,
+        name: str,
+        latency: float = 0.05,
+        jitter: float = 0.3,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        quota: Optional[float] = None,
+        malformed_rate: float = 0.0,
+        seed: int = 0
+    ):
+        """Initialize the provider.
+        
+        Args:
+            name: Provider name used in reports
+            latency: Mean seconds per call
+            jitter: Fraction of the latency calls randomly vary by
+            error_rate: Fraction of calls failing with a 503
+            rate_limit_rate: Fraction of calls rejected with a 429 at random
+            quota: Calls accepted per second; calls above it are rejected
+                with a 429 (default: no quota)
+            malformed_rate: Fraction of calls answered with a truncated
+                response, for providers whose replies can be truncated
+            seed: Seed of the random source
+        """
+        self.name = name
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.quota = quota
+        self.malformed_rate = malformed_rate if self.truncates else 0.0
+        self.calls = 0
+        self.retries = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.malformed = 0
+        self.busy_seconds = 0.0
+        self._first_call: Optional[float] = None
+        self._last_done: Optional[float] = None
+        self._failed = set()  # Requests whose last call failed
+        self._accepted = collections.deque()  # Times of the calls accepted in the last second
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def call(self, request) -> bool:
+        """Simulate one call.
+        
+        Args:
+            request: Hashable identity of the request, e.g. the prompt
+            
+        Returns:
+            True if the response should be truncated
+            
+        Raises:
+            FakeAPIError: A 429 if the call was rate limited, or a 503
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.calls += 1
+            if self._first_call is None:
+                self._first_call = now
+            if request in self._failed:
+                self.retries += 1
+            while self._accepted and self._accepted[0] <= now - 1:
+                self._accepted.popleft()
+            if (self.quota is not None and len(self._accepted) >= self.quota) \
+                    or self._random.random() < self.rate_limit_rate:
+                self.rate_limited += 1
+                self._failed.add(request)
+                self._last_done = now
+                raise FakeAPIError(429, "Too Many Requests")
+            self._accepted.append(now)
+            duration = max(0.0, self.latency * (1 + self.jitter * self._random.uniform(-1, 1)))
+            outcome = self._random.random()
+        
+        time.sleep(duration)
+        
+        with self._lock:
+            self.busy_seconds += duration
+            self._last_done = time.monotonic()
+            if outcome < self.error_rate:
+                self.errors += 1
+                self._failed.add(request)
+                raise FakeAPIError(503, "Service Unavailable")
+            if outcome < self.error_rate + self.malformed_rate:
+                self.malformed += 1
+                self._failed.add(request)
+                return True
+            self._failed.discard(request)
+            return False
+    
+    def stats(self) -> Dict:
+        """Get the call counts and timings.
+        
+        busy_seconds adds up the latency of every call; active_seconds is
+        the time from the first call to the end of the last one, so their
+        ratio is the average number of calls in flight.
+        """
+        with self._lock:
+            active = self._last_done - self._first_call if self._first_call is not None else 0.0
+            return {
+                "calls": self.calls,
+                "retries": self.retries,
+                "errors": self.errors,
+                "rate_limited": self.rate_limited,
+                "malformed": self.malformed,
+                "busy_seconds": round(self.busy_seconds, 3),
+                "active_seconds": round(active, 3),
+            }
+
+
+def truncate(text: str) -> str:
+    """Cut a response in half, like a reply that hit its token limit."""
+    return text[:len(text) // 2]
+
+
+class FakeTranslator(FakeProvider):
+    """Stands in for googletrans.Translator."""
+    
+    truncates = False
+    
+    def __init__(self, translate: Optional[Callable[[str, str, str], str]] = None, **kwargs):
+        """Initialize the translator.
+        
+        Args:
+            translate: Function (text, source language, destination
+                language) -> translation (default: the text, tagged with
+                the destination language)
+            **kwargs: Latency and failure settings of FakeProvider
+        """
+        super().__init__("translate", **kwargs)
+        self._translate = translate or (lambda text, src, dest: f"[{dest}] {text}")
+    
+    def translate(self, text: str, src: str = "auto", dest: str = "en") -> SimpleNamespace:
+        """Translate text, returning an object shaped like googletrans' Translated."""
+        self.call((text, src, dest))
+        return SimpleNamespace(
+            src=src, dest=dest, origin=text, text=self._translate(text, src, dest), pronunciation=None
+        )
+
+
+class FakeTTS(FakeProvider):
+    """Stands in for gtts_save, the gTTS text-to-speech function of the pipeline."""
+    
+    truncates = False
+    
+    def __init__(self, bytes_per_char: int = 400, **kwargs):
+        """Initialize the text-to-speech function.
+        
+        Args:
+            bytes_per_char: Size of the written file per character of text,
+                roughly that of gTTS' MP3s
+            **kwargs: Latency and failure settings of FakeProvider
+        """
+        super().__init__("tts", **kwargs)
+        self.bytes_per_char = bytes_per_char
+    
+    def __call__(self, text: str, file_path: str, lang: str):
+        """Write a silent file of about the size gTTS would for the text."""
+        self.call((text, lang))
+        with open(file_path, 'wb') as f:
+            f.write(bytes(max(1, len(text)) * self.bytes_per_char))
+
+
+class FakeAnthropic(FakeProvider):
+    """Stands in for anthropic.Anthropic; only messages.create is provided."""
+    
+    def __init__(self, respond: Optional[Callable[[str], str]] = None, **kwargs):
+        """Initialize the client.
+        
+        Args:
+            respond: Function building the reply to the last user message
+                (default: an empty reply)
+            **kwargs: Latency and failure settings of FakeProvider
+        """
+        super().__init__("anthropic", **kwargs)
+        self._respond = respond or (lambda prompt: "")
+        self.messages = SimpleNamespace(create=self._create)
+    
+    def _create(self, model: str, max_tokens: int, messages: List[Dict], system: str = "", **kwargs) -> SimpleNamespace:
+        prompt = messages[-1]["content"]
+        malformed = self.call((model, system, prompt))
+        text = self._respond(prompt)
+        return SimpleNamespace(
+            model=model,
+            role="assistant",
+            content=[SimpleNamespace(type="text", text=truncate(text) if malformed else text)],
+            stop_reason="max_tokens" if malformed else "end_turn",
+        )
+
+
+class FakeTavily(FakeProvider):
+    """Stands in for tavily.TavilyClient; only search is provided."""
+    
+    def __init__(self, respond: Optional[Callable[[str], List[Dict]]] = None, **kwargs):
+        """Initialize the client.
+        
+        Args:
+            respond: Function (query) -> search results, each a dict with
+                "title", "url" and "content" (default: no results)
+            **kwargs: Latency and failure settings of FakeProvider
+        """
+        super().__init__("tavily", **kwargs)
+        self._respond = respond or (lambda query: [])
+    
+    def search(self, query: str, search_depth: str = "basic", **kwargs) -> Dict:
+        """Search, returning the response dict of TavilyClient.search; truncated responses have no results."""
+        malformed = self.call((query, search_depth))
+        return {"query": query, "results": [] if malformed else self._respond(query)}
+
+
+class FakeGenAIClient(FakeProvider):
+    """Stands in for google.genai.Client; only models.generate_content is provided."""
+    
+    def __init__(self, respond: Optional[Callable[[str], str]] = None, **kwargs):
+        """Initialize the client.
+        
+        Args:
+            respond: Function building the response text to a prompt
+                (default: an empty JSON object)
+            **kwargs: Latency and failure settings of FakeProvider
+        """
+        super().__init__("gemini", **kwargs)
+        self._respond = respond or (lambda prompt: "{}")
+        self.models = SimpleNamespace(generate_content=self._generate_content)
+    
+    def _generate_content(self, model: str, contents: str, config=None) -> SimpleNamespace:
+        malformed = self.call((model, contents))
+        text = self._respond(contents)
+        return SimpleNamespace(text=truncate(text) if malformed else text)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Generate scaled synthetic lexicons for benchmarking.
+
+New headwords are produced by a syllable-level Markov chain trained on the
+real headwords, so their length and character distribution match real
+Gujarati. Every synthetic entry borrows the remaining fields from a real
+entry, with the headword substituted into its example sentence and audio
+paths pointing at existing files so the audio routes stay exercisable.
+"""
+
+import argparse
+import json
+import random
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+# Constants
+INPUT_FILE = "data/gujarati_words_google_enhanced.json"
+OUTPUT_DIR = "benchmarks/data"
+SEED = 42
+
+# Approximate Gujarati syllable: independent vowel, or consonant cluster
+# joined by viramas, followed by an optional matra and anusvara/visarga
+SYLLABLE_RE = re.compile(
+    r"[અ-ઔ]ઁ?ં?ઃ?"
+    r"|[ક-હ]઼?(?:્[ક-હ]઼?)*[ા-્]?[ઁ-ઃ]?"
+)
+
+START = "^"
+END = "$"
+
+
+def output_path(scale: int, output_dir: str = OUTPUT_DIR) -> Path:
+    """Get the path of the synthetic lexicon for a scale factor."""
+    return Path(output_dir) / f"gujarati_words_x{scale}.json"
+
+
+def build_syllable_chain(words: List[str]) -> Dict[str, List[str]]:
+    """Build a first-order Markov chain over the syllables of the given words."""
+    chain = defaultdict(list)
+    for word in words:
+        syllables = SYLLABLE_RE.findall(word)
+        if not syllables:
+            continue
+        previous = START
+        for syllable in syllables:
+            chain[previous].append(syllable)
+            previous = syllable
+        chain[previous].append(END)
+    return dict(chain)
+
+
+def generate_word(chain: Dict[str, List[str]], rng: random.Random, max_syllables: int = 6) -> str:
+    """Generate a headword by walking the syllable chain."""
+    syllables = []
+    current = START
+    while len(syllables) < max_syllables:
+        current = rng.choice(chain.get(current) or [END])
+        if current == END:
+            break
+        syllables.append(current)
+    return "".join(syllables) or rng.choice(chain[START])
+
+
+def generate_lexicon(data: Dict[str, List], scale: int, seed: int = SEED) -> Dict[str, List]:
+    """Grow a lexicon to `scale` times its size.
+    
+    The original entries are kept as-is and come first.
+    
+    Args:
+        data: The real lexicon
+        scale: Scale factor
+        seed: Random seed, so runs are reproducible
+        
+    Returns:
+        The scaled lexicon
+    """
+    rng = random.Random(seed)
+    entries = list(data.values())
+    chain = build_syllable_chain([entry[0] for entry in entries])
+    
+    lexicon = {}
+    for word_id, entry in data.items():
+        lexicon[word_id] = list(entry)
+    
+    next_id = max((int(word_id) for word_id in data if word_id.isdigit()), default=-1) + 1
+    for _ in range(len(entries) * (scale - 1)):
+        source = rng.choice(entries)
+        new_entry = list(source)
+        new_word = generate_word(chain, rng)
+        new_entry[0] = new_word
+        if len(new_entry) > 5 and new_entry[5]:
+            new_entry[5] = new_entry[5].replace(source[0], new_word)
+        lexicon[str(next_id)] = new_entry
+        next_id += 1
+    
+    return lexicon
+
+
+def main():
+    """Main function to generate the synthetic lexicons."""
+    parser = argparse.ArgumentParser(description="Generate scaled synthetic Gujarati lexicons")
+    parser.add_argument("--input", default=INPUT_FILE, help="Real lexicon to grow")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="Directory for the generated files")
+    parser.add_argument("--scale", type=int, action="append", help="Scale factor (repeatable, default: 10 and 100)")
+    parser.add_argument("--seed", type=int, default=SEED, help="Random seed")
+    args = parser.parse_args()
+    
+    print(f"Loading data from {args.input}...")
+    with open(args.input, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    print(f"Loaded {len(data)} words")
+    
+    for scale in args.scale or [10, 100]:
+        lexicon = generate_lexicon(data, scale, args.seed)
+        path = output_path(scale, args.output_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(lexicon, f, ensure_ascii=False)
+        print(f"Wrote {len(lexicon)} words to {path}")
+
+
+if __name__ == "__main__":
+    main()
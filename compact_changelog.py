@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Fold the change log of a data file into the data file.
+
+Use this only when no API process is serving the data file; a running
+server compacts its own log through POST /admin/compact.
+"""
+
+import argparse
+from pipeline.changelog import compact
+
+# Constants
+DATA_FILE = "data/gujarati_words_google_enhanced.json"
+
+
+def main():
+    """Main function to compact the change log."""
+    parser = argparse.ArgumentParser(description="Fold the change log into the data file")
+    parser.add_argument("--data-file", default=DATA_FILE, help="Data file whose change log to compact")
+    args = parser.parse_args()
+    
+    result = compact(args.data_file)
+    if result["records"]:
+        print(f"Folded {result['records']} changes into {args.data_file} "
+              f"({result['entries']} words, version {result['version']})")
+    else:
+        print("Change log is empty, nothing to compact")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,46 +3,37 @@ import os
 import time
 import sys
 import random
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import requests
+from typing import Callable, Dict, List, Optional, Tuple
 from gtts import gTTS
 from tqdm import tqdm
 from googletrans import Translator
+from pipeline.audio_store import DEFAULT_VOICE, AudioStore
+from pipeline.cache import ResultCache
+from pipeline.journal import PipelineRun
+from pipeline.ratelimit import AdaptiveRateLimiter, is_rate_limited
+from pipeline.transliteration import transliterate
 
 # Constants
 INPUT_FILE = "data/gujarati_words_enhanced.json"
 OUTPUT_FILE = "data/gujarati_words_google_enhanced.json"
-AUDIO_WORDS_DIR = "audio/words"
-AUDIO_EXAMPLES_DIR = "audio/examples"
-BATCH_SIZE = 5  # Small batch size to avoid rate limiting
-DELAY_BETWEEN_CALLS = 2  # Delay between API calls (in seconds)
-DELAY_BETWEEN_BATCHES = 10  # Delay between batches (in seconds)
-MAX_RETRIES = 3  # Maximum number of retries for API calls
+AUDIO_MANIFEST_FILE = "audio/store/manifest.json"  # Audio is stored once per distinct text
+TRANSLATE_CONCURRENCY = 8  # Translation calls in flight at once
+TTS_CONCURRENCY = 4  # Text-to-speech calls in flight at once
+TRANSLATE_RATE = 2.0  # Initial translation calls per second; adapts to the quota
+TRANSLATE_MAX_RATE = 20.0  # Upper bound for the translation rate
+TTS_RATE = 1.0  # Initial text-to-speech calls per second; adapts to the quota
+TTS_MAX_RATE = 10.0  # Upper bound for the text-to-speech rate
+MAX_RETRIES = 3  # Maximum number of retries for failed API calls
+MAX_RATE_LIMIT_RETRIES = 10  # Maximum number of retries for rate-limited API calls
 
-# Initialize the Google Translate client
-translator = Translator()
-
-print("Using googletrans library (free Google Translate API)")
-
-# Note about rate limiting
-print("\nNOTE: The free Google Translate API has rate limits. If you encounter rate limiting issues:")
-print("1. Try increasing the DELAY_BETWEEN_CALLS and DELAY_BETWEEN_BATCHES constants")
-print("2. Run the script during off-peak hours")
-print("3. Process the data in smaller batches over multiple days\n")
-
-# Test the translator
-try:
-    test_result = translator.translate("test", src="en", dest="gu")
-    print("Google Translate API connection test successful.")
-except Exception as e:
-    print(f"Warning: Could not connect to Google Translate API: {e}")
-    print("The script will continue and retry during processing.")
+# Text-to-speech function: (text, file path, language) -> None, raising on failure
+TextToSpeech = Callable[[str, str, str], None]
 
 def ensure_directories_exist():
     """Create necessary directories if they don't exist."""
-    Path(AUDIO_WORDS_DIR).mkdir(parents=True, exist_ok=True)
-    Path(AUDIO_EXAMPLES_DIR).mkdir(parents=True, exist_ok=True)
+    Path(AUDIO_MANIFEST_FILE).parent.mkdir(parents=True, exist_ok=True)
     # Ensure the output directory exists
     Path(OUTPUT_FILE).parent.mkdir(parents=True, exist_ok=True)
 
@@ -51,206 +42,364 @@ def load_data(file_path: str) -> Dict:
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def save_data(data: Dict, file_path: str):
-    """Save word data to JSON file."""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def check_translator(translator: Translator):
+    """Make a test call so connection problems show up before processing starts."""
+    try:
+        translator.translate("test", src="en", dest="gu")
+        print("Google Translate API connection test successful.")
+    except Exception as e:
+        print(f"Warning: Could not connect to Google Translate API: {e}")
+        print("The script will continue and retry during processing.")
 
-def translate_gujarati(text: str) -> Tuple[str, str]:
+def gtts_save(text: str, file_path: str, lang: str):
+    """Save text as audio file using Google Text-to-Speech (the DEFAULT_VOICE of the audio store)."""
+    gTTS(text=text, lang=lang, slow=False).save(file_path)
+
+def call_with_rate_limit(limiter: AdaptiveRateLimiter, func: Callable, *args, **kwargs):
     """
-    Translate Gujarati text to English and get its romanization in a single call.
+    Call an API function once the rate limiter allows, retrying failures.
+    
+    Rate-limited calls make the limiter back off and are retried up to
+    MAX_RATE_LIMIT_RETRIES times; other errors are retried up to MAX_RETRIES
+    times after a short random delay.
     
     Args:
-        text: The Gujarati text to translate
+        limiter: Rate limiter of the API
+        func: API function to call
         
     Returns:
-        A tuple of (translation, romanization)
+        The result of the call
+        
+    Raises:
+        Exception: The last error if every attempt failed
     """
-    for attempt in range(MAX_RETRIES):
+    failures = 0
+    rate_limited = 0
+    while True:
+        limiter.acquire()
         try:
-            # Make a single call to get both translation and pronunciation
-            result = translator.translate(text, src='gu', dest='en')
-            
-            # Extract the translation
-            translation = ""
-            if hasattr(result, 'text'):
-                translation = result.text
-            
-            # Extract the pronunciation/romanization
-            romanization = ""
-            if hasattr(result, 'pronunciation') and result.pronunciation:
-                romanization = result.pronunciation
-                print(f"Found pronunciation: {romanization}")
-            else:
-                # If no pronunciation, try to extract from the translated text
-                # Sometimes Google Translate includes romanization in parentheses
-                import re
-                if hasattr(result, 'text') and result.text:
-                    romanization_match = re.search(r'\((.*?)\)', result.text)
-                    if romanization_match:
-                        romanization = romanization_match.group(1)
-                        print(f"Extracted romanization from translation: {romanization}")
-                
-                # If still no romanization, use character mapping
-                if not romanization:
-                    print(f"No romanization found for '{text}', using character mapping")
-                    gujarati_to_latin = {
-                        'અ': 'a', 'આ': 'aa', 'ઇ': 'i', 'ઈ': 'i', 'ઉ': 'u', 'ઊ': 'u',
-                        'એ': 'e', 'ઐ': 'ai', 'ઓ': 'o', 'ઔ': 'au', 'ક': 'k', 'ખ': 'kh',
-                        'ગ': 'g', 'ઘ': 'gh', 'ચ': 'ch', 'છ': 'chh', 'જ': 'j', 'ઝ': 'jh',
-                        'ટ': 't', 'ઠ': 'th', 'ડ': 'd', 'ઢ': 'dh', 'ણ': 'n', 'ત': 't',
-                        'થ': 'th', 'દ': 'd', 'ધ': 'dh', 'ન': 'n', 'પ': 'p', 'ફ': 'f',
-                        'બ': 'b', 'ભ': 'bh', 'મ': 'm', 'ય': 'y', 'ર': 'r', 'લ': 'l',
-                        'વ': 'v', 'શ': 'sh', 'ષ': 'sh', 'સ': 's', 'હ': 'h', 'ળ': 'l',
-                        'ં': 'n', 'ઃ': 'h', '઼': '', 'ા': 'a', 'િ': 'i', 'ી': 'i',
-                        'ુ': 'u', 'ૂ': 'u', 'ૃ': 'ru', 'ૄ': 'ru', 'ૅ': 'e', 'ે': 'e',
-                        'ૈ': 'ai', 'ૉ': 'o', 'ો': 'o', 'ૌ': 'au', '્': '', 'ૐ': 'om'
-                    }
-                    
-                    # Convert each character
-                    romanized = ""
-                    for char in text:
-                        romanized += gujarati_to_latin.get(char, char)
-                    
-                    romanization = romanized
-            
-            return translation, romanization
-            
+            result = func(*args, **kwargs)
         except Exception as e:
-            print(f"Error translating '{text}' (attempt {attempt+1}/{MAX_RETRIES}): {e}")
-            if attempt < MAX_RETRIES - 1:
-                # Add a random delay before retrying to avoid rate limiting
-                sleep_time = DELAY_BETWEEN_CALLS * (1 + random.random())
-                print(f"Retrying in {sleep_time:.2f} seconds...")
-                time.sleep(sleep_time)
+            if is_rate_limited(e):
+                limiter.on_rate_limited()
+                rate_limited += 1
+                if rate_limited > MAX_RATE_LIMIT_RETRIES:
+                    raise
+            else:
+                failures += 1
+                if failures >= MAX_RETRIES:
+                    raise
+                time.sleep(1 + random.random())
+            continue
+        limiter.on_success()
+        return result
+
+def request_translation(text: str, translator: Translator, limiter: AdaptiveRateLimiter) -> Dict[str, str]:
+    """Translate Gujarati text to English, returning the translation and pronunciation."""
+    result = call_with_rate_limit(limiter, translator.translate, text, src='gu', dest='en')
+    return {
+        "text": getattr(result, 'text', "") or "",
+        "pronunciation": getattr(result, 'pronunciation', "") or ""
+    }
+
+def translate_gujarati(
+    text: str,
+    translator: Translator,
+    limiter: AdaptiveRateLimiter,
+    cache: Optional[ResultCache] = None
+) -> str:
+    """
+    Translate Gujarati text to English.
     
-    # If all attempts fail, return empty strings
-    return "", ""
+    Args:
+        text: The Gujarati text to translate
+        translator: Google Translate client
+        limiter: Rate limiter for translation calls
+        cache: Optional cache of earlier translations
+        
+    Returns:
+        The translation, empty if every attempt failed
+    """
+    try:
+        if cache is not None:
+            result = cache.cached("google-translate", "gu-en", text,
+                                  lambda: request_translation(text, translator, limiter))
+        else:
+            result = request_translation(text, translator, limiter)
+    except Exception as e:
+        tqdm.write(f"Error translating '{text}': {e}")
+        return ""
+    
+    return result["text"]
 
-def save_audio(text: str, file_path: str, lang: str = 'gu'):
-    """Save text as audio file using Google Text-to-Speech."""
+def save_audio(text: str, store: AudioStore, tts: TextToSpeech, limiter: AdaptiveRateLimiter, lang: str = 'gu') -> str:
+    """Get the audio for a text from the store, synthesizing it if needed.
+    
+    Returns:
+        Path of the audio file, or an empty string if synthesis failed
+    """
+    def synthesize(text: str, file_path: str, lang: str):
+        call_with_rate_limit(limiter, tts, text, file_path, lang)
+    
     try:
-        tts = gTTS(text=text, lang=lang, slow=False)
-        tts.save(file_path)
-        return True
+        path, _ = store.synthesize(text, lang, synthesize, DEFAULT_VOICE)
+        return path
     except Exception as e:
-        print(f"Error saving audio for '{text}': {e}")
-        return False
+        tqdm.write(f"Error saving audio for '{text}': {e}")
+        return ""
 
-def process_word(word_id: str, word_entry: List, word_index: int) -> Tuple[str, List]:
-    """Process a single word entry with googletrans library."""
+def translate_entry(
+    word_entry: List,
+    translator: Translator,
+    limiter: AdaptiveRateLimiter,
+    cache: Optional[ResultCache] = None
+) -> List:
+    """
+    Translation stage: romanize the word and example and translate the example.
+    
+    Args:
+        word_entry: Input word entry
+        translator: Google Translate client
+        limiter: Rate limiter for translation calls
+        cache: Optional cache of earlier translations
+        
+    Returns:
+        Word entry up to the example translation, without audio paths
+    """
     # Extract word data
     gujarati_word = word_entry[0]
     ipa = word_entry[1] if len(word_entry) > 1 else ""
-    # We'll replace the alt_ipa with Google's romanization
+    # We'll replace the alt_ipa with a local romanization
     pos = word_entry[3] if len(word_entry) > 3 else ""
     definition = word_entry[4] if len(word_entry) > 4 else ""
     example = word_entry[5] if len(word_entry) > 5 else ""
     
-    print(f"Processing word: {gujarati_word}")
-    
-    # Get word translation and romanization in a single call
-    _, word_romanization = translate_gujarati(gujarati_word)
-    print(f"Romanization: {word_romanization}")
+    # Romanize locally; only the example translation needs a call
+    word_romanization = transliterate(gujarati_word)
+    example_romanization = transliterate(example)
+    example_translation = ""
+    if example:
+        example_translation = translate_gujarati(example, translator, limiter, cache)
     
-    # Initialize new entry with existing data
-    new_entry = [
+    return [
         gujarati_word,
         ipa,
-        word_romanization,  # Replace alt_ipa with Google's romanization
+        word_romanization,  # Replace alt_ipa with the romanization
         pos,
         definition,
-        example
+        example,
+        example_romanization,
+        example_translation
     ]
+
+def synthesize_entry(new_entry: List, store: AudioStore, tts: TextToSpeech, limiter: AdaptiveRateLimiter) -> List:
+    """
+    Text-to-speech stage: get the example and word audio.
     
-    # Process example if it exists
-    if example:
-        print(f"Processing example: {example}")
-        
-        # Get example translation and romanization in a single call
-        example_translation, example_romanization = translate_gujarati(example)
-        print(f"Example romanization: {example_romanization}")
-        print(f"Example translation: {example_translation}")
+    Texts already in the audio store, such as headwords repeated across
+    senses, aren't synthesized again.
+    
+    Args:
+        new_entry: Word entry produced by the translation stage
+        store: Audio store
+        tts: Text-to-speech function
+        limiter: Rate limiter for text-to-speech calls
         
-        new_entry.append(example_romanization)
-        new_entry.append(example_translation)
+    Returns:
+        The complete word entry, with audio paths
+    """
+    gujarati_word = new_entry[0]
+    example = new_entry[5]
+    
+    example_audio_path = save_audio(example, store, tts, limiter) if example else ""
+    word_audio_path = save_audio(gujarati_word, store, tts, limiter)
+    
+    return new_entry + [example_audio_path, word_audio_path]
+
+def is_complete(new_entry: List) -> bool:
+    """Check that none of the API calls for a word entry failed."""
+    if not new_entry[2] or not new_entry[9]:
+        return False
+    if new_entry[5] and not all(new_entry[6:9]):
+        return False
+    return True
+
+def run_pipeline(
+    items: List[Tuple[str, List]],
+    translator: Translator,
+    store: AudioStore,
+    tts: TextToSpeech,
+    translate_limiter: AdaptiveRateLimiter,
+    tts_limiter: AdaptiveRateLimiter,
+    on_complete: Optional[Callable[[str, List], None]] = None,
+    cache: Optional[ResultCache] = None,
+    progress: bool = True
+) -> Dict[str, List]:
+    """
+    Enhance words with translation and text-to-speech running as separate stages.
+    
+    Each stage has its own thread pool and rate limiter, so a word's audio is
+    generated while later words are still being translated, and each stage
+    runs as fast as its provider's quota allows.
+    
+    Args:
+        items: (word ID, word entry) pairs
+        translator: Google Translate client (anything with the same translate method)
+        store: Audio store
+        tts: Text-to-speech function
+        translate_limiter: Rate limiter for translation calls
+        tts_limiter: Rate limiter for text-to-speech calls
+        on_complete: Optional callback receiving (word ID, new entry) as each word completes
+        cache: Optional cache of earlier translations
+        progress: Whether to show progress bars
         
-        # Save example audio
-        example_audio_path = f"{AUDIO_EXAMPLES_DIR}/{word_index}.mp3"
-        print(f"Saving example audio to {example_audio_path}")
-        if save_audio(example, example_audio_path):
-            new_entry.append(example_audio_path)
-        else:
-            new_entry.append("")
-    else:
-        # Add empty fields if no example
-        new_entry.extend(["", "", ""])
+    Returns:
+        Completed word entries by ID, in input order
+    """
+    results = {}
+    stages: Dict[Future, Tuple[str, str]] = {}
+    translate_bar = tqdm(total=len(items), desc="Translating", position=0, disable=not progress)
+    tts_bar = tqdm(total=len(items), desc="Generating audio", position=1, disable=not progress)
     
-    # Save word audio
-    word_audio_path = f"{AUDIO_WORDS_DIR}/{word_index}.mp3"
-    print(f"Saving word audio to {word_audio_path}")
-    if save_audio(gujarati_word, word_audio_path):
-        new_entry.append(word_audio_path)
-    else:
-        new_entry.append("")
+    with ThreadPoolExecutor(TRANSLATE_CONCURRENCY, thread_name_prefix="translate") as translate_pool, \
+            ThreadPoolExecutor(TTS_CONCURRENCY, thread_name_prefix="tts") as tts_pool:
+        for word_id, word_entry in items:
+            future = translate_pool.submit(translate_entry, word_entry, translator, translate_limiter, cache)
+            stages[future] = ("translate", word_id)
+        
+        pending = set(stages)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, word_id = stages.pop(future)
+                if stage == "translate":
+                    translate_bar.update()
+                    next_future = tts_pool.submit(synthesize_entry, future.result(), store, tts, tts_limiter)
+                    stages[next_future] = ("tts", word_id)
+                    pending.add(next_future)
+                else:
+                    tts_bar.update()
+                    results[word_id] = future.result()
+                    if on_complete:
+                        on_complete(word_id, results[word_id])
+            translate_bar.set_postfix(translate_limiter.stats())
+            tts_bar.set_postfix(tts_limiter.stats())
     
-    return word_id, new_entry
+    translate_bar.close()
+    tts_bar.close()
+    return {word_id: results[word_id] for word_id, _ in items}
 
-def process_batch(batch: Dict[str, List], start_index: int, total_words: int) -> Dict[str, List]:
-    """Process a batch of words with rate limiting."""
-    updated_batch = {}
-    batch_items = list(batch.items())
+def enhance(
+    items: List[Tuple[str, List]],
+    translator: Translator,
+    tts: TextToSpeech = gtts_save,
+    output_file: str = OUTPUT_FILE,
+    manifest_file: str = AUDIO_MANIFEST_FILE,
+    cache: Optional[ResultCache] = None,
+    progress: bool = True
+) -> Dict:
+    """
+    Enhance the words that aren't journaled yet, then write the output and audio manifest.
+    
+    Words already enhanced from the same input by an earlier (possibly
+    interrupted) run are taken from the journal. The clients are passed in,
+    so local fakes can stand in for Google Translate and gTTS.
     
-    for i, (word_id, word_entry) in enumerate(tqdm(batch_items, desc=f"Processing batch {start_index//BATCH_SIZE + 1}/{(total_words + BATCH_SIZE - 1)//BATCH_SIZE}")):
-        word_index = start_index + i
-        updated_id, updated_entry = process_word(word_id, word_entry, word_index)
-        updated_batch[updated_id] = updated_entry
+    Args:
+        items: (word ID, word entry) pairs, in output order
+        translator: Google Translate client (anything with the same translate method)
+        tts: Text-to-speech function
+        output_file: Path of the enhanced data
+        manifest_file: Path of the audio store manifest
+        cache: Optional cache of earlier translations
+        progress: Whether to show progress bars
         
-        # Rate limiting to avoid API throttling (except for the last item in batch)
-        if i < len(batch_items) - 1:
-            # Add a small random variation to the delay to avoid predictable patterns
-            sleep_time = DELAY_BETWEEN_CALLS * (0.8 + 0.4 * random.random())
-            time.sleep(sleep_time)
+    Returns:
+        Report with the "output" written, the "pending", "processed",
+        "reused" and "incomplete" word counts, the audio "store", the
+        "translate" and "tts" limiter stats and the "seconds" spent in the
+        prepare, process and save stages
+    """
+    seconds = {}
+    start = time.perf_counter()
+    inputs = dict(items)
+    run = PipelineRun(output_file)
+    todo = run.pending(items)
+    seconds["prepare"] = time.perf_counter() - start
+    print(f"{run.reused} words unchanged since the last run, {len(todo)} to process")
+    
+    # Calls start slowly and speed up until the provider starts rejecting them
+    translate_limiter = AdaptiveRateLimiter(TRANSLATE_RATE, burst=TRANSLATE_CONCURRENCY, max_rate=TRANSLATE_MAX_RATE)
+    tts_limiter = AdaptiveRateLimiter(TTS_RATE, burst=TTS_CONCURRENCY, max_rate=TTS_MAX_RATE)
+    
+    def record(word_id: str, new_entry: List):
+        # Incomplete words are kept in the output and retried by the next run
+        run.record(word_id, inputs[word_id], new_entry, complete=is_complete(new_entry))
+    
+    start = time.perf_counter()
+    store = AudioStore(manifest_file)
+    run_pipeline(todo, translator, store, tts, translate_limiter, tts_limiter, record, cache, progress)
+    seconds["process"] = time.perf_counter() - start
     
-    return updated_batch
+    start = time.perf_counter()
+    updated_data = run.finish(items)
+    # Map every word to its audio blobs, so the API can serve them
+    for word_id, new_entry in updated_data.items():
+        store.set_entry(word_id, "example", new_entry[8])
+        store.set_entry(word_id, "word", new_entry[9])
+    store.save()
+    seconds["save"] = time.perf_counter() - start
+    
+    return {
+        "output": updated_data,
+        "pending": len(todo),
+        "processed": run.processed,
+        "reused": run.reused,
+        "incomplete": run.incomplete,
+        "store": store,
+        "translate": translate_limiter.stats(),
+        "tts": tts_limiter.stats(),
+        "seconds": seconds,
+    }
 
 def main():
     """Main function to enhance Gujarati words with googletrans library."""
     # Ensure directories exist
     ensure_directories_exist()
     
+    # Initialize the Google Translate client
+    print("Using googletrans library (free Google Translate API)")
+    translator = Translator(raise_exception=True)
+    check_translator(translator)
+    
     print(f"Loading data from {INPUT_FILE}...")
     data = load_data(INPUT_FILE)
     total_words = len(data)
     print(f"Loaded {total_words} words")
     
-    # Process words in batches
-    updated_data = {}
     items = list(data.items())
     
     # For testing with a small subset, uncomment the following line:
     # items = items[:20]  # Process only first 20 words for testing
     
-    for i in range(0, len(items), BATCH_SIZE):
-        batch = dict(items[i:i+BATCH_SIZE])
-        print(f"\nProcessing batch {i//BATCH_SIZE + 1}/{(len(items) + BATCH_SIZE - 1)//BATCH_SIZE}")
-        batch_results = process_batch(batch, i, len(items))
-        updated_data.update(batch_results)
-        
-        # Save intermediate results after each batch
-        save_data(updated_data, OUTPUT_FILE)
-        print(f"Intermediate results saved to {OUTPUT_FILE} ({len(updated_data)}/{total_words} words processed)")
-        
-        # Add a delay between batches to avoid API rate limits
-        if i + BATCH_SIZE < len(items):
-            # Add a small random variation to the delay
-            sleep_time = DELAY_BETWEEN_BATCHES * (0.8 + 0.4 * random.random())
-            print(f"Pausing between batches to avoid API rate limits... ({sleep_time:.2f} seconds)")
-            time.sleep(sleep_time)
+    # Headwords and examples repeat across senses and runs; translate each text once
+    cache = ResultCache()
+    report = enhance(items, translator, gtts_save, OUTPUT_FILE, AUDIO_MANIFEST_FILE, cache)
+    elapsed = report["seconds"]["process"]
+    store = report["store"]
     
     print(f"\nProcessing complete. Final data saved to {OUTPUT_FILE}")
-    print(f"Processed {len(updated_data)}/{total_words} words")
-    print(f"Audio files saved to {AUDIO_WORDS_DIR} and {AUDIO_EXAMPLES_DIR}")
+    print(f"Processed {report['processed']} words in {elapsed:.1f} seconds "
+          f"({report['processed'] / max(elapsed, 1e-9):.2f} words/s), "
+          f"reused {report['reused']}, {report['incomplete']} incomplete and retried next run")
+    print(f"Output has {len(report['output'])}/{total_words} words")
+    print(f"Translation: {report['translate']}")
+    print(f"Text-to-speech: {report['tts']}")
+    cache_stats = cache.stats()
+    print(f"Translation cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    cache.close()
+    print(f"Audio: {store.synthesized} synthesized, {store.reused} reused, "
+          f"{len(store.blobs)} files ({store.total_bytes() / 1e6:.1f} MB) in {store.root}")
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,22 @@
 import json
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import anthropic
 from tavily import TavilyClient
 from tqdm import tqdm
 import re
+from pipeline.cache import ResultCache
+from pipeline.journal import PipelineRun
 
-# Initialize clients
+# Constants
+INPUT_FILE = "data/gujarati_words.json"
+OUTPUT_FILE = "data/gujarati_words_enhanced.json"
 ANTHROPIC_API_KEY = "sk-ant-api03-"
 TAVILY_API_KEY = "tvly-"
-
-anthropic_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-tavily_client = TavilyClient(api_key=TAVILY_API_KEY)
+CLAUDE_MODEL = "claude-3-opus-20240229"
+CLAUDE_SYSTEM_PROMPT = "You are a linguistic expert in Gujarati. Provide accurate, well-formatted responses."
+DELAY_BETWEEN_CALLS = 0.5  # Seconds between words that called the APIs
 
 # Load the JSON data
 def load_data(file_path: str) -> Dict:
@@ -30,13 +34,24 @@ def extract_field(response: str, field_name: str) -> str:
     return ""
 
 # Search for examples using Tavily
-def search_for_example(word: str) -> str:
-    """Search for example sentences using the Tavily API."""
+def search_for_example(word: str, tavily_client: TavilyClient, cache: Optional[ResultCache] = None) -> str:
+    """Search for example sentences using the Tavily API.
+    
+    Args:
+        word: Gujarati word
+        tavily_client: Tavily client (anything with the same search method)
+        cache: Optional cache of earlier searches
+        
+    Returns:
+        A sentence containing the word, empty if none was found
+    """
+    query = f"example sentence with Gujarati word {word}"
     try:
-        search_result = tavily_client.search(
-            query=f"example sentence with Gujarati word {word}",
-            search_depth="advanced"
-        )
+        if cache is not None:
+            search_result = cache.cached("tavily", "advanced", query,
+                                         lambda: tavily_client.search(query=query, search_depth="advanced"))
+        else:
+            search_result = tavily_client.search(query=query, search_depth="advanced")
         
         # Extract potential examples from search results
         example_sentence = ""
@@ -57,9 +72,43 @@ def search_for_example(word: str) -> str:
         print(f"Error searching for examples of '{word}': {e}")
         return ""
 
+# Send a prompt to Claude
+def ask_claude(prompt: str, anthropic_client: anthropic.Anthropic, cache: Optional[ResultCache] = None) -> str:
+    """Get Claude's response to a prompt, from the cache if it was asked before.
+    
+    Args:
+        prompt: User prompt
+        anthropic_client: Anthropic client (anything with the same messages.create method)
+        cache: Optional cache of earlier responses
+        
+    Returns:
+        The response text
+    """
+    def create_message() -> str:
+        message = anthropic_client.messages.create(
+            model=CLAUDE_MODEL,
+            max_tokens=1000,
+            temperature=0.2,
+            system=CLAUDE_SYSTEM_PROMPT,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        )
+        return message.content[0].text
+    
+    if cache is None:
+        return create_message()
+    request = {"system": CLAUDE_SYSTEM_PROMPT, "prompt": prompt, "max_tokens": 1000, "temperature": 0.2}
+    return cache.cached("anthropic", CLAUDE_MODEL, request, create_message)
+
 # Process a single word entry with Claude
-def process_word_with_llm(word_entry: List) -> List:
-    """Process a word entry with Claude LLM."""
+def process_word_with_llm(
+    word_entry: List,
+    anthropic_client: anthropic.Anthropic,
+    tavily_client: TavilyClient,
+    cache: Optional[ResultCache] = None
+) -> List:
+    """Process a word entry with Claude LLM, searching for an example if Claude gave none."""
     # Extract word data
     gujarati_word = word_entry[0]
     ipa = word_entry[1] if len(word_entry) > 1 else ""
@@ -89,92 +138,149 @@ def process_word_with_llm(word_entry: List) -> List:
     EXAMPLE: [example sentence in Gujarati]
     """
     
-    # Call Claude API
-    try:
-        message = anthropic_client.messages.create(
-            model="claude-3-opus-20240229",
-            max_tokens=1000,
-            temperature=0.2,
-            system="You are a linguistic expert in Gujarati. Provide accurate, well-formatted responses.",
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        
-        response = message.content[0].text
-        
-        # Parse Claude's response
-        cleaned_ipa = extract_field(response, "IPA")
-        phonetic = extract_field(response, "PHONETIC")
-        cleaned_definition = extract_field(response, "DEFINITION")
-        example = extract_field(response, "EXAMPLE")
-        
-        # If no example was provided, try to find one via web search
-        if not example:
-            example = search_for_example(gujarati_word)
-        
-        # Ensure we have values for all fields (fallback to original if missing)
-        cleaned_word = gujarati_word
-        cleaned_ipa = cleaned_ipa or ipa
-        phonetic = phonetic or ipa_alt
-        cleaned_pos = pos
-        cleaned_definition = cleaned_definition or definition
-        
-        # Return updated word entry
-        return [cleaned_word, cleaned_ipa, phonetic, cleaned_pos, cleaned_definition, example]
+    # Call Claude API; errors are handled by the caller
+    response = ask_claude(prompt, anthropic_client, cache)
     
-    except Exception as e:
-        print(f"Error processing word '{gujarati_word}': {e}")
-        # Add empty example if not present in original
-        if len(word_entry) <= 5:
-            word_entry.append("")
-        return word_entry
+    # Parse Claude's response
+    cleaned_ipa = extract_field(response, "IPA")
+    phonetic = extract_field(response, "PHONETIC")
+    cleaned_definition = extract_field(response, "DEFINITION")
+    example = extract_field(response, "EXAMPLE")
+    
+    # If no example was provided, try to find one via web search
+    if not example:
+        example = search_for_example(gujarati_word, tavily_client, cache)
+    
+    # Ensure we have values for all fields (fallback to original if missing)
+    cleaned_word = gujarati_word
+    cleaned_ipa = cleaned_ipa or ipa
+    phonetic = phonetic or ipa_alt
+    cleaned_pos = pos
+    cleaned_definition = cleaned_definition or definition
+    
+    # Return updated word entry
+    return [cleaned_word, cleaned_ipa, phonetic, cleaned_pos, cleaned_definition, example]
 
-# Process a batch of words
-def process_batch(batch: Dict[str, List], batch_size: int = 10) -> Dict[str, List]:
-    """Process a batch of words with rate limiting."""
-    updated_batch = {}
-    for i, (word_id, word_entry) in enumerate(tqdm(batch.items(), desc=f"Processing batch of {len(batch)} words")):
-        updated_entry = process_word_with_llm(word_entry)
-        updated_batch[word_id] = updated_entry
+# Process the words that changed since the last run
+def process_words(
+    items: List[Tuple[str, List]],
+    run: PipelineRun,
+    anthropic_client: anthropic.Anthropic,
+    tavily_client: TavilyClient,
+    cache: Optional[ResultCache] = None,
+    delay: float = DELAY_BETWEEN_CALLS,
+    progress: bool = True
+):
+    """
+    Process words with rate limiting, journaling each one as it completes.
+    
+    Args:
+        items: (word ID, word entry) pairs
+        run: Pipeline run journaling the results
+        anthropic_client: Anthropic client
+        tavily_client: Tavily client
+        cache: Optional cache of earlier responses
+        delay: Seconds to wait after a word that called the APIs
+        progress: Whether to show a progress bar
+    """
+    for i, (word_id, word_entry) in enumerate(tqdm(items, desc=f"Processing {len(items)} words", disable=not progress)):
+        misses = cache.misses if cache is not None else 0
+        try:
+            updated_entry = process_word_with_llm(word_entry, anthropic_client, tavily_client, cache)
+            run.record(word_id, word_entry, updated_entry)
+        except Exception as e:
+            print(f"Error processing word '{word_entry[0]}': {e}")
+            # Keep the original entry, adding an empty example if not present,
+            # and retry the word on the next run
+            fallback_entry = list(word_entry)
+            if len(fallback_entry) <= 5:
+                fallback_entry.append("")
+            run.record(word_id, word_entry, fallback_entry, complete=False)
         
-        # Rate limiting to avoid API throttling (except for the last item in batch)
-        if i < len(batch) - 1:
-            time.sleep(0.5)
+        # Rate limiting to avoid API throttling (except for the last word,
+        # and words answered from the cache)
+        if i < len(items) - 1 and (cache is None or cache.misses > misses):
+            time.sleep(delay)
+
+def enhance(
+    items: List[Tuple[str, List]],
+    anthropic_client: anthropic.Anthropic,
+    tavily_client: TavilyClient,
+    output_file: str = OUTPUT_FILE,
+    cache: Optional[ResultCache] = None,
+    delay: float = DELAY_BETWEEN_CALLS,
+    progress: bool = True
+) -> Dict:
+    """
+    Process the words that aren't journaled yet, then write the output.
     
-    return updated_batch
+    Words already processed from the same input by an earlier (possibly
+    interrupted) run are taken from the journal. The clients are passed in,
+    so local fakes can stand in for Anthropic and Tavily.
+    
+    Args:
+        items: (word ID, word entry) pairs, in output order
+        anthropic_client: Anthropic client
+        tavily_client: Tavily client
+        output_file: Path of the enhanced data
+        cache: Optional cache of earlier responses
+        delay: Seconds to wait after a word that called the APIs
+        progress: Whether to show a progress bar
+        
+    Returns:
+        Report with the "output" written, the "pending", "processed",
+        "reused" and "incomplete" word counts and the "seconds" spent in the
+        prepare, process and save stages
+    """
+    seconds = {}
+    start = time.perf_counter()
+    run = PipelineRun(output_file)
+    todo = run.pending(items)
+    seconds["prepare"] = time.perf_counter() - start
+    print(f"{run.reused} words unchanged since the last run, {len(todo)} to process")
+    
+    start = time.perf_counter()
+    process_words(todo, run, anthropic_client, tavily_client, cache, delay, progress)
+    seconds["process"] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    updated_data = run.finish(items)
+    seconds["save"] = time.perf_counter() - start
+    
+    return {
+        "output": updated_data,
+        "pending": len(todo),
+        "processed": run.processed,
+        "reused": run.reused,
+        "incomplete": run.incomplete,
+        "seconds": seconds,
+    }
 
 # Main function
 def main():
-    input_file = "data/gujarati_words.json"
-    output_file = "data/gujarati_words_enhanced.json"
-    batch_size = 10  # Number of words to process in each batch
-    
-    print(f"Loading data from {input_file}...")
-    data = load_data(input_file)
+    print(f"Loading data from {INPUT_FILE}...")
+    data = load_data(INPUT_FILE)
     total_words = len(data)
     print(f"Loaded {total_words} words")
     
-    # Process words in batches
-    updated_data = {}
     items = list(data.items())
     
     # For testing with a small subset, uncomment the following line:
     # items = items[:20]  # Process only first 20 words for testing
     
-    for i in range(0, len(items), batch_size):
-        batch = dict(items[i:i+batch_size])
-        print(f"\nProcessing batch {i//batch_size + 1}/{(len(items) + batch_size - 1)//batch_size}")
-        batch_results = process_batch(batch, batch_size)
-        updated_data.update(batch_results)
-        
-        # Save intermediate results after each batch
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(updated_data, f, ensure_ascii=False, indent=2)
-        print(f"Intermediate results saved to {output_file} ({len(updated_data)}/{total_words} words processed)")
+    # Identical prompts (e.g. repeated headwords) are answered from the cache
+    cache = ResultCache()
+    anthropic_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    tavily_client = TavilyClient(api_key=TAVILY_API_KEY)
+    report = enhance(items, anthropic_client, tavily_client, OUTPUT_FILE, cache)
     
-    print(f"\nProcessing complete. Final data saved to {output_file}")
-    print(f"Processed {len(updated_data)}/{total_words} words")
+    print(f"\nProcessing complete. Final data saved to {OUTPUT_FILE}")
+    print(f"Processed {report['processed']} words, reused {report['reused']}, "
+          f"{report['incomplete']} failed and retried next run")
+    print(f"Output has {len(report['output'])}/{total_words} words")
+    cache_stats = cache.stats()
+    print(f"API cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    cache.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Find near-duplicate definitions, examples and translations in a data file.
+
+Each field is shingled into character 4-grams and hashed into a MinHash
+signature, and LSH banding only compares entries whose signatures collide,
+so the run time grows about linearly with the number of entries. Pairs at
+or above the threshold are grouped into clusters and written to a report.
+The most similar entries of each entry are written next to the data file,
+where the API picks them up as the "related" list of each word (on start
+or through POST /admin/reload).
+"""
+
+import argparse
+import time
+from pipeline.changelog import load_data
+from pipeline.files import write_json_atomic
+from pipeline.similarity import (
+    FIELDS, MAX_RELATED, THRESHOLD, cluster_pairs, find_similar_pairs, related_entries, related_path
+)
+
+# Constants
+DATA_FILE = "data/gujarati_words_google_enhanced.json"
+REPORT_FILE = "data/duplicates_report.json"
+
+
+def main():
+    """Main function to find near-duplicate entries."""
+    parser = argparse.ArgumentParser(description="Report near-duplicate entries and precompute related entries")
+    parser.add_argument("--data-file", default=DATA_FILE, help="Data file to check")
+    parser.add_argument("--output", default=REPORT_FILE, help="Path of the cluster report")
+    parser.add_argument("--fields", nargs="+", choices=list(FIELDS), default=list(FIELDS), help="Fields to compare")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="Minimum estimated Jaccard similarity")
+    parser.add_argument("--max-related", type=int, default=MAX_RELATED, help="Related entries kept per word")
+    parser.add_argument("--report-only", action="store_true", help="Don't write the related entries file")
+    args = parser.parse_args()
+    
+    # Writes made through the API are still in the change log
+    data = load_data(args.data_file)
+    
+    start = time.perf_counter()
+    pairs = find_similar_pairs(data, args.fields, args.threshold)
+    clusters = {field: cluster_pairs(field_pairs) for field, field_pairs in pairs.items()}
+    elapsed = time.perf_counter() - start
+    
+    report = {
+        "data_file": args.data_file,
+        "entries": len(data),
+        "threshold": args.threshold,
+        "seconds": round(elapsed, 3),
+        "clusters": clusters,
+    }
+    write_json_atomic(report, args.output)
+    
+    print(f"Compared {len(data)} entries in {elapsed:.2f}s")
+    for field, field_clusters in clusters.items():
+        duplicates = sum(len(cluster["ids"]) for cluster in field_clusters)
+        print(f"  {field}: {len(pairs[field])} similar pairs in {len(field_clusters)} clusters ({duplicates} entries)")
+        for cluster in field_clusters[:3]:
+            texts = [data[word_id][FIELDS[field]][:40] for word_id in cluster["ids"][:3]]
+            print(f"    {len(cluster['ids'])} entries, similarity {cluster['min_similarity']}-{cluster['max_similarity']}: {texts}")
+    print(f"Report saved to {args.output}")
+    
+    if not args.report_only:
+        related = related_entries(pairs, args.max_related)
+        path = related_path(args.data_file)
+        write_json_atomic({"threshold": args.threshold, "fields": args.fields, "related": related}, path)
+        print(f"Related entries of {len(related)} words saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,10 @@
 """
 Script to fix Gujarati Unicode spelling issues using Gemini API with Google grounding.
 
-This script identifies words with potential Unicode issues (like vowel signs at the start)
-and uses Gemini to fix the Gujarati word, pronunciation (IPA), and romanization.
+This script identifies words with potential Unicode issues (like vowel signs at the start
+or doubled vowel signs), either by checking the headwords with pipeline.validate or from
+a report it wrote, and uses Gemini to fix the Gujarati word, pronunciation (IPA), and
+romanization.
 """
 
 import json
@@ -11,57 +13,32 @@ import os
 import time
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, Iterator, List, Optional, Tuple, Set
 from tqdm import tqdm
 from google import genai
 from google.genai import types
+from pipeline.cache import ResultCache
+from pipeline.changelog import load_data, save_data
+from pipeline.files import write_json_atomic
+from pipeline.ratelimit import AdaptiveRateLimiter, is_rate_limited
+from pipeline.validate import check_gujarati, read_report
 
 # Constants
 INPUT_FILE = "data/gujarati_words_google_enhanced.json"
 OUTPUT_FILE = "data/gujarati_words_google_enhanced.json"  # Overwrite in place
 BACKUP_FILE = "data/gujarati_words_google_enhanced_backup.json"
 PROGRESS_FILE = "data/fix_progress.json"
-BATCH_SIZE = 10  # Process in batches
-DELAY_BETWEEN_CALLS = 1.5  # Seconds between API calls
+DEFAULT_MODEL = "gemini-2.5-flash-lite"
+BATCH_SIZE = 10  # Entries per Gemini request
+CONCURRENCY = 4  # Requests in flight
+SAVE_INTERVAL = 10  # Entries between progress saves
+DELAY_BETWEEN_CALLS = 1.5  # Seconds between retries when no rate limiter is used
+REQUEST_RATE = 1 / DELAY_BETWEEN_CALLS  # Initial requests per second
+MAX_REQUEST_RATE = 5.0  # The limiter probes up to this many requests per second
 MAX_RETRIES = 3
-
-# Gujarati vowel signs (matras) that should NOT appear at the start of a word
-GUJARATI_VOWEL_SIGNS = set([
-    '\u0abe',  # ા (aa)
-    '\u0abf',  # િ (i)
-    '\u0ac0',  # ી (ii)
-    '\u0ac1',  # ુ (u)
-    '\u0ac2',  # ૂ (uu)
-    '\u0ac3',  # ૃ (vocalic r)
-    '\u0ac4',  # ૄ (vocalic rr)
-    '\u0ac5',  # ૅ (candra e)
-    '\u0ac7',  # ે (e)
-    '\u0ac8',  # ૈ (ai)
-    '\u0ac9',  # ૉ (candra o)
-    '\u0acb',  # ો (o)
-    '\u0acc',  # ૌ (au)
-    '\u0acd',  # ્ (virama/halant)
-])
-
-# Gujarati anusvara, visarga, and other signs that shouldn't start words
-GUJARATI_COMBINING_SIGNS = set([
-    '\u0a82',  # ં (anusvara)
-    '\u0a83',  # ઃ (visarga)
-])
-
-
-def load_json(file_path: str) -> Dict:
-    """Load JSON file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-
-def save_json(data: Dict, file_path: str):
-    """Save JSON file."""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
+MAX_RATE_LIMIT_RETRIES = 8  # Rate-limited (429) attempts per request before giving up
 
 def has_unicode_issue(word: str) -> bool:
     """
@@ -69,26 +46,30 @@ def has_unicode_issue(word: str) -> bool:
     
     Common issues:
     1. Vowel signs (matras) at the start of a word
-    2. Combining marks without a base character
+    2. Combining marks without a base character, or following another sign
+    3. A virama at the end of the word, or stray zero-width joiners
+    4. Letters of another script, or UTF-8 decoded as Latin-1
     """
-    if not word:
-        return False
-    
-    first_char = word[0]
-    
-    # Check if word starts with a vowel sign (matra)
-    if first_char in GUJARATI_VOWEL_SIGNS:
-        return True
-    
-    # Check if word starts with combining signs
-    if first_char in GUJARATI_COMBINING_SIGNS:
-        return True
-    
-    return False
+    return bool(check_gujarati(word))
 
 
-def find_problematic_entries(data: Dict) -> List[str]:
-    """Find all entries with potential Unicode issues."""
+def find_problematic_entries(data: Dict, report_file: Optional[str] = None) -> List[str]:
+    """
+    Find all entries with potential Unicode issues.
+    
+    Args:
+        data: Word ID -> entry
+        report_file: Optional report written by pipeline.validate; the
+            entries with headword issues are taken from it instead of
+            checking the headwords again
+            
+    Returns:
+        IDs of the entries, in data order
+    """
+    if report_file:
+        reported = {issue["id"] for issue in read_report(report_file) if issue["field"] == "word"}
+        return [word_id for word_id in data if word_id in reported]
+    
     problematic = []
     
     for word_id, entry in data.items():
@@ -108,37 +89,21 @@ def load_progress() -> Set[str]:
     return set()
 
 
-def save_progress(fixed_ids: Set[str]):
+def save_progress(fixed_ids: Set[str], progress_file: str = PROGRESS_FILE):
     """Save progress to file."""
-    with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
+    with open(progress_file, 'w', encoding='utf-8') as f:
         json.dump(list(fixed_ids), f)
 
 
-def fix_entry_with_gemini(
-    client: genai.Client,
-    word_id: str,
-    entry: List,
-    model: str = "gemini-2.5-flash-lite"
-) -> Optional[List]:
-    """
-    Use Gemini with Google grounding to fix a word entry.
-    
-    Args:
-        client: The Gemini API client
-        word_id: The word ID
-        entry: The word entry [gujarati, ipa, romanization, pos, definition, ...]
-        model: The Gemini model to use
-        
-    Returns:
-        Fixed entry or None if failed
-    """
+def build_entry_prompt(entry: List) -> str:
+    """Build the prompt asking Gemini to fix a single entry."""
     gujarati_word = entry[0]
     current_ipa = entry[1] if len(entry) > 1 else ""
     current_romanization = entry[2] if len(entry) > 2 else ""
     definition = entry[4] if len(entry) > 4 else ""
     example_gujarati = entry[5] if len(entry) > 5 else ""
     
-    prompt = f"""You are a Gujarati language expert. Fix the following Gujarati word entry that has Unicode encoding issues.
+    return f"""You are a Gujarati language expert. Fix the following Gujarati word entry that has Unicode encoding issues.
 
 The word "{gujarati_word}" appears to have a malformed Unicode representation (likely a vowel sign at the beginning without a consonant).
 
@@ -161,7 +126,121 @@ IMPORTANT:
 Respond in this exact JSON format only, no other text:
 {{"gujarati": "corrected word", "ipa": "[ipa.here]", "romanization": "latin text"}}"""
 
-    for attempt in range(MAX_RETRIES):
+
+def build_batch_prompt(items: List[Tuple[str, List]]) -> str:
+    """Build the prompt asking Gemini to fix several entries at once.
+    
+    Args:
+        items: (word ID, entry) pairs to fix
+        
+    Returns:
+        Prompt asking for a JSON array with one object per entry, keyed by ID
+    """
+    entries = [
+        {
+            "id": word_id,
+            "word": entry[0],
+            "ipa": entry[1] if len(entry) > 1 else "",
+            "romanization": entry[2] if len(entry) > 2 else "",
+            "definition": entry[4] if len(entry) > 4 else "",
+            "example": entry[5] if len(entry) > 5 else "",
+        }
+        for word_id, entry in items
+    ]
+    
+    return f"""You are a Gujarati language expert. Fix the following Gujarati word entries that have Unicode encoding issues.
+
+Each "word" appears to have a malformed Unicode representation (likely a vowel sign at the beginning without a consonant). The current IPA pronunciation, romanization, definition and example usage of each entry are context clues.
+
+Entries:
+{json.dumps(entries, ensure_ascii=False, indent=2)}
+
+For every entry, please provide the CORRECT versions:
+1. The correctly spelled Gujarati word (proper Unicode)
+2. The IPA pronunciation in square brackets like [ipa.here]
+3. The romanization (transliteration to Latin script)
+
+IMPORTANT: 
+- Use Google Search to verify the correct Gujarati spelling if needed
+- The vowel sign at the start should be attached to or follow a consonant
+- For example, "િનચોવવું" should be "નિચોવવું" (nichōvvuṃ)
+- Copy the "id" of each entry unchanged
+
+Respond with a JSON array in this exact format only, one object per entry, no other text:
+[{{"id": "entry id", "gujarati": "corrected word", "ipa": "[ipa.here]", "romanization": "latin text"}}]"""
+
+
+def entry_request(entry: List) -> Dict:
+    """Get the cache request of a single-entry fix."""
+    return {"prompt": build_entry_prompt(entry), "tools": ["google_search"], "temperature": 0.1}
+
+
+def extract_json(response_text: str):
+    """
+    Parse the JSON in a Gemini response.
+    
+    Raises:
+        json.JSONDecodeError: If the response holds no valid JSON
+    """
+    # Handle potential markdown code blocks
+    if "```json" in response_text:
+        json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
+        if json_match:
+            response_text = json_match.group(1)
+    elif "```" in response_text:
+        json_match = re.search(r'```\s*(.*?)\s*```', response_text, re.DOTALL)
+        if json_match:
+            response_text = json_match.group(1)
+    
+    return json.loads(response_text)
+
+
+def is_valid_fix(result) -> bool:
+    """Check that a fix has all fields and the corrected word no longer has a Unicode issue."""
+    if not isinstance(result, dict):
+        return False
+    for field in ("gujarati", "ipa", "romanization"):
+        if not isinstance(result.get(field), str) or not result[field].strip():
+            return False
+    return not has_unicode_issue(result["gujarati"])
+
+
+def apply_fix(entry: List, result: Dict) -> List:
+    """Get a copy of an entry with the fixed word, IPA and romanization."""
+    fixed_entry = list(entry)  # Copy original
+    fixed_entry[0] = result["gujarati"]
+    fixed_entry[1] = result["ipa"]
+    fixed_entry[2] = result["romanization"]
+    return fixed_entry
+
+
+def generate(
+    client: genai.Client,
+    model: str,
+    prompt: str,
+    limiter: Optional[AdaptiveRateLimiter] = None
+) -> str:
+    """
+    Send a grounded prompt to Gemini, pacing it with a rate limiter.
+    
+    Rate-limited (429) requests slow the limiter down and are retried.
+    
+    Args:
+        client: The Gemini API client
+        model: The Gemini model to use
+        prompt: Prompt to send
+        limiter: Optional limiter shared by all requests
+        
+    Returns:
+        The response text
+        
+    Raises:
+        Exception: If the request failed, or was still rate limited after
+            MAX_RATE_LIMIT_RETRIES retries
+    """
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        if limiter is not None:
+            limiter.acquire()
         try:
             response = client.models.generate_content(
                 model=model,
@@ -171,49 +250,294 @@ Respond in this exact JSON format only, no other text:
                     temperature=0.1,  # Low temperature for more consistent results
                 )
             )
+        except Exception as e:
+            if limiter is None or not is_rate_limited(e) or attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            limiter.on_rate_limited()
+            continue
+        if limiter is not None:
+            limiter.on_success()
+        return response.text.strip()
+
+
+def fix_entry_with_gemini(
+    client: genai.Client,
+    word_id: str,
+    entry: List,
+    model: str = DEFAULT_MODEL,
+    cache: Optional[ResultCache] = None,
+    limiter: Optional[AdaptiveRateLimiter] = None
+) -> Optional[List]:
+    """
+    Use Gemini with Google grounding to fix a word entry.
+    
+    Args:
+        client: The Gemini API client
+        word_id: The word ID
+        entry: The word entry [gujarati, ipa, romanization, pos, definition, ...]
+        model: The Gemini model to use
+        cache: Optional cache of earlier responses; only responses that
+            parsed are stored, so bad ones are retried
+        limiter: Optional rate limiter pacing the requests
+        
+    Returns:
+        Fixed entry or None if failed
+    """
+    cached_text = cache.get("gemini", model, entry_request(entry)) if cache is not None else None
+    return fix_entry_with_retries(client, entry, cached_text, model, cache, limiter)
+
+
+def fix_entry_with_retries(
+    client: genai.Client,
+    entry: List,
+    cached_text: Optional[str],
+    model: str = DEFAULT_MODEL,
+    cache: Optional[ResultCache] = None,
+    limiter: Optional[AdaptiveRateLimiter] = None
+) -> Optional[List]:
+    """
+    Fix a word entry whose cached response has already been looked up.
+    
+    The cached response is tried first; Gemini is asked when there is none
+    or it doesn't validate, up to MAX_RETRIES attempts in all.
+    
+    Args:
+        client: The Gemini API client
+        entry: The word entry [gujarati, ipa, romanization, pos, definition, ...]
+        cached_text: Cached response for the entry, or None
+        model: The Gemini model to use
+        cache: Optional cache valid responses are stored in
+        limiter: Optional rate limiter pacing the requests
+        
+    Returns:
+        Fixed entry or None if failed
+    """
+    gujarati_word = entry[0]
+    request = entry_request(entry)
+    
+    for attempt in range(MAX_RETRIES):
+        response_text = ""
+        try:
+            if cached_text is not None:
+                response_text = cached_text
+                cached_text = None
+            else:
+                response_text = generate(client, model, request["prompt"], limiter)
             
-            # Extract the response text
-            response_text = response.text.strip()
-            
-            # Try to parse JSON from response
-            # Handle potential markdown code blocks
-            if "```json" in response_text:
-                json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
-                if json_match:
-                    response_text = json_match.group(1)
-            elif "```" in response_text:
-                json_match = re.search(r'```\s*(.*?)\s*```', response_text, re.DOTALL)
-                if json_match:
-                    response_text = json_match.group(1)
-            
-            # Parse the JSON
-            result = json.loads(response_text)
+            result = extract_json(response_text)
             
             # Validate the result
-            if "gujarati" not in result or "ipa" not in result or "romanization" not in result:
-                print(f"  Warning: Incomplete response for {gujarati_word}")
+            if not is_valid_fix(result):
+                print(f"  Warning: Incomplete or still malformed response for {gujarati_word}")
                 continue
             
-            # Create the fixed entry
-            fixed_entry = list(entry)  # Copy original
-            fixed_entry[0] = result["gujarati"]
-            fixed_entry[1] = result["ipa"]
-            fixed_entry[2] = result["romanization"]
-            
-            return fixed_entry
-            
+            if cache is not None:
+                cache.put("gemini", model, request, response_text)
+            return apply_fix(entry, result)
+        
         except json.JSONDecodeError as e:
             print(f"  JSON parse error (attempt {attempt + 1}): {e}")
             print(f"  Response was: {response_text[:200]}...")
         except Exception as e:
             print(f"  Error (attempt {attempt + 1}): {e}")
         
-        if attempt < MAX_RETRIES - 1:
+        if attempt < MAX_RETRIES - 1 and limiter is None:
             time.sleep(DELAY_BETWEEN_CALLS)
     
     return None
 
 
+def fix_batch_with_gemini(
+    client: genai.Client,
+    items: List[Tuple[str, List]],
+    model: str = DEFAULT_MODEL,
+    cache: Optional[ResultCache] = None,
+    limiter: Optional[AdaptiveRateLimiter] = None
+) -> Dict[str, Optional[List]]:
+    """
+    Use Gemini with Google grounding to fix several word entries in one request.
+    
+    Entries with a cached single-entry response are fixed from the cache.
+    The others are sent in one prompt and matched back by ID; entries that
+    are missing from the response or fail validation are retried one by one
+    with fix_entry_with_retries(). The cache is looked up once per entry.
+    Valid fixes are cached under the
+    single-entry request, so they are reused whatever batch an entry is in.
+    
+    Args:
+        client: The Gemini API client
+        items: (word ID, entry) pairs to fix
+        model: The Gemini model to use
+        cache: Optional cache of earlier responses
+        limiter: Optional rate limiter pacing the requests
+        
+    Returns:
+        Word ID -> fixed entry, or None if it couldn't be fixed
+    """
+    results: Dict[str, Optional[List]] = {}
+    todo = []
+    for word_id, entry in items:
+        cached_text = cache.get("gemini", model, entry_request(entry)) if cache is not None else None
+        if cached_text is not None:
+            results[word_id] = fix_entry_with_retries(client, entry, cached_text, model, cache, limiter)
+        else:
+            todo.append((word_id, entry))
+    
+    fixes = {}
+    if len(todo) > 1:
+        try:
+            parsed = extract_json(generate(client, model, build_batch_prompt(todo), limiter))
+            if not isinstance(parsed, list):
+                raise ValueError("response is not a JSON array")
+            fixes = {str(result.get("id")): result for result in parsed if isinstance(result, dict)}
+        except Exception as e:
+            print(f"  Batch of {len(todo)} failed, retrying entries individually: {e}")
+    
+    for word_id, entry in todo:
+        result = fixes.get(word_id)
+        if is_valid_fix(result):
+            fix = {field: result[field] for field in ("gujarati", "ipa", "romanization")}
+            if cache is not None:
+                cache.put("gemini", model, entry_request(entry), json.dumps(fix, ensure_ascii=False))
+            results[word_id] = apply_fix(entry, fix)
+        else:
+            # Known to be uncached, so the retry doesn't look it up again
+            results[word_id] = fix_entry_with_retries(client, entry, None, model, cache, limiter)
+    return results
+
+
+def fix_entries(
+    client: genai.Client,
+    data: Dict,
+    word_ids: List[str],
+    batch_size: int = BATCH_SIZE,
+    concurrency: int = CONCURRENCY,
+    model: str = DEFAULT_MODEL,
+    cache: Optional[ResultCache] = None,
+    limiter: Optional[AdaptiveRateLimiter] = None
+) -> Iterator[Tuple[str, Optional[List]]]:
+    """
+    Fix entries in batches, sending up to `concurrency` batches at a time.
+    
+    The client is only used through client.models.generate_content(), so a
+    local fake can stand in for genai.Client.
+    
+    Args:
+        client: The Gemini API client
+        data: Word ID -> entry
+        word_ids: IDs of the entries to fix
+        batch_size: Entries per request; 1 sends one request per entry
+        concurrency: Number of batches in flight
+        model: The Gemini model to use
+        cache: Optional cache of earlier responses
+        limiter: Optional rate limiter shared by all requests
+        
+    Yields:
+        (word ID, fixed entry or None) pairs, as batches complete
+    """
+    batches = [
+        [(word_id, data[word_id]) for word_id in word_ids[start:start + batch_size]]
+        for start in range(0, len(word_ids), batch_size)
+    ]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(fix_batch_with_gemini, client, batch, model, cache, limiter)
+            for batch in batches
+        ]
+        for future in as_completed(futures):
+            yield from future.result().items()
+
+
+def fix_and_save(
+    client: genai.Client,
+    data: Dict,
+    word_ids: List[str],
+    fixed_ids: Set[str],
+    batch_size: int = BATCH_SIZE,
+    concurrency: int = CONCURRENCY,
+    output_file: str = OUTPUT_FILE,
+    progress_file: str = PROGRESS_FILE,
+    cache: Optional[ResultCache] = None,
+    progress: bool = True
+) -> Dict:
+    """
+    Fix entries under an adaptive rate limiter, saving the data and progress periodically.
+    
+    Batches keep running while progress is saved. The data is saved with
+    its change log folded in, so writes made through the API before the
+    run don't override the fixes. The client is passed in, so a local fake
+    can stand in for genai.Client.
+    
+    Args:
+        client: The Gemini API client
+        data: Word ID -> entry; fixed entries are replaced in place
+        word_ids: IDs of the entries to fix
+        fixed_ids: IDs fixed so far; fixed entries are added
+        batch_size: Entries per request
+        concurrency: Number of batches in flight
+        output_file: Data file the data is saved to
+        progress_file: Path the fixed IDs are saved to
+        cache: Optional cache of earlier responses
+        progress: Whether to show a progress bar
+        
+    Returns:
+        Report with the "fixed" and "failed" entry counts, the "limiter"
+        stats and the "seconds" spent in the process and save stages
+    """
+    limiter = AdaptiveRateLimiter(REQUEST_RATE, burst=concurrency, max_rate=MAX_REQUEST_RATE)
+    fixed_count = 0
+    failed_count = 0
+    save_seconds = 0.0
+    start_time = time.perf_counter()
+    
+    results = fix_entries(client, data, word_ids, batch_size, concurrency, cache=cache, limiter=limiter)
+    for i, (word_id, fixed_entry) in enumerate(tqdm(results, total=len(word_ids), desc="Fixing entries", disable=not progress)):
+        original_word = data[word_id][0]
+        
+        if fixed_entry:
+            data[word_id] = fixed_entry
+            fixed_ids.add(word_id)
+            fixed_count += 1
+            
+            # Show progress
+            if fixed_count % 10 == 0:
+                print(f"\n  Fixed: {original_word} -> {fixed_entry[0]}")
+        else:
+            failed_count += 1
+            print(f"\n  Failed to fix: {original_word}")
+        
+        # Save progress periodically
+        if (i + 1) % SAVE_INTERVAL == 0:
+            save_start = time.perf_counter()
+            save_data(data, output_file)
+            save_progress(fixed_ids, progress_file)
+            save_seconds += time.perf_counter() - save_start
+            print(f"\n  Saved progress: {fixed_count} fixed, {failed_count} failed")
+    
+    # Final save
+    save_start = time.perf_counter()
+    save_data(data, output_file)
+    save_progress(fixed_ids, progress_file)
+    save_seconds += time.perf_counter() - save_start
+    
+    return {
+        "fixed": fixed_count,
+        "failed": failed_count,
+        "limiter": limiter.stats(),
+        "seconds": {"process": time.perf_counter() - start_time - save_seconds, "save": save_seconds},
+    }
+
+
+def positive_int(value: str) -> int:
+    """Parse a command line argument that must be a whole number of at least 1."""
+    import argparse
+    
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main():
     """Main function to fix Gujarati word entries."""
     import argparse
@@ -221,6 +545,10 @@ def main():
     parser = argparse.ArgumentParser(description="Fix Gujarati Unicode spelling issues using Gemini API")
     parser.add_argument("--dry-run", action="store_true", help="Only scan and report issues, don't fix")
     parser.add_argument("--limit", type=int, default=None, help="Limit number of entries to fix")
+    parser.add_argument("--no-cache", action="store_true", help="Don't reuse or store Gemini responses")
+    parser.add_argument("--batch-size", type=positive_int, default=BATCH_SIZE, help="Entries per Gemini request (1 to fix entries one by one)")
+    parser.add_argument("--report", default=None, help="Fix the headwords listed in a pipeline.validate report")
+    parser.add_argument("--concurrency", type=positive_int, default=CONCURRENCY, help="Number of requests in flight")
     args = parser.parse_args()
     
     # Check for API key (only if not dry-run)
@@ -231,15 +559,15 @@ def main():
         print("Or use --dry-run to scan without fixing")
         sys.exit(1)
     
-    # Load data
+    # Load data, with the writes made through the API
     print(f"Loading data from {INPUT_FILE}...")
-    data = load_json(INPUT_FILE)
+    data = load_data(INPUT_FILE)
     total_words = len(data)
     print(f"Loaded {total_words} words")
     
     # Find problematic entries
-    print("\nScanning for entries with Unicode issues...")
-    problematic_ids = find_problematic_entries(data)
+    print(f"\nScanning for entries with Unicode issues{' in ' + args.report if args.report else ''}...")
+    problematic_ids = find_problematic_entries(data, args.report)
     print(f"Found {len(problematic_ids)} entries with potential issues")
     
     if not problematic_ids:
@@ -264,9 +592,8 @@ def main():
     print("\nExamples of problematic entries:")
     for i, word_id in enumerate(remaining_ids[:10]):
         entry = data[word_id]
-        first_char = entry[0][0]
-        char_code = hex(ord(first_char))
-        print(f"  ID {word_id}: '{entry[0]}' (starts with {char_code}) -> {entry[4][:50] if len(entry) > 4 else 'no definition'}...")
+        issues = ", ".join(sorted({issue for issue, _, _ in check_gujarati(entry[0])}))
+        print(f"  ID {word_id}: '{entry[0]}' ({issues}) -> {entry[4][:50] if len(entry) > 4 else 'no definition'}...")
     
     # Dry run mode - just report
     if args.dry_run:
@@ -281,11 +608,12 @@ def main():
     # Create backup if it doesn't exist
     if not os.path.exists(BACKUP_FILE):
         print(f"\nCreating backup at {BACKUP_FILE}...")
-        save_json(data, BACKUP_FILE)
+        write_json_atomic(data, BACKUP_FILE)
     
     # Initialize Gemini client
     print("\nInitializing Gemini API client...")
     client = genai.Client(api_key=api_key)
+    cache = None if args.no_cache else ResultCache()
     
     # Ask for confirmation
     print(f"\nReady to fix {len(remaining_ids)} entries using Gemini API with Google grounding.")
@@ -295,47 +623,23 @@ def main():
         return
     
     # Process entries
-    print("\nProcessing entries...")
-    fixed_count = 0
-    failed_count = 0
-    
-    for i, word_id in enumerate(tqdm(remaining_ids, desc="Fixing entries")):
-        entry = data[word_id]
-        original_word = entry[0]
-        
-        # Fix the entry
-        fixed_entry = fix_entry_with_gemini(client, word_id, entry)
-        
-        if fixed_entry:
-            data[word_id] = fixed_entry
-            fixed_ids.add(word_id)
-            fixed_count += 1
-            
-            # Show progress
-            if fixed_count % 10 == 0:
-                print(f"\n  Fixed: {original_word} -> {fixed_entry[0]}")
-        else:
-            failed_count += 1
-            print(f"\n  Failed to fix: {original_word}")
-        
-        # Save progress periodically
-        if (i + 1) % BATCH_SIZE == 0:
-            save_json(data, OUTPUT_FILE)
-            save_progress(fixed_ids)
-            print(f"\n  Saved progress: {fixed_count} fixed, {failed_count} failed")
-        
-        # Rate limiting
-        time.sleep(DELAY_BETWEEN_CALLS)
-    
-    # Final save
-    save_json(data, OUTPUT_FILE)
-    save_progress(fixed_ids)
+    print(f"\nProcessing entries ({args.batch_size} per request, {args.concurrency} requests in flight)...")
+    report = fix_and_save(client, data, remaining_ids, fixed_ids, args.batch_size, args.concurrency, cache=cache)
+    fixed_count = report["fixed"]
+    failed_count = report["failed"]
+    elapsed = sum(report["seconds"].values())
     
     print(f"\n{'=' * 50}")
     print(f"Processing complete!")
     print(f"  Fixed: {fixed_count}")
     print(f"  Failed: {failed_count}")
+    print(f"  Throughput: {len(remaining_ids) / elapsed:.2f} entries/s ({elapsed:.1f}s)")
+    print(f"  Request rate: {report['limiter']}")
     print(f"  Output saved to: {OUTPUT_FILE}")
+    if cache is not None:
+        cache_stats = cache.stats()
+        print(f"  Gemini cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+        cache.close()
     
     # Clean up progress file if all done
     if failed_count == 0 and len(remaining_ids) == fixed_count:
@@ -346,4 +650,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
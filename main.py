@@ -1,15 +1,40 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-from app.routers import words
+from app.config import (
+    ADMIN_TOKEN, ADMISSION_ENABLED, DATA_FILE, PROFILING_ENABLED, PROFILING_INTERVAL,
+    PROFILING_MODE, PROFILING_SAMPLE_RATE, WARMUP_ON_STARTUP
+)
+from app.middleware.admission import AdmissionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.routers import admin, export, health, metrics, transliteration, words
+from app.services.admission import admission
+from app.services.profiling import profile_store
+from app.services.warmup import tracker
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the dictionary and build its indexes in the background so the
+    # first request after a deploy doesn't pay for it
+    if WARMUP_ON_STARTUP:
+        tracker.start(DATA_FILE)
+    yield
 
 # Initialize FastAPI application
 app = FastAPI(
     title="Gujarati API",
     description="API for Gujarati language words",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
+# Limit concurrent requests per route class so slow searches can't starve
+# cheap lookups; added first so rejections still get CORS headers and metrics
+if ADMISSION_ENABLED:
+    app.add_middleware(AdmissionMiddleware, controller=admission)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -19,8 +44,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Record per-route latency and response size histograms
+app.add_middleware(MetricsMiddleware)
+
+# Profile sampled requests, or those sending the admin token in X-Profile-Request
+if PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        mode=PROFILING_MODE,
+        sample_rate=PROFILING_SAMPLE_RATE,
+        token=ADMIN_TOKEN,
+        interval=PROFILING_INTERVAL
+    )
+
 # Include routers
 app.include_router(words.router)
+app.include_router(transliteration.router)
+app.include_router(export.router)
+app.include_router(health.router)
+app.include_router(metrics.router)
+app.include_router(admin.router)
 
 # Root endpoint
 @app.get("/")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Move the per-entry audio files into the content-addressed audio store.
+
+Files in audio/words and audio/examples are stored once per distinct text
+and recorded in the store manifest, which the API resolves audio through.
+The data is read with its change log replayed, so the audio of entries
+written through the API is stored too; the data file isn't changed. Files are hard linked into the store, so disk
+space is only freed once the originals are removed with --remove-legacy.
+"""
+
+import argparse
+import os
+from pipeline.audio_store import AUDIO_FIELDS, DEFAULT_VOICE, AudioStore
+from pipeline.changelog import load_data
+
+# Constants
+DATA_FILE = "data/gujarati_words_google_enhanced.json"
+AUDIO_MANIFEST_FILE = "audio/store/manifest.json"
+
+
+def main():
+    """Main function to migrate the audio files."""
+    parser = argparse.ArgumentParser(description="Move per-entry audio files into the content-addressed audio store")
+    parser.add_argument("--data-file", default=DATA_FILE, help="Data file whose audio to migrate")
+    parser.add_argument("--manifest", default=AUDIO_MANIFEST_FILE, help="Manifest of the audio store")
+    parser.add_argument("--copy", action="store_true", help="Copy files instead of hard linking them")
+    parser.add_argument("--remove-legacy", action="store_true", help="Delete the original files once they are stored")
+    args = parser.parse_args()
+    
+    print(f"Loading data from {args.data_file}...")
+    data = load_data(args.data_file)
+    
+    store = AudioStore(args.manifest)
+    migrated = set()
+    legacy_bytes = 0
+    for word_id, entry in data.items():
+        for kind, field in AUDIO_FIELDS.items():
+            path = entry[field] if len(entry) > field else ""
+            text = entry[0] if kind == "word" else (entry[5] if len(entry) > 5 else "")
+            if not path or not text or not os.path.exists(path) or store.key_of(path):
+                continue
+            blob_path = store.add_file(text, "gu", DEFAULT_VOICE, path, link=not args.copy)
+            store.set_entry(word_id, kind, blob_path)
+            if path not in migrated:
+                migrated.add(path)
+                legacy_bytes += os.path.getsize(path)
+    store.save()
+    
+    print(f"Stored {len(migrated)} files ({legacy_bytes / 1e6:.1f} MB) as {len(store.blobs)} blobs "
+          f"({store.total_bytes() / 1e6:.1f} MB) in {store.root}")
+    
+    if args.remove_legacy:
+        for path in migrated:
+            os.remove(path)
+        print(f"Removed {len(migrated)} original files")
+
+
+if __name__ == "__main__":
+    main()
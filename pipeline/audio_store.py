@@ -0,0 +1,203 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from pipeline.files import write_json_atomic
+
+# Audio kinds of an entry, and the entry field holding the path of each
+AUDIO_FIELDS = {"example": 8, "word": 9}
+
+# Voice used by the pipeline's gTTS synthesis (gTTS accent top-level domain)
+DEFAULT_VOICE = "gtts:com"
+
+# Number of locks that synthesis of the same key is serialized on; keys
+# share a lock by hash, so the locks don't grow with the number of texts
+KEY_LOCK_STRIPES = 64
+
+# Synthesis function: (text, file path, language) -> None, raising on failure
+Synthesize = Callable[[str, str, str], None]
+
+
+def audio_key(text: str, lang: str, voice: str) -> str:
+    """Get the content address of the audio for a text.
+    
+    Args:
+        text: Spoken text
+        lang: Language code
+        voice: Voice or TTS engine variant
+        
+    Returns:
+        Hex digest identifying the audio
+    """
+    content = json.dumps([text, lang, voice], ensure_ascii=False)
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class AudioStore:
+    """Content-addressed store of audio files.
+    
+    Each distinct (text, language, voice) is stored once, as a blob named
+    by its hash, so repeated headwords and examples share a file and are
+    synthesized once. The manifest records the text and size of every blob
+    and which blobs belong to each entry.
+    """
+    
+    def __init__(self, manifest_file: str):
+        """Initialize the store and load its manifest.
+        
+        Args:
+            manifest_file: Path of the manifest; blobs are stored next to it
+        """
+        self.manifest_file = manifest_file
+        self.root = str(Path(manifest_file).parent)
+        self.blobs: Dict[str, Dict] = {}  # Key -> {"text", "lang", "voice", "size"}
+        self.entries: Dict[str, Dict[str, str]] = {}  # Entry ID -> {kind: key}
+        self.synthesized = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+        self._key_locks = [threading.Lock() for _ in range(KEY_LOCK_STRIPES)]
+        self.load()
+    
+    def load(self):
+        """Load the manifest, if it exists."""
+        if not os.path.exists(self.manifest_file):
+            return
+        with open(self.manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        self.blobs = manifest.get("blobs", {})
+        self.entries = manifest.get("entries", {})
+    
+    def save(self):
+        """Write the manifest atomically."""
+        Path(self.root).mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            manifest = {"blobs": dict(self.blobs), "entries": dict(self.entries)}
+        write_json_atomic(manifest, self.manifest_file)
+    
+    def blob_path(self, key: str) -> str:
+        """Get the path of a blob; blobs are spread over 256 directories."""
+        return f"{self.root}/blobs/{key[:2]}/{key}.mp3"
+    
+    def add_file(self, text: str, lang: str, voice: str, source_path: str, link: bool = True) -> str:
+        """Store an existing audio file as a blob, unless the blob already exists.
+        
+        Args:
+            text: Spoken text
+            lang: Language code
+            voice: Voice or TTS engine variant
+            source_path: Audio file to store
+            link: Hard link the file instead of copying it, where possible
+            
+        Returns:
+            Path of the blob
+        """
+        key = audio_key(text, lang, voice)
+        path = self.blob_path(key)
+        if self._has_blob(key, text, lang, voice):
+            return path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        try:
+            if not link:
+                raise OSError
+            os.link(source_path, tmp_path)
+        except OSError:
+            with open(source_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                dst.write(src.read())
+        os.replace(tmp_path, path)
+        self._record_blob(key, text, lang, voice, path)
+        return path
+    
+    def synthesize(self, text: str, lang: str, synthesize: Synthesize, voice: str = DEFAULT_VOICE) -> Tuple[str, bool]:
+        """Get the audio for a text, synthesizing it only if it isn't stored yet.
+        
+        Concurrent calls for the same text wait for a single synthesis.
+        
+        Args:
+            text: Text to speak
+            lang: Language code
+            synthesize: Function writing the audio for a text to a file
+            voice: Voice or TTS engine variant the function uses
+            
+        Returns:
+            Tuple of (blob path, whether it was synthesized by this call)
+            
+        Raises:
+            Exception: Whatever the synthesis function raised
+        """
+        key = audio_key(text, lang, voice)
+        with self._key_locks[int(key[:8], 16) % KEY_LOCK_STRIPES]:
+            path = self.blob_path(key)
+            if self._has_blob(key, text, lang, voice):
+                self.reused += 1
+                return path, False
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            # Written to a temporary file so a failed synthesis leaves no partial blob
+            tmp_path = f"{path}.tmp"
+            synthesize(text, tmp_path, lang)
+            os.replace(tmp_path, path)
+            self._record_blob(key, text, lang, voice, path)
+            self.synthesized += 1
+            return path, True
+    
+    def set_entry(self, word_id: str, kind: str, path: Optional[str]):
+        """Record the blob holding an entry's audio of one kind.
+        
+        Args:
+            word_id: Entry ID
+            kind: "word" or "example"
+            path: Blob path, or a path outside the store or None to drop the record
+        """
+        key = self.key_of(path) if path else None
+        with self._lock:
+            kinds = self.entries.setdefault(word_id, {})
+            if key:
+                kinds[kind] = key
+            else:
+                kinds.pop(kind, None)
+            if not kinds:
+                del self.entries[word_id]
+    
+    def key_of(self, path: str) -> Optional[str]:
+        """Get the key of a blob path, or None if the path isn't a blob of this store."""
+        key = Path(path).stem
+        if key in self.blobs and path == self.blob_path(key):
+            return key
+        return None
+    
+    def resolve(self, word_id: str, kind: str, text: Optional[str] = None) -> Optional[str]:
+        """Get the blob path of an entry's audio.
+        
+        Args:
+            word_id: Entry ID
+            kind: "word" or "example"
+            text: Current text of the entry; if given, a blob recorded for
+                different text (the entry was edited since) isn't returned
+                
+        Returns:
+            Blob path, or None if the entry has no matching blob
+        """
+        key = self.entries.get(word_id, {}).get(kind)
+        blob = self.blobs.get(key) if key else None
+        if blob is None or (text is not None and blob["text"] != text):
+            return None
+        return self.blob_path(key)
+    
+    def total_bytes(self) -> int:
+        """Get the total size of the stored blobs."""
+        return sum(blob["size"] for blob in self.blobs.values())
+    
+    def _has_blob(self, key: str, text: str, lang: str, voice: str) -> bool:
+        """Check whether a blob is stored, recording blobs written before a crash."""
+        if not os.path.exists(self.blob_path(key)):
+            return False
+        if key not in self.blobs:
+            # Blobs are renamed into place once complete, so the file is whole
+            self._record_blob(key, text, lang, voice, self.blob_path(key))
+        return True
+    
+    def _record_blob(self, key: str, text: str, lang: str, voice: str, path: str):
+        with self._lock:
+            self.blobs[key] = {"text": text, "lang": lang, "voice": voice, "size": os.path.getsize(path)}
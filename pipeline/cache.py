@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Persistent cache for the results of translation, search and LLM API calls.
+
+Results are stored in SQLite, keyed by provider, model and a hash of the
+request (text or prompt and parameters), so re-running an enrichment
+script only calls the APIs for text that hasn't been processed before.
+Run this module to see the cache statistics or clear it.
+"""
+
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from pipeline.journal import input_hash
+
+# Constants
+CACHE_FILE = "data/api_cache.sqlite"
+MAX_BYTES = 256 * 1024 * 1024  # Least recently used results are evicted beyond this
+EVICT_TO = 0.9  # Fraction of MAX_BYTES left after an eviction
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (provider, model, key)
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+
+class ResultCache:
+    """Content-addressed, size-bounded cache of API results.
+    
+    Values are stored as JSON. The cache can be shared by threads; writes
+    are serialized by a lock.
+    """
+    
+    def __init__(self, path: str = CACHE_FILE, max_bytes: int = MAX_BYTES):
+        """Open the cache, creating it if needed.
+        
+        Args:
+            path: Path of the SQLite database
+            max_bytes: Total size of the cached values above which the least
+                recently used ones are evicted
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+        self._size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+    
+    @staticmethod
+    def key(request: Any) -> str:
+        """Get the cache key of a JSON-serializable request."""
+        return input_hash(request)
+    
+    def get(self, provider: str, model: str, request: Any) -> Optional[Any]:
+        """Get a cached result.
+        
+        Args:
+            provider: API provider, e.g. "anthropic"
+            model: Model or variant of the API
+            request: Text or prompt and parameters the result was produced from
+            
+        Returns:
+            The cached value, or None if there is none
+        """
+        key = self.key(request)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM results WHERE provider = ? AND model = ? AND key = ?",
+                (provider, model, key)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._connection.execute(
+                "UPDATE results SET last_used = ? WHERE provider = ? AND model = ? AND key = ?",
+                (time.time(), provider, model, key)
+            )
+        return json.loads(row[0])
+    
+    def put(self, provider: str, model: str, request: Any, value: Any):
+        """Store a result, evicting the least recently used ones if the cache is full.
+        
+        Args:
+            provider: API provider, e.g. "anthropic"
+            model: Model or variant of the API
+            request: Text or prompt and parameters the result was produced from
+            value: JSON-serializable result
+        """
+        key = self.key(request)
+        content = json.dumps(value, ensure_ascii=False)
+        size = len(content.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size FROM results WHERE provider = ? AND model = ? AND key = ?",
+                (provider, model, key)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (provider, model, key, value, size, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (provider, model, key, content, size, now, now)
+            )
+            self._size += size - (row[0] if row else 0)
+            if self._size > self.max_bytes:
+                self._evict()
+    
+    def cached(self, provider: str, model: str, request: Any, compute: Callable[[], Any]) -> Any:
+        """Get a cached result, computing and storing it on a miss.
+        
+        Args:
+            provider: API provider, e.g. "anthropic"
+            model: Model or variant of the API
+            request: Text or prompt and parameters the result is produced from
+            compute: Function making the API call; its exceptions aren't cached
+            
+        Returns:
+            The cached or computed value
+        """
+        value = self.get(provider, model, request)
+        if value is None:
+            value = compute()
+            self.put(provider, model, request, value)
+        return value
+    
+    def stats(self) -> Dict:
+        """Get the hit and miss counts of this process and the cache contents."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT provider, model, COUNT(*), SUM(size) FROM results GROUP BY provider, model"
+            ).fetchall()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "entries": {f"{provider}/{model}": {"entries": count, "bytes": size} for provider, model, count, size in rows},
+        }
+    
+    def clear(self, provider: Optional[str] = None) -> int:
+        """Delete the cached results, of one provider or all.
+        
+        Args:
+            provider: Only delete the results of this provider
+            
+        Returns:
+            Number of results deleted
+        """
+        with self._lock:
+            if provider:
+                cursor = self._connection.execute("DELETE FROM results WHERE provider = ?", (provider,))
+            else:
+                cursor = self._connection.execute("DELETE FROM results")
+            self._size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            return cursor.rowcount
+    
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+    
+    def _evict(self):
+        """Delete the least recently used results until the cache is below EVICT_TO of its limit."""
+        target = self.max_bytes * EVICT_TO
+        rows = self._connection.execute(
+            "SELECT rowid, size FROM results ORDER BY last_used"
+        )
+        evicted = []
+        for rowid, size in rows:
+            if self._size <= target:
+                break
+            evicted.append((rowid,))
+            self._size -= size
+        self._connection.executemany("DELETE FROM results WHERE rowid = ?", evicted)
+        self.evictions += len(evicted)
+
+
+def main():
+    """Main function to inspect or clear the cache."""
+    parser = argparse.ArgumentParser(description="Show statistics of the API result cache or clear it")
+    parser.add_argument("--cache-file", default=CACHE_FILE, help="Path of the cache database")
+    parser.add_argument("--clear", action="store_true", help="Delete cached results")
+    parser.add_argument("--provider", help="Only clear the results of this provider")
+    args = parser.parse_args()
+    
+    cache = ResultCache(args.cache_file)
+    if args.clear:
+        print(f"Deleted {cache.clear(args.provider)} cached results")
+    print(json.dumps(cache.stats(), indent=2))
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
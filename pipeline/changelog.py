@@ -0,0 +1,254 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from pipeline.files import repair_tail, write_json_atomic
+
+# Operations recorded in the change log
+OP_PUT = "put"  # Create or replace an entry
+OP_DELETE = "delete"  # Remove an entry
+OP_BASE = "base"  # First record after a compaction: version of the base file
+
+# Number of versions a deletion stays in the log after a compaction, so
+# mirrors exporting the changes since an older version still learn of it
+TOMBSTONE_RETENTION = 10000
+
+
+def changelog_path(data_file: str) -> str:
+    """Get the change log path that belongs to a data file.
+    
+    Args:
+        data_file: Path to the JSON data file
+        
+    Returns:
+        Path of the change log, next to the data file
+    """
+    path = Path(data_file)
+    return str(path.with_name(f"{path.stem}.changes.jsonl"))
+
+
+class ChangeLog:
+    """Append-only, fsync'd log of mutations to a data file.
+    
+    Each line is a JSON record with the version it created, the operation,
+    the entry ID and, for puts, the complete new entry. Records are
+    absolute rather than relative, so replaying one twice is harmless.
+    """
+    
+    def __init__(self, path: str):
+        """Initialize the change log.
+        
+        Args:
+            path: Path of the log file (created on first append)
+        """
+        self.path = path
+    
+    def append(self, version: int, op: str, word_id: Optional[str] = None, entry: Optional[List] = None) -> Dict:
+        """Append a record and wait until it is on disk.
+        
+        Args:
+            version: Version created by this change
+            op: OP_PUT, OP_DELETE or OP_BASE
+            word_id: ID of the changed entry, for OP_PUT and OP_DELETE
+            entry: New entry for OP_PUT
+            
+        Returns:
+            The appended record
+        """
+        record = {"version": version, "op": op, "time": round(time.time(), 3)}
+        if word_id is not None:
+            record["id"] = word_id
+        if entry is not None:
+            record["entry"] = entry
+        self._write([record])
+        return record
+    
+    def append_reload(self, version: int, removed: List[str]):
+        """Append the records of a reload and wait until they are on disk.
+        
+        The base record gives the entries changed in the data file their new
+        version; the entries removed from it get delete records, so they are
+        still reported as deleted after a restart.
+        
+        Args:
+            version: Version created by the reload
+            removed: IDs of the entries removed from the data file
+        """
+        now = round(time.time(), 3)
+        records = [{"version": version, "op": OP_BASE, "time": now}]
+        records.extend({"version": version, "op": OP_DELETE, "time": now, "id": word_id} for word_id in removed)
+        self._write(records)
+    
+    def _write(self, records: List[Dict]):
+        """Append records with one fsync, cutting off a torn last line first."""
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with open(self.path, 'ab+') as f:
+            repair_tail(f)
+            f.write(data.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def read(self) -> Iterator[Dict]:
+        """Iterate over the records in the log.
+        
+        A torn last line left by a crash during append is skipped (and cut
+        off by the next append).
+        
+        Yields:
+            Change records, oldest first
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Skipping unreadable change log record at {self.path}:{line_number}")
+    
+    def size(self) -> int:
+        """Get the size of the log file in bytes."""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+    
+    def reset(self, base_version: int, deleted: Optional[Dict[str, int]] = None, tombstones_since: int = 0) -> int:
+        """Replace the log with a record holding the base file version and the recent deletions.
+        
+        Deletions of the last TOMBSTONE_RETENTION versions are kept as
+        delete records; older ones are dropped, and the base record holds
+        the version from which on deletions are complete.
+        
+        Args:
+            base_version: Version the data file now represents
+            deleted: ID -> version of each deletion known so far
+            tombstones_since: Version from which on the known deletions are complete
+            
+        Returns:
+            Version from which on the deletions kept in the log are complete
+        """
+        tombstones_since = max(tombstones_since, base_version - TOMBSTONE_RETENTION)
+        tombstones = sorted(
+            (version, word_id) for word_id, version in (deleted or {}).items() if version > tombstones_since
+        )
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"version": base_version, "op": OP_BASE, "tombstones_since": tombstones_since}) + "\n")
+            for version, word_id in tombstones:
+                f.write(json.dumps({"version": version, "op": OP_DELETE, "id": word_id}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        return tombstones_since
+
+
+def apply_records(data: Dict[str, List], records: Iterator[Dict]) -> Dict:
+    """Apply change records to word data in place.
+    
+    Args:
+        data: Word data loaded from the data file
+        records: Change records, oldest first
+        
+    Returns:
+        Dict with "base_version", "version", "entry_versions" (ID -> version
+        of each changed entry), "deleted" (ID -> version of each deletion)
+        and "tombstones_since" (version from which on "deleted" is complete)
+    """
+    base_version = 1
+    version = base_version
+    tombstones_since = 0
+    entry_versions: Dict[str, int] = {}
+    deleted: Dict[str, int] = {}
+    for record in records:
+        version = max(version, record["version"])
+        word_id = record.get("id")
+        if record["op"] == OP_BASE:
+            base_version = record["version"]
+            # Only set by compactions, not by the base records of reloads
+            tombstones_since = record.get("tombstones_since", tombstones_since)
+        elif record["op"] == OP_PUT:
+            data[word_id] = record["entry"]
+            entry_versions[word_id] = record["version"]
+            deleted.pop(word_id, None)
+        elif record["op"] == OP_DELETE:
+            data.pop(word_id, None)
+            entry_versions.pop(word_id, None)
+            deleted[word_id] = record["version"]
+    return {
+        "base_version": base_version,
+        "version": version,
+        "entry_versions": entry_versions,
+        "deleted": deleted,
+        "tombstones_since": tombstones_since,
+    }
+
+
+def load_data(data_file: str) -> Dict[str, List]:
+    """Load a data file with its change log replayed, as the API serves it.
+    
+    Args:
+        data_file: Path to the JSON data file
+        
+    Returns:
+        Word data, including the writes not yet compacted into the file
+    """
+    with open(data_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    apply_records(data, ChangeLog(changelog_path(data_file)).read())
+    return data
+
+
+def save_data(data: Dict[str, List], data_file: str) -> int:
+    """Write data loaded with load_data back to its data file, folding the change log in.
+    
+    The log is reset like a compaction, under a new base version, so the
+    logged writes no longer override the new file and incremental exports
+    include the entries changed in it. Must not run while an API process is
+    writing to the same log; a running API picks the new file up through
+    POST /admin/reload.
+    
+    Args:
+        data: Word data, with the change log replayed
+        data_file: Path to the JSON data file
+        
+    Returns:
+        The new base version
+    """
+    log = ChangeLog(changelog_path(data_file))
+    state = apply_records({}, log.read())
+    # Written first: a crash before the reset leaves the logged writes
+    # overriding the new file, rather than losing them
+    write_json_atomic(data, data_file)
+    version = state["version"] + 1
+    log.reset(version, state["deleted"], state["tombstones_since"])
+    return version
+
+
+def compact(data_file: str) -> Dict:
+    """Fold the change log of a data file into a new data file.
+    
+    Must not run while an API process is writing to the same log; use the
+    admin compaction endpoint for a running server.
+    
+    Args:
+        data_file: Path to the JSON data file
+        
+    Returns:
+        Dict with the number of records folded and the new base version
+    """
+    log = ChangeLog(changelog_path(data_file))
+    with open(data_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    records = list(log.read())
+    state = apply_records(data, records)
+    # The deletions kept by the last compaction are already folded
+    folded = records[0]["version"] if records and records[0]["op"] == OP_BASE else 0
+    changes = sum(1 for record in records if record["op"] != OP_BASE and record["version"] > folded)
+    if changes:
+        write_json_atomic(data, data_file)
+        log.reset(state["version"], state["deleted"], state["tombstones_since"])
+    return {"records": changes, "entries": len(data), "version": state["version"]}
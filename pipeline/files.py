@@ -0,0 +1,49 @@
+import json
+import os
+from typing import Dict
+
+
+def write_json_atomic(data: Dict, file_path: str):
+    """Write JSON to a temporary file and rename it over the target.
+    
+    Readers see either the old file or the complete new one, never a
+    partially written file.
+    
+    Args:
+        data: Data to write
+        file_path: Path of the target file
+    """
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
+
+
+def repair_tail(f):
+    """Cut a torn last line off a line-oriented file before appending to it.
+    
+    A crash during an append can leave a last line without its newline.
+    The next append would then continue that line, and the record it
+    writes would be unreadable along with the torn one.
+    
+    Args:
+        f: The file, opened in binary append mode with reading ("ab+")
+    """
+    end = f.seek(0, os.SEEK_END)
+    if end == 0:
+        return
+    f.seek(end - 1)
+    if f.read(1) == b"\n":
+        return
+    position = end
+    while position > 0:
+        start = max(0, position - 4096)
+        f.seek(start)
+        newline = f.read(position - start).rfind(b"\n")
+        if newline >= 0:
+            f.truncate(start + newline + 1)
+            return
+        position = start
+    f.truncate(0)
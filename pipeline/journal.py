@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pipeline.files import repair_tail, write_json_atomic
+
+
+def input_hash(inputs: Any) -> str:
+    """Get a hash of the JSON-serializable inputs of an entry.
+    
+    Args:
+        inputs: Everything the output of the entry depends on
+        
+    Returns:
+        Hex digest of the inputs
+    """
+    content = json.dumps(inputs, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def journal_path(output_file: str) -> str:
+    """Get the journal path that belongs to an output file."""
+    root, _ = os.path.splitext(output_file)
+    return f"{root}.journal.jsonl"
+
+
+class PipelineRun:
+    """Crash-safe, resumable run of a per-entry pipeline step.
+    
+    Every completed entry is appended to a journal next to the output file
+    and fsync'd, so a crashed or interrupted run loses at most the entry
+    being processed. On the next run, entries whose inputs hash the same
+    as when they were journaled are skipped and their journaled output is
+    reused; this covers both resuming and re-running after a few inputs
+    changed. finish() writes the complete output in one atomic rename and
+    compacts the journal to the entries of that output.
+    
+    Typical use:
+    
+        run = PipelineRun(OUTPUT_FILE)
+        for word_id, word_entry in run.pending(items):
+            run.record(word_id, word_entry, process(word_entry))
+        run.finish(items)
+    """
+    
+    def __init__(self, output_file: str, journal_file: Optional[str] = None):
+        """Initialize the run and load the journal of earlier runs.
+        
+        Args:
+            output_file: Path of the final JSON output
+            journal_file: Path of the journal (default: next to the output file)
+        """
+        self.output_file = output_file
+        self.journal_file = journal_file or journal_path(output_file)
+        self.records = self._load()
+        self.reused = 0
+        self.processed = 0
+        self.incomplete = 0
+    
+    def pending(self, items: Iterable[Tuple[str, Any]], inputs: Optional[Dict[str, Any]] = None) -> List[Tuple[str, Any]]:
+        """Get the items that have no journaled output for their current inputs.
+        
+        Args:
+            items: (entry ID, entry) pairs
+            inputs: Entry ID -> inputs to hash, when the output depends on more
+                than the entry itself (default: the entry)
+                
+        Returns:
+            The items that still need processing, in their original order
+        """
+        todo = []
+        items = list(items)
+        for word_id, entry in items:
+            record = self.records.get(word_id)
+            entry_inputs = inputs[word_id] if inputs is not None else entry
+            if record is None or record["input_hash"] != input_hash(entry_inputs):
+                todo.append((word_id, entry))
+        self.reused = len(items) - len(todo)
+        return todo
+    
+    def record(self, word_id: str, inputs: Any, output: Any, complete: bool = True):
+        """Journal the output of an entry.
+        
+        Args:
+            word_id: Entry ID
+            inputs: Inputs the output was produced from (as passed to pending)
+            output: Output entry
+            complete: False if part of the processing failed; the output is
+                still written by finish(), but the entry is processed again
+                by the next run
+        """
+        record = {"id": word_id, "input_hash": input_hash(inputs) if complete else "", "output": output}
+        with open(self.journal_file, 'ab+') as f:
+            # A torn line left by a crash would swallow this record
+            repair_tail(f)
+            f.write((json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        self.records[word_id] = record
+        self.processed += 1
+        if not complete:
+            self.incomplete += 1
+    
+    def output(self, word_id: str) -> Any:
+        """Get the journaled output of an entry."""
+        return self.records[word_id]["output"]
+    
+    def finish(self, items: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+        """Write the outputs of the items to the output file and compact the journal.
+        
+        Items without a journaled output (not processed yet, e.g. because
+        the run was cut short) are left out of the output.
+        
+        Args:
+            items: (entry ID, entry) pairs, in output order
+            
+        Returns:
+            The output written
+        """
+        output = {}
+        compacted = []
+        for word_id, _ in items:
+            record = self.records.get(word_id)
+            if record is not None:
+                output[word_id] = record["output"]
+                compacted.append(record)
+        write_json_atomic(output, self.output_file)
+        
+        tmp_path = f"{self.journal_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in compacted:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_file)
+        return output
+    
+    def _load(self) -> Dict[str, Dict]:
+        """Load the journal; later records of an entry replace earlier ones."""
+        records = {}
+        if not os.path.exists(self.journal_file):
+            return records
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from a crash during append
+                    print(f"Skipping unreadable journal record at {self.journal_file}:{line_number}")
+                    continue
+                records[record["id"]] = record
+        return records
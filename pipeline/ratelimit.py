@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import Dict, Optional
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """Check whether an API error means the provider is rate limiting us.
+    
+    googletrans, gTTS and genai don't have a dedicated exception for this,
+    so the HTTP status is looked up on the error or its response, falling
+    back to the message ("429 (Too Many Requests) from TTS API").
+    
+    Args:
+        error: Exception raised by an API call
+        
+    Returns:
+        True if the error is an HTTP 429
+    """
+    response = getattr(error, "response", None)
+    statuses = (getattr(error, "status_code", None), getattr(error, "code", None), getattr(response, "status_code", None))
+    for status in statuses:
+        if status == 429:
+            return True
+    message = str(error)
+    return "429" in message or "Too Many Requests" in message
+
+
+class AdaptiveRateLimiter:
+    """Thread-safe token bucket whose rate adapts to the provider's quota.
+    
+    Every call takes a token; tokens refill at `rate` per second up to
+    `burst`. Successful calls raise the rate by `increase` per second up to
+    `max_rate`, and a rate-limited call halves it (down to `min_rate`) and
+    pauses every caller, so the rate settles just under the quota.
+    """
+    
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1,
+        min_rate: float = 0.1,
+        max_rate: Optional[float] = None,
+        increase: float = 0.1,
+        decrease: float = 0.5
+    ):
+        """Initialize the limiter.
+        
+        Args:
+            rate: Initial calls per second
+            burst: Maximum number of calls that can be made back to back
+            min_rate: Lowest rate backing off can reach
+            max_rate: Highest rate successful calls can reach (default: no limit)
+            increase: Calls per second added after each successful call
+            decrease: Factor the rate is multiplied by after a rate-limited call
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.calls = 0
+        self.rate_limited = 0
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._last_backoff = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Wait until a call may be made."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.calls += 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+    
+    def on_success(self):
+        """Record a successful call and probe for a higher rate."""
+        with self._lock:
+            self.rate += self.increase
+            if self.max_rate is not None:
+                self.rate = min(self.rate, self.max_rate)
+    
+    def on_rate_limited(self, retry_after: Optional[float] = None):
+        """Record a rate-limited call, lower the rate and pause every caller.
+        
+        Calls that were already in flight when the rate was lowered are
+        likely to be rejected too, so only one backoff is applied per pause.
+        
+        Args:
+            retry_after: Seconds the provider asked us to wait, if it said
+        """
+        with self._lock:
+            self.rate_limited += 1
+            now = time.monotonic()
+            self._refill(now)
+            if now - self._last_backoff < 1 / self.rate:
+                return
+            self._last_backoff = now
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = 0
+            self._paused_until = now + (retry_after if retry_after is not None else 1 / self.rate)
+    
+    def stats(self) -> Dict:
+        """Get the current rate and call counts."""
+        with self._lock:
+            return {"rate": round(self.rate, 2), "calls": self.calls, "rate_limited": self.rate_limited}
+    
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
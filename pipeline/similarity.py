@@ -0,0 +1,265 @@
+import bisect
+import json
+import operator
+import os
+import re
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Fields compared for near-duplicates: field name -> entry index
+FIELDS = {"definition": 4, "example": 5, "example_translation": 7}
+
+SHINGLE_SIZE = 4  # Characters per shingle
+NUM_HASHES = 64  # Values per signature; a power of two
+BANDS = 16  # LSH bands of NUM_HASHES // BANDS values; pairs above ~0.5 similarity share a band
+THRESHOLD = 0.6  # Minimum estimated Jaccard similarity of a reported pair
+MAX_BUCKET = 50  # Members of an LSH bucket compared pairwise; the rest are chained
+MAX_RELATED = 10  # Related entries kept per word
+
+# Separators and numbering dropped before shingling; Gujarati vowel signs
+# aren't word characters to re, so the text isn't filtered with \w
+_SEPARATORS_RE = re.compile(r"[\s.,;:!?\"'()\[\]{}<>/\\\-–—…।॥0-9]+")
+_BIN_BITS = NUM_HASHES.bit_length() - 1
+_EMPTY = 1 << 32
+_ROTATION = 1 << (32 - _BIN_BITS)  # Added per bin a value is borrowed across
+
+# Signature: NUM_HASHES ints; pair: (ID, ID, estimated similarity)
+Signature = Tuple[int, ...]
+Pair = Tuple[str, str, float]
+
+
+def related_path(data_file: str) -> str:
+    """Get the related entries file that belongs to a data file."""
+    root, _ = os.path.splitext(data_file)
+    return f"{root}.related.json"
+
+
+def shingles(text: str) -> Set[str]:
+    """Get the character shingles of a text, ignoring case, punctuation and numbering.
+    
+    Args:
+        text: Definition, example or translation
+        
+    Returns:
+        Set of SHINGLE_SIZE-character substrings; texts shorter than that
+        are their own shingle
+    """
+    text = " ".join(_SEPARATORS_RE.sub(" ", text.lower()).split())
+    if len(text) <= SHINGLE_SIZE:
+        return {text} if text else set()
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def signature(shingle_set: Set[str]) -> Optional[Signature]:
+    """Get the MinHash signature of a set of shingles.
+    
+    Uses one-permutation hashing: each shingle is hashed once and the
+    hash space is split into NUM_HASHES bins, each keeping its minimum, so
+    the cost is linear in the shingles rather than in shingles times
+    hashes. Empty bins borrow the value of the next non-empty bin, offset
+    by the distance (rotation densification), so every position can be
+    compared like that of a k-permutation MinHash.
+    
+    Args:
+        shingle_set: Shingles of a text
+        
+    Returns:
+        The signature, or None for an empty set
+    """
+    if not shingle_set:
+        return None
+    bins = [_EMPTY] * NUM_HASHES
+    mask = NUM_HASHES - 1
+    for shingle in shingle_set:
+        value = zlib.crc32(shingle.encode("utf-8"))
+        index = value & mask
+        value >>= _BIN_BITS
+        if value < bins[index]:
+            bins[index] = value
+    if _EMPTY in bins:
+        filled = [i for i, value in enumerate(bins) if value != _EMPTY]
+        for i in range(NUM_HASHES):
+            if bins[i] == _EMPTY:
+                # The next filled bin to the right, wrapping around
+                j = bisect.bisect_right(filled, i)
+                source = filled[j] if j < len(filled) else filled[0] + NUM_HASHES
+                bins[i] = bins[source % NUM_HASHES] + (source - i) * _ROTATION
+    return tuple(bins)
+
+
+def similarity(first: Signature, second: Signature) -> float:
+    """Estimate the Jaccard similarity of two texts from their signatures."""
+    return sum(map(operator.eq, first, second)) / NUM_HASHES
+
+
+class MinHashLSH:
+    """Locality-sensitive hashing index of MinHash signatures.
+    
+    Each signature is split into bands; texts whose signatures agree on
+    every value of any band land in the same bucket and become candidate
+    pairs, so only texts likely to be similar are compared.
+    """
+    
+    def __init__(self, bands: int = BANDS):
+        """Initialize an empty index.
+        
+        Args:
+            bands: Number of bands; more bands find less similar pairs
+        """
+        self.bands = bands
+        self.rows = NUM_HASHES // bands
+        self.signatures: Dict[str, Signature] = {}
+        self.buckets: Dict[Tuple[int, Signature], List[str]] = {}
+    
+    def add(self, key: str, sig: Signature):
+        """Add the signature of a text.
+        
+        A band takes every `bands`-th value rather than adjacent ones: empty
+        bins borrow from their right neighbor, so adjacent values of a short
+        text often come from the same shingle.
+        """
+        self.signatures[key] = sig
+        for band in range(self.bands):
+            self.buckets.setdefault((band, sig[band::self.bands]), []).append(key)
+    
+    def candidate_pairs(self) -> Iterator[Tuple[str, str]]:
+        """Yield every pair of keys that share a bucket, once.
+        
+        Buckets larger than MAX_BUCKET, such as a sentence copied into
+        hundreds of entries, are compared pairwise up to MAX_BUCKET and
+        chained after that, which keeps the work near-linear while still
+        connecting every member to the cluster.
+        """
+        seen = set()
+        for members in self.buckets.values():
+            if len(members) < 2:
+                continue
+            head = members[:MAX_BUCKET]
+            pairs = [(a, b) for i, a in enumerate(head) for b in head[i + 1:]]
+            pairs.extend(zip(members[MAX_BUCKET - 1:], members[MAX_BUCKET:]))
+            for pair in pairs:
+                if pair not in seen:
+                    seen.add(pair)
+                    yield pair
+    
+    def similar_pairs(self, threshold: float = THRESHOLD) -> List[Pair]:
+        """Get the candidate pairs whose estimated similarity reaches the threshold."""
+        pairs = []
+        for a, b in self.candidate_pairs():
+            score = similarity(self.signatures[a], self.signatures[b])
+            if score >= threshold:
+                pairs.append((a, b, score))
+        return pairs
+
+
+def find_similar_pairs(
+    data: Dict[str, List],
+    fields: Optional[Iterable[str]] = None,
+    threshold: float = THRESHOLD
+) -> Dict[str, List[Pair]]:
+    """Find the pairs of entries with near-duplicate fields.
+    
+    Args:
+        data: Word ID -> entry
+        fields: Names of the FIELDS to compare (default: all)
+        threshold: Minimum estimated Jaccard similarity
+        
+    Returns:
+        Field name -> pairs (ID, ID, similarity), in data order
+    """
+    results = {}
+    for field in fields or FIELDS:
+        index = FIELDS[field]
+        lsh = MinHashLSH()
+        signatures: Dict[str, Optional[Signature]] = {}  # Text -> signature; repeated texts are hashed once
+        for word_id, entry in data.items():
+            text = entry[index] if len(entry) > index else ""
+            if not text:
+                continue
+            if text not in signatures:
+                signatures[text] = signature(shingles(text))
+            if signatures[text] is not None:
+                lsh.add(word_id, signatures[text])
+        results[field] = lsh.similar_pairs(threshold)
+    return results
+
+
+def cluster_pairs(pairs: List[Pair]) -> List[Dict]:
+    """Group pairs into clusters of connected entries.
+    
+    Args:
+        pairs: Pairs (ID, ID, similarity) of one field
+        
+    Returns:
+        Clusters, largest first, each with its "ids", the estimated
+        similarity range and its "pairs"
+    """
+    parent: Dict[str, str] = {}
+    
+    def find(key: str) -> str:
+        root = key
+        while parent.setdefault(root, root) != root:
+            root = parent[root]
+        while parent[key] != root:
+            parent[key], key = root, parent[key]
+        return root
+    
+    for a, b, _ in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+    
+    clusters: Dict[str, Dict] = {}
+    order = {}
+    for a, b, score in pairs:
+        cluster = clusters.setdefault(find(a), {"ids": [], "pairs": []})
+        for key in (a, b):
+            if key not in order:
+                order[key] = len(order)
+                cluster["ids"].append(key)
+        cluster["pairs"].append([a, b, round(score, 3)])
+    result = []
+    for cluster in clusters.values():
+        scores = [score for _, _, score in cluster["pairs"]]
+        result.append({
+            "ids": cluster["ids"],
+            "min_similarity": min(scores),
+            "max_similarity": max(scores),
+            "pairs": cluster["pairs"],
+        })
+    result.sort(key=lambda cluster: -len(cluster["ids"]))
+    return result
+
+
+def related_entries(pairs_by_field: Dict[str, List[Pair]], max_related: int = MAX_RELATED) -> Dict[str, List[Dict]]:
+    """Get the most similar entries of every entry across all fields.
+    
+    Args:
+        pairs_by_field: Result of find_similar_pairs
+        max_related: Related entries kept per entry
+        
+    Returns:
+        Word ID -> [{"id", "similarity"}], most similar first
+    """
+    best: Dict[str, Dict[str, float]] = {}
+    for pairs in pairs_by_field.values():
+        for a, b, score in pairs:
+            for key, other in ((a, b), (b, a)):
+                neighbors = best.setdefault(key, {})
+                if score > neighbors.get(other, 0.0):
+                    neighbors[other] = score
+    return {
+        word_id: [
+            {"id": other, "similarity": round(score, 3)}
+            for other, score in sorted(neighbors.items(), key=lambda item: -item[1])[:max_related]
+        ]
+        for word_id, neighbors in best.items()
+    }
+
+
+def load_related(path: str) -> Dict[str, List[Dict]]:
+    """Load a related entries file, or nothing if it doesn't exist."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)["related"]
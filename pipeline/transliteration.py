@@ -0,0 +1,233 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+# Romanization follows the plain-ASCII style of the dictionary's existing
+# romanizations ("akdavun", "teni dayri"): long and short vowels share a
+# letter, and the inherent vowel is dropped where Gujarati doesn't say it
+
+VIRAMA = "્"
+NUKTA = "઼"
+ANUSVARA = "ં"
+CANDRABINDU = "ઁ"
+VISARGA = "ઃ"
+JOINERS = "\u200c\u200d"  # ZWNJ and ZWJ only affect rendering
+INHERENT_VOWEL = "a"
+
+CONSONANTS = {
+    "ક": "k", "ખ": "kh", "ગ": "g", "ઘ": "gh", "ઙ": "n",
+    "ચ": "ch", "છ": "chh", "જ": "j", "ઝ": "jh", "ઞ": "n",
+    "ટ": "t", "ઠ": "th", "ડ": "d", "ઢ": "dh", "ણ": "n",
+    "ત": "t", "થ": "th", "દ": "d", "ધ": "dh", "ન": "n",
+    "પ": "p", "ફ": "f", "બ": "b", "ભ": "bh", "મ": "m",
+    "ય": "y", "ર": "r", "લ": "l", "ળ": "l", "વ": "v",
+    "શ": "sh", "ષ": "sh", "સ": "s", "હ": "h",
+}
+
+# Consonants written with a nukta for sounds borrowed from Persian and English
+NUKTA_CONSONANTS = {"ઝ": "z", "ફ": "f", "જ": "z", "ક": "q", "ખ": "kh", "ગ": "g"}
+
+# Conjuncts not pronounced as the sum of their consonants
+CONJUNCTS = {"જ્ઞ": "gn"}
+
+INDEPENDENT_VOWELS = {
+    "અ": "a", "આ": "a", "ઇ": "i", "ઈ": "i", "ઉ": "u", "ઊ": "u",
+    "ઋ": "ru", "ૠ": "ru", "ઌ": "lu", "ૡ": "lu", "ઍ": "e", "એ": "e",
+    "ઐ": "ai", "ઑ": "o", "ઓ": "o", "ઔ": "au",
+}
+
+VOWEL_SIGNS = {
+    "ા": "a", "િ": "i", "ી": "i", "ુ": "u", "ૂ": "u", "ૃ": "ru",
+    "ૄ": "ru", "ૢ": "lu", "ૣ": "lu", "ૅ": "e", "ે": "e", "ૈ": "ai",
+    "ૉ": "o", "ો": "o", "ૌ": "au",
+}
+
+OTHER_SIGNS = {
+    "ૐ": "om", "ઽ": "", "૦": "0", "૧": "1", "૨": "2", "૩": "3",
+    "૪": "4", "૫": "5", "૬": "6", "૭": "7", "૮": "8", "૯": "9", "૰": ".",
+}
+
+# The anusvara is said as "m" before labials and "n" elsewhere
+LABIALS = ("p", "f", "b", "m")
+
+_CONSONANT_CLASS = "".join(CONSONANTS)
+_VOWEL_SIGN_CLASS = "".join(VOWEL_SIGNS)
+
+# One syllable: a consonant cluster joined by viramas, its vowel sign (or a
+# virama, for a bare consonant) and a nasal or visarga; or an independent
+# vowel and its nasal or visarga
+_SYLLABLE_RE = re.compile(
+    f"(?P<cluster>(?:[{_CONSONANT_CLASS}]{NUKTA}?{VIRAMA})*[{_CONSONANT_CLASS}]{NUKTA}?)"
+    f"(?P<sign>[{_VOWEL_SIGN_CLASS}{VIRAMA}]?)"
+    f"|(?P<vowel>[{''.join(INDEPENDENT_VOWELS)}])"
+    f"|(?P<coda>[{ANUSVARA}{CANDRABINDU}{VISARGA}])"
+    f"|(?P<other>.)",
+    re.DOTALL,
+)
+
+_STRIP_JOINERS = {ord(joiner): None for joiner in JOINERS}
+
+# Runs of Gujarati script; everything else is kept as is
+_WORD_RE = re.compile(f"[\u0a80-\u0aff{JOINERS}]+")
+
+# Syllable: [onset, vowel, coda, has inherent vowel, onset is a conjunct]
+Syllable = List
+
+
+@lru_cache(maxsize=None)
+def _romanize_cluster(cluster: str) -> str:
+    """Romanize a consonant cluster, e.g. "સ્થ" -> "sth"."""
+    for conjunct, value in CONJUNCTS.items():
+        if conjunct in cluster:
+            head, _, tail = cluster.partition(conjunct)
+            head, tail = head.rstrip(VIRAMA), tail.lstrip(VIRAMA)
+            return (_romanize_cluster(head) if head else "") + value + (_romanize_cluster(tail) if tail else "")
+    parts = []
+    for consonant in cluster.split(VIRAMA):
+        if consonant.endswith(NUKTA):
+            parts.append(NUKTA_CONSONANTS.get(consonant[0], CONSONANTS[consonant[0]]))
+        else:
+            parts.append(CONSONANTS[consonant])
+    return "".join(parts)
+
+
+def _parse(word: str) -> Tuple[List[Syllable], List[str]]:
+    """Split a Gujarati word into syllables.
+    
+    Returns:
+        Tuple of (syllables, text following each syllable that isn't part
+        of one, such as digits or a stray sign)
+    """
+    syllables: List[Syllable] = []
+    trailing: List[str] = [""]
+    for match in _SYLLABLE_RE.finditer(word):
+        cluster, sign, vowel, coda, other = match.group("cluster", "sign", "vowel", "coda", "other")
+        if cluster:
+            inherent = not sign
+            syllables.append([
+                _romanize_cluster(cluster),
+                INHERENT_VOWEL if inherent else VOWEL_SIGNS.get(sign, ""),
+                "",
+                inherent,
+                VIRAMA in cluster,
+            ])
+            trailing.append("")
+        elif vowel:
+            syllables.append(["", INDEPENDENT_VOWELS[vowel], "", False, False])
+            trailing.append("")
+        elif coda and syllables and not trailing[-1]:
+            syllables[-1][2] += coda
+        else:
+            char = other or coda
+            if char in OTHER_SIGNS:
+                trailing[-1] += OTHER_SIGNS[char]
+            elif char in VOWEL_SIGNS:
+                # Vowel sign without a consonant, as in malformed entries
+                trailing[-1] += VOWEL_SIGNS[char]
+            elif not coda and char not in (VIRAMA, NUKTA):
+                trailing[-1] += char
+    return syllables, trailing
+
+
+def _delete_schwas(syllables: List[Syllable]):
+    """Drop the inherent vowels Gujarati doesn't pronounce.
+    
+    The final inherent vowel is dropped unless the word has one syllable
+    or ends in a conjunct ("mitra"). Scanning right to left, a medial one
+    is dropped between two pronounced vowels, VC(a)CV, unless it follows a
+    conjunct, precedes one or an independent vowel, or the next inherent
+    vowel was already dropped, so "samajavavun" becomes "samjavvun" and
+    "kamal" keeps its middle vowel.
+    """
+    count = len(syllables)
+    if count < 2:
+        return
+    deleted = [False] * count
+    last = syllables[-1]
+    if last[3] and not last[2] and not last[4]:
+        deleted[-1] = True
+    for i in range(count - 2, 0, -1):
+        syllable, following = syllables[i], syllables[i + 1]
+        if not syllable[3] or syllable[2] or syllable[4]:
+            continue
+        if deleted[i + 1] or not following[0] or following[4] or not syllables[i - 1][1]:
+            continue
+        deleted[i] = True
+    for i, syllable in enumerate(syllables):
+        if deleted[i]:
+            syllable[1] = ""
+
+
+def _romanize_coda(coda: str, following: str) -> str:
+    """Romanize the nasal or visarga of a syllable, given the text after it."""
+    romanized = ""
+    for sign in coda:
+        if sign == VISARGA:
+            romanized += "h"
+        else:
+            romanized += "m" if following.startswith(LABIALS) else "n"
+    return romanized
+
+
+@lru_cache(maxsize=1 << 16)
+def transliterate_word(word: str) -> str:
+    """Romanize a single run of Gujarati script.
+    
+    Args:
+        word: Gujarati word, without spaces or punctuation
+        
+    Returns:
+        The romanized word
+    """
+    syllables, trailing = _parse(word.translate(_STRIP_JOINERS))
+    _delete_schwas(syllables)
+    parts = [trailing[0]]
+    for i, syllable in enumerate(syllables):
+        onset, vowel, coda = syllable[0], syllable[1], syllable[2]
+        following = syllables[i + 1][0] if i + 1 < len(syllables) and not trailing[i + 1] else ""
+        parts.append(onset + vowel + _romanize_coda(coda, following) + trailing[i + 1])
+    return "".join(parts)
+
+
+def transliterate(text: str) -> str:
+    """Romanize Gujarati text, keeping spaces, punctuation and other scripts.
+    
+    Args:
+        text: Gujarati text, e.g. an example sentence
+        
+    Returns:
+        The romanized text
+    """
+    if not text:
+        return ""
+    return _WORD_RE.sub(lambda match: transliterate_word(match.group()), text)
+
+
+def transliterate_many(texts: Iterable[str]) -> List[str]:
+    """Romanize many texts, e.g. every headword and example of the dictionary.
+    
+    Words are romanized once however often they occur, so a whole
+    dictionary costs little more than its distinct words.
+    
+    Args:
+        texts: Gujarati texts
+        
+    Returns:
+        The romanized texts, in order
+    """
+    return [transliterate(text) for text in texts]
+
+
+def romanize_entries(data: Dict[str, List]) -> Dict[str, Tuple[str, str]]:
+    """Romanize the headword and example of every entry.
+    
+    Args:
+        data: Word ID -> entry [gujarati, ipa, romanization, pos, definition, example, ...]
+        
+    Returns:
+        Word ID -> (word romanization, example romanization)
+    """
+    ids = list(data)
+    words = transliterate_many(data[word_id][0] for word_id in ids)
+    examples = transliterate_many(data[word_id][5] if len(data[word_id]) > 5 else "" for word_id in ids)
+    return dict(zip(ids, zip(words, examples)))
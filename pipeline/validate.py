@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Validate the Unicode of every text field of a data file.
+
+Gujarati fields (the word and example) are split into grapheme clusters
+with one compiled regex. Marks that don't belong to a cluster, such as a
+vowel sign starting a word or a second vowel sign, are reported, as are a
+virama ending a word, zero-width joiners outside a conjunct, letters of
+other scripts and text mangled by decoding UTF-8 as Latin-1. The other
+fields (IPA, romanizations, definition and translation) are checked for
+Indic text, mangled text and joiners. Large files are checked by a process
+pool. The report is written as JSON or CSV; the headword issues it lists
+are what fix_gujarati_spelling.py --report fixes.
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from pipeline.changelog import load_data
+from pipeline.files import write_json_atomic
+from pipeline.transliteration import (
+    ANUSVARA, CANDRABINDU, CONSONANTS, INDEPENDENT_VOWELS, JOINERS, NUKTA, VIRAMA, VISARGA, VOWEL_SIGNS
+)
+
+# Constants
+DATA_FILE = "data/gujarati_words_google_enhanced.json"
+REPORT_FILE = "data/validation_report.json"
+CHUNK_SIZE = 500  # Entries per task sent to a worker process
+PARALLEL_MIN_ENTRIES = 20000  # Smaller files are checked faster than worker processes start
+FIELDS = ["word", "ipa", "romanization", "pos", "definition", "example", "example_romanization", "example_translation"]
+GUJARATI_FIELDS = {"word", "example"}
+CSV_COLUMNS = ["id", "field", "issue", "offset", "token"]
+
+# Issue types
+LEADING_SIGN = "leading_sign"  # A word starts with a vowel sign, virama, nukta or nasal
+DOUBLED_SIGN = "doubled_sign"  # A sign follows another sign, e.g. two vowel signs
+MISPLACED_SIGN = "misplaced_sign"  # A sign follows an independent vowel or a non-letter
+TRAILING_VIRAMA = "trailing_virama"  # A word ends in a virama
+STRAY_JOINER = "stray_joiner"  # A ZWJ or ZWNJ that isn't part of a conjunct
+MIXED_SCRIPT = "mixed_script"  # Letters of another script in Gujarati text
+UNEXPECTED_SCRIPT = "unexpected_script"  # Indic text in a field that should be Latin
+MOJIBAKE = "mojibake"  # Gujarati UTF-8 bytes decoded as Latin-1, e.g. "àª®àª¾"
+
+_CONSONANT = f"[{''.join(CONSONANTS)}]{NUKTA}?"
+_NASAL = f"[{ANUSVARA}{CANDRABINDU}]"
+MARKS = "".join(VOWEL_SIGNS) + VIRAMA + NUKTA + ANUSVARA + CANDRABINDU + VISARGA
+
+# A grapheme cluster: consonants joined by viramas (optionally with a joiner
+# after the virama), a vowel sign or final virama, a nasal and a visarga; or
+# an independent vowel with a nasal and visarga. A mark or joiner matched on
+# its own doesn't belong to any cluster.
+_CLUSTER = (
+    f"{_CONSONANT}(?:{VIRAMA}[{JOINERS}]?{_CONSONANT})*"
+    f"(?:[{''.join(VOWEL_SIGNS)}]|{VIRAMA})?{_NASAL}?{VISARGA}?"
+)
+_VOWEL = f"[{''.join(INDEPENDENT_VOWELS)}]{_NASAL}?{VISARGA}?"
+CLUSTER_RE = re.compile(
+    f"(?P<cluster>{_CLUSTER})"
+    f"|(?P<vowel>{_VOWEL})"
+    f"|(?P<mark>[{MARKS}])"
+    f"|(?P<joiner>[{JOINERS}])"
+    f"|(?P<other>.)",
+    re.DOTALL,
+)
+
+# Most text is clean: once its clusters are removed, no mark, joiner or
+# non-Gujarati letter is left and no virama ends a word, so it's only split
+# into words and clusters when one of these finds something
+_FOREIGN_LETTER = "[^\\W\\d_\u0a80-\u0aff]"  # Letters of other scripts, including accented Latin
+VALID_RE = re.compile(f"{_CLUSTER}|{_VOWEL}")
+SUSPECT_RE = re.compile(f"[{MARKS}{JOINERS}]|{_FOREIGN_LETTER}")
+TRAILING_VIRAMA_RE = re.compile(f"{VIRAMA}(?![\u0a80-\u0aff{JOINERS}])")
+FOREIGN_LETTER_RE = re.compile(_FOREIGN_LETTER)
+
+# Words: runs of anything but whitespace and punctuation
+TOKEN_RE = re.compile(r"[^\s.,;:!?\"'()\[\]{}<>/\\\-–—…।॥]+")
+
+INDIC_RE = re.compile("[\u0900-\u0dff]")
+MOJIBAKE_RE = re.compile("\u00e0[\u00aa\u00ab]")  # Latin-1 reading of the bytes E0 AA and E0 AB
+LATIN_SUSPECT_RE = re.compile(f"[\u0900-\u0dff{JOINERS}]|{MOJIBAKE_RE.pattern}")
+
+# Issue: (issue type, offset in the text, word it was found in)
+Issue = Tuple[str, int, str]
+
+
+def check_gujarati(text: str) -> List[Issue]:
+    """Find the Unicode issues of Gujarati text.
+    
+    Args:
+        text: Gujarati word or sentence
+        
+    Returns:
+        The issues found, in text order
+    """
+    issues: List[Issue] = []
+    if not SUSPECT_RE.search(VALID_RE.sub("", text)) and not TRAILING_VIRAMA_RE.search(text):
+        return issues
+    for token_match in TOKEN_RE.finditer(text):
+        token, start = token_match.group(), token_match.start()
+        if MOJIBAKE_RE.search(token):
+            issues.append((MOJIBAKE, start, token))
+            continue
+        if FOREIGN_LETTER_RE.search(token):
+            issues.append((MIXED_SCRIPT, start, token))
+        previous = ""
+        last = None
+        for match in CLUSTER_RE.finditer(token):
+            kind, value = match.lastgroup, match.group()
+            if kind == "mark":
+                if match.start() == 0:
+                    issue = LEADING_SIGN
+                elif previous and previous[-1] in MARKS:
+                    issue = DOUBLED_SIGN
+                else:
+                    issue = MISPLACED_SIGN
+                issues.append((issue, start + match.start(), token))
+            elif kind == "joiner":
+                issues.append((STRAY_JOINER, start + match.start(), token))
+            previous = value
+            last = match
+        if last is not None and last.lastgroup == "cluster" and last.group().endswith(VIRAMA):
+            issues.append((TRAILING_VIRAMA, start + last.end() - 1, token))
+    return issues
+
+
+def check_latin(text: str) -> List[Issue]:
+    """Find Indic text and zero-width joiners in a field that should be Latin.
+    
+    Args:
+        text: IPA, romanization, definition or translation
+        
+    Returns:
+        The issues found, in text order
+    """
+    issues: List[Issue] = []
+    if not LATIN_SUSPECT_RE.search(text):
+        return issues
+    for token_match in TOKEN_RE.finditer(text):
+        token, start = token_match.group(), token_match.start()
+        if INDIC_RE.search(token):
+            issues.append((UNEXPECTED_SCRIPT, start, token))
+        elif MOJIBAKE_RE.search(token):
+            issues.append((MOJIBAKE, start, token))
+        for joiner in re.finditer(f"[{JOINERS}]", token):
+            issues.append((STRAY_JOINER, start + joiner.start(), token))
+    return issues
+
+
+def validate_entry(word_id: str, entry: List) -> List[Dict]:
+    """Check every text field of an entry.
+    
+    Args:
+        word_id: Entry ID
+        entry: Word entry
+        
+    Returns:
+        Issue records with the id, field, issue type, offset and word
+    """
+    records = []
+    for index, field in enumerate(FIELDS):
+        text = entry[index] if len(entry) > index else ""
+        if not isinstance(text, str) or not text:
+            continue
+        check = check_gujarati if field in GUJARATI_FIELDS else check_latin
+        for issue, offset, token in check(text):
+            records.append({"id": word_id, "field": field, "issue": issue, "offset": offset, "token": token})
+    return records
+
+
+def validate_chunk(items: List[Tuple[str, List]]) -> List[Dict]:
+    """Check a chunk of entries; run by the worker processes."""
+    records = []
+    for word_id, entry in items:
+        records.extend(validate_entry(word_id, entry))
+    return records
+
+
+def validate_data(data: Dict[str, List], workers: Optional[int] = None) -> List[Dict]:
+    """Check every entry of a data file, spreading the entries over processes.
+    
+    Args:
+        data: Word ID -> entry
+        workers: Number of processes (default: one per CPU, or none for
+            fewer than PARALLEL_MIN_ENTRIES entries); 1 checks in this process
+            
+    Returns:
+        Issue records, in entry order
+    """
+    items = list(data.items())
+    chunks = [items[start:start + CHUNK_SIZE] for start in range(0, len(items), CHUNK_SIZE)]
+    if workers == 1 or len(chunks) < 2 or (workers is None and len(items) < PARALLEL_MIN_ENTRIES):
+        results = map(validate_chunk, chunks)
+        return [record for chunk in results for record in chunk]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [record for chunk in executor.map(validate_chunk, chunks) for record in chunk]
+
+
+def write_report(records: List[Dict], path: str, summary: Dict):
+    """Write the issues as CSV if the path ends in .csv, else as JSON with a summary."""
+    if path.endswith(".csv"):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+            writer.writeheader()
+            writer.writerows(records)
+        os.replace(tmp_path, path)
+    else:
+        write_json_atomic({"summary": summary, "issues": records}, path)
+
+
+def read_report(path: str) -> List[Dict]:
+    """Read the issue records of a JSON or CSV report."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.endswith(".csv"):
+            return [dict(row, offset=int(row["offset"])) for row in csv.DictReader(f)]
+        return json.load(f)["issues"]
+
+
+def main():
+    """Main function to validate a data file."""
+    parser = argparse.ArgumentParser(description="Report Unicode issues in every text field of a data file")
+    parser.add_argument("--data-file", default=DATA_FILE, help="Data file to validate")
+    parser.add_argument("--output", default=REPORT_FILE, help="Report path; .csv for CSV, JSON otherwise")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU for large files)")
+    args = parser.parse_args()
+    
+    # Writes made through the API are still in the change log
+    data = load_data(args.data_file)
+    
+    start = time.perf_counter()
+    records = validate_data(data, args.workers)
+    elapsed = time.perf_counter() - start
+    
+    summary = {
+        "data_file": args.data_file,
+        "entries": len(data),
+        "entries_with_issues": len({record["id"] for record in records}),
+        "issues": dict(Counter(record["issue"] for record in records)),
+        "fields": dict(Counter(record["field"] for record in records)),
+        "seconds": round(elapsed, 3),
+    }
+    write_report(records, args.output, summary)
+    
+    print(f"Checked {len(data)} entries in {elapsed:.2f}s: {len(records)} issues in "
+          f"{summary['entries_with_issues']} entries")
+    for issue, count in sorted(summary["issues"].items(), key=lambda item: -item[1]):
+        print(f"  {issue}: {count}")
+    print(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
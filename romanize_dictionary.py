@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Recompute the romanizations of a data file with the local transliterator.
+
+The word (entry[2]) and example (entry[6]) romanizations are replaced by
+pipeline.transliteration, which applies conjunct and schwa-deletion
+rules instead of Google's pronunciation or the old letter-by-letter
+fallback. The data is read with its change log replayed and saved with the
+log folded in, so entries written through the API are romanized too. A
+running API picks the new file up through POST /admin/reload.
+"""
+
+import argparse
+import time
+from pipeline.changelog import load_data, save_data
+from pipeline.transliteration import romanize_entries
+
+# Constants
+DATA_FILE = "data/gujarati_words_google_enhanced.json"
+
+
+def main():
+    """Main function to recompute the romanizations."""
+    parser = argparse.ArgumentParser(description="Recompute word and example romanizations locally")
+    parser.add_argument("--data-file", default=DATA_FILE, help="Data file to romanize")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would change")
+    args = parser.parse_args()
+    
+    data = load_data(args.data_file)
+    
+    start = time.perf_counter()
+    romanizations = romanize_entries(data)
+    elapsed = time.perf_counter() - start
+    
+    changed = 0
+    for word_id, (word_romanization, example_romanization) in romanizations.items():
+        entry = data[word_id]
+        if len(entry) < 7:
+            entry.extend([""] * (7 - len(entry)))
+        if entry[2] != word_romanization or entry[6] != example_romanization:
+            changed += 1
+            if args.dry_run and changed <= 10:
+                print(f"  {word_id}: {entry[2]} -> {word_romanization}")
+            entry[2] = word_romanization
+            entry[6] = example_romanization
+    
+    print(f"Romanized {len(data)} entries in {elapsed:.3f}s, {changed} changed")
+    if not args.dry_run and changed:
+        save_data(data, args.data_file)
+        print(f"Saved {args.data_file}")
+
+
+if __name__ == "__main__":
+    main()
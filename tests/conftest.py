@@ -0,0 +1,49 @@
+import json
+import pytest
+from fastapi.testclient import TestClient
+from app.routers import admin
+from app.services.dictionary import DictionaryService
+from app.services.warmup import tracker
+from main import app
+
+ADMIN_TOKEN = "test-token"
+
+# Entries in the data file format: word, IPA, romanization, part of speech,
+# definition, example, example romanization, example translation, example
+# audio and word audio
+ENTRIES = {
+    "0": ["અકબંધ", "/ək.bən̪.d̪ʱə/", "akbandh", "adj.", "intact", "તેની ડાયરી અકબંધ હતી.",
+          "teni dayri akbandh hati.", "His diary was intact.", "", ""],
+    "1": ["ઘર", "/ɡʱəɾ/", "ghar", "neut.", "house; home", "આ મારું ઘર છે.",
+          "a marun ghar chhe.", "This is my house.", "", ""],
+    "2": ["પાણી", "/pa.ɳi/", "pani", "neut.", "water", "મને પાણી આપો.",
+          "mane pani apo.", "Give me water.", "", ""],
+}
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "words.json"
+    path.write_text(json.dumps(ENTRIES, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def make_service(data_file, tmp_path):
+    """Create dictionary services over the test data file, as a restarted server would."""
+    def make():
+        return DictionaryService(data_file, audio_manifest_file=str(tmp_path / "audio" / "manifest.json"))
+    return make
+
+
+@pytest.fixture
+def service(make_service):
+    return make_service()
+
+
+@pytest.fixture
+def client(service, monkeypatch):
+    """Client of the API serving the test data, with ADMIN_TOKEN as the admin token."""
+    monkeypatch.setattr(tracker, "get_service", lambda data_file, timeout=None: service)
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", ADMIN_TOKEN)
+    return TestClient(app)
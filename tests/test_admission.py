@@ -0,0 +1,101 @@
+import asyncio
+import pytest
+from app.middleware.admission import AdmissionMiddleware
+from app.services.admission import AdmissionController, AdmissionRejected
+
+LIMITS = {
+    "lookup": {"priority": 0, "concurrency": 1, "queue": 4},
+    "search": {"priority": 2, "concurrency": 1, "queue": 1},
+    "write": {"priority": 2, "concurrency": 1, "queue": 1},
+}
+
+
+def make_controller(total_concurrency=1, queue_timeout=1.0):
+    return AdmissionController(LIMITS, total_concurrency, queue_timeout)
+
+
+def test_classify():
+    controller = make_controller()
+    assert controller.classify("/api/v1/words/12") == "lookup"
+    assert controller.classify("/api/v1/words/search") == "search"
+    assert controller.classify("/api/v1/words/12", "PUT") == "write"
+    assert controller.classify("/api/v1/words/12", "DELETE") == "write"
+    assert controller.classify("/api/v1/words") is None  # No "list" limits configured
+    assert controller.classify("/health") is None
+
+
+def test_queued_requests_are_admitted_by_priority():
+    async def run():
+        controller = make_controller()
+        await controller.acquire("search")
+        admitted = []
+
+        async def request(name):
+            await controller.acquire(name)
+            admitted.append(name)
+            controller.release(name)
+
+        # The write queues first, but the lookup has the lower priority number
+        tasks = [asyncio.create_task(request("write")), asyncio.create_task(request("lookup"))]
+        await asyncio.sleep(0)
+        assert controller.status()["queued"] == 2
+        controller.release("search")
+        await asyncio.gather(*tasks)
+        return admitted, controller.status()
+
+    admitted, status = asyncio.run(run())
+    assert admitted == ["lookup", "write"]
+    assert status["active"] == 0 and status["queued"] == 0
+
+
+def test_full_queue_is_rejected_with_429():
+    async def run():
+        controller = make_controller()
+        await controller.acquire("search")
+        waiting = asyncio.create_task(controller.acquire("search"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("search")
+        waiting.cancel()
+        return rejected.value, controller.classes["search"].rejected
+
+    rejection, rejected = asyncio.run(run())
+    assert rejection.status_code == 429
+    assert rejected == 1
+
+
+def test_queue_timeout_is_rejected_with_503():
+    async def run():
+        controller = make_controller(queue_timeout=0.01)
+        await controller.acquire("lookup")
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("lookup")
+        return rejected.value, controller.status()
+
+    rejection, status = asyncio.run(run())
+    assert rejection.status_code == 503
+    assert status["classes"]["lookup"]["timed_out"] == 1
+    assert status["queued"] == 0
+
+
+def test_middleware_rejects_with_retry_after():
+    async def app(scope, receive, send):
+        raise AssertionError("a rejected request reached the app")
+
+    async def run():
+        controller = make_controller(queue_timeout=2)
+        await controller.acquire("search")
+        controller.classes["search"].queued = controller.classes["search"].queue
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {"type": "http", "path": "/api/v1/words/search", "method": "GET"}
+        await AdmissionMiddleware(app, controller)(scope, None, send)
+        return messages
+
+    start, body = asyncio.run(run())
+    assert start["status"] == 429
+    assert (b"retry-after", b"2") in start["headers"]
+    assert b"search" in body["body"]
@@ -0,0 +1,56 @@
+import itertools
+from types import SimpleNamespace
+from pipeline import cache as cache_module
+from pipeline.cache import ResultCache
+
+
+def test_results_are_kept_across_runs(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResultCache(path)
+    cache.put("translate", "gu-en", "ઘર", {"text": "house"})
+    cache.close()
+
+    cache = ResultCache(path)
+    assert cache.get("translate", "gu-en", "ઘર") == {"text": "house"}
+    assert cache.get("translate", "en-gu", "ઘર") is None
+    assert cache.get("tavily", "gu-en", "ઘર") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cached_computes_only_on_a_miss(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return ["result"]
+
+    assert cache.cached("anthropic", "model", {"prompt": "p"}, compute) == ["result"]
+    assert cache.cached("anthropic", "model", {"prompt": "p"}, compute) == ["result"]
+    assert len(calls) == 1
+
+
+def test_least_recently_used_results_are_evicted(tmp_path, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: next(clock)))
+    value = "x" * 98  # 100 bytes as JSON
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), max_bytes=250)
+    cache.put("gemini", "model", "a", value)
+    cache.put("gemini", "model", "b", value)
+    cache.get("gemini", "model", "a")
+
+    cache.put("gemini", "model", "c", value)
+
+    assert cache.evictions == 1
+    assert cache.get("gemini", "model", "b") is None
+    assert cache.get("gemini", "model", "a") == value
+    assert cache.stats()["bytes"] == 200
+
+
+def test_clear_one_provider(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    cache.put("translate", "gu-en", "a", "A")
+    cache.put("tavily", "basic", "a", [])
+
+    assert cache.clear("translate") == 1
+    assert list(cache.stats()["entries"]) == ["tavily/basic"]
@@ -0,0 +1,59 @@
+from pipeline.changelog import OP_PUT, TOMBSTONE_RETENTION, ChangeLog, apply_records, load_data, save_data
+
+
+def test_append_after_torn_tail(tmp_path):
+    log = ChangeLog(str(tmp_path / "words.changes.jsonl"))
+    log.append(1, OP_PUT, "a", ["અ"])
+    log.append(2, OP_PUT, "b", ["બ"])
+    # A crash in the middle of an append leaves a line without its newline
+    with open(log.path, 'ab') as f:
+        f.write(b'{"version": 3, "op": "put", "id": "c", "ent')
+
+    log.append(3, OP_PUT, "c", ["ક"])
+
+    records = list(log.read())
+    assert [record["version"] for record in records] == [1, 2, 3]
+    assert records[-1]["entry"] == ["ક"]
+
+
+def test_append_after_torn_first_line(tmp_path):
+    log = ChangeLog(str(tmp_path / "words.changes.jsonl"))
+    with open(log.path, 'wb') as f:
+        f.write(b'{"version": 1, "op": "pu')
+
+    log.append(1, OP_PUT, "a", ["અ"])
+
+    assert [record["id"] for record in log.read()] == ["a"]
+
+
+def test_reset_keeps_recent_tombstones(tmp_path):
+    log = ChangeLog(str(tmp_path / "words.changes.jsonl"))
+    deleted = {"old": 5, "recent": TOMBSTONE_RETENTION + 50}
+
+    tombstones_since = log.reset(TOMBSTONE_RETENTION + 100, deleted)
+
+    state = apply_records({}, log.read())
+    assert tombstones_since == 100
+    assert state["tombstones_since"] == 100
+    assert state["deleted"] == {"recent": TOMBSTONE_RETENTION + 50}
+    assert state["version"] == TOMBSTONE_RETENTION + 100
+
+
+def test_save_data_folds_the_log(data_file, make_service):
+    service = make_service()
+    service.put_entry("3", ["નદી", "", "nadi", "fem.", "river", "", "", "", "", ""])
+    service.delete_entry("2")
+
+    data = load_data(data_file)
+    assert sorted(data) == ["0", "1", "3"]
+    data["3"][2] = "nadī"
+    version = save_data(data, data_file)
+
+    assert version == service.version + 1
+    assert load_data(data_file)["3"][2] == "nadī"
+    # The running service picks the file up above the folded version
+    report = service.reload()
+    assert report["changed"] == 1
+    assert report["version"] > version
+    assert service.get_word_by_id("3").romanization == "nadī"
+    assert [word_id for word_id, _, word in make_service().iter_entries(1) if word is None] == ["2"]
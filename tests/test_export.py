@@ -0,0 +1,64 @@
+import csv
+import io
+import json
+from pipeline import changelog
+from tests.conftest import ADMIN_TOKEN, ENTRIES
+
+ADMIN = {"X-Admin-Token": ADMIN_TOKEN}
+
+
+def export(client, **params):
+    response = client.get("/api/v1/export", params=params)
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    return rows, int(response.headers["X-Dictionary-Version"])
+
+
+def test_full_export(client):
+    rows, version = export(client)
+
+    assert [row["id"] for row in rows] == list(ENTRIES)
+    assert rows[0]["word"] == "અકબંધ"
+    assert version == 1
+
+
+def test_csv_export(client):
+    response = client.get("/api/v1/export", params={"format": "csv"}, headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["id"] for row in rows] == list(ENTRIES)
+    assert rows[1]["definition"] == "house; home"
+
+
+def test_export_since_version_includes_deletions(client):
+    _, version = export(client)
+    client.put("/api/v1/words/3", json={"word": "નદી", "definitions": [{"pos": "fem.", "definition": "river"}]},
+               headers=ADMIN)
+    client.delete("/api/v1/words/2", headers=ADMIN)
+
+    rows, new_version = export(client, since_version=version)
+
+    assert [(row["id"], row.get("deleted", False)) for row in rows] == [("3", False), ("2", True)]
+    assert new_version == version + 2
+    assert export(client, since_version=new_version)[0] == []
+
+
+def test_export_since_compacted_deletions_is_gone(client, monkeypatch):
+    monkeypatch.setattr(changelog, "TOMBSTONE_RETENTION", 1)
+    client.delete("/api/v1/words/1", headers=ADMIN)
+    client.delete("/api/v1/words/2", headers=ADMIN)
+    assert client.post("/admin/compact", headers=ADMIN).json()["version"] == 3
+
+    # The deletion at version 2 was dropped, the one at version 3 kept
+    assert client.get("/api/v1/export", params={"since_version": 1}).status_code == 410
+    rows, _ = export(client, since_version=2)
+    assert [(row["id"], row.get("deleted", False)) for row in rows] == [("2", True)]
+
+
+def test_entries_deleted_while_streaming_are_skipped(service):
+    entries = service.iter_entries()
+    assert next(entries)[0] == "0"
+    service.delete_entry("1")
+
+    assert [word_id for word_id, _, _ in entries] == ["2"]
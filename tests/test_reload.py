@@ -0,0 +1,49 @@
+import json
+from tests.conftest import ENTRIES
+
+
+def rewrite(data_file, data):
+    with open(data_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def test_reload_patches_only_changed_entries(data_file, make_service):
+    service = make_service()
+    data = dict(ENTRIES)
+    data["1"] = list(data["1"])
+    data["1"][4] = "dwelling"
+    data["3"] = ["નદી", "", "nadi", "fem.", "river", "", "", "", "", ""]
+    del data["2"]
+    rewrite(data_file, data)
+
+    report = service.reload()
+
+    assert (report["added"], report["changed"], report["removed"], report["unchanged"]) == (1, 1, 1, 1)
+    assert service.get_word_by_id("1").definitions[0].definition == "dwelling"
+    assert service.get_word_by_id("2") is None
+    assert [word.word for word in service.search_word("river")] == ["નદી"]
+    assert service.get_entry_version("0") < report["version"] == service.get_entry_version("3")
+
+
+def test_reload_keeps_writes_made_since(data_file, make_service):
+    service = make_service()
+    diff = service.diff_snapshot()
+    service.put_entry("0", ENTRIES["0"][:4] + ["unbroken"] + ENTRIES["0"][5:])
+
+    report = service.apply_diff(diff)
+
+    assert report["changed"] == 0
+    assert service.get_word_by_id("0").definitions[0].definition == "unbroken"
+
+
+def test_reload_removals_survive_restart(data_file, make_service):
+    service = make_service()
+    rewrite(data_file, {word_id: ENTRIES[word_id] for word_id in ("0", "1")})
+    version = service.reload()["version"]
+
+    restarted = make_service()
+
+    assert restarted.version == version
+    assert restarted.get_word_by_id("2") is None
+    deleted = [(word_id, entry_version) for word_id, entry_version, word in restarted.iter_entries(1) if word is None]
+    assert deleted == [("2", version)]
@@ -0,0 +1,62 @@
+import json
+from pipeline.similarity import (
+    cluster_pairs, find_similar_pairs, related_entries, related_path, shingles, signature, similarity
+)
+from tests.conftest import ENTRIES
+
+
+def entry(definition):
+    return ["", "", "", "", definition]
+
+
+def test_shingles_ignore_case_punctuation_and_numbering():
+    assert shingles("1. Intact! 2. Unbroken.") == shingles("intact; unbroken")
+    assert shingles("ઘર") == {"ઘર"}
+    assert shingles("...") == set()
+
+
+def test_signature_estimates_jaccard_similarity():
+    first = shingles("His diary was intact, no one opened it.")
+    second = shingles("His diary was intact; nobody opened it.")
+    jaccard = len(first & second) / len(first | second)
+
+    assert similarity(signature(first), signature(first)) == 1.0
+    assert abs(similarity(signature(first), signature(second)) - jaccard) < 0.15
+    assert similarity(signature(first), signature(shingles("The river flows to the sea every day."))) < 0.2
+    assert signature(set()) is None
+
+
+def test_find_similar_pairs():
+    data = {
+        "1": entry("1. intact. 2. neither opened nor broken."),
+        "2": entry("intact; neither opened nor broken"),
+        "3": entry("water"),
+        "4": entry(""),
+    }
+
+    assert find_similar_pairs(data, ["definition"]) == {"definition": [("1", "2", 1.0)]}
+
+
+def test_cluster_and_related_entries():
+    pairs = [("a", "b", 0.9), ("b", "c", 0.7), ("d", "e", 0.8)]
+
+    clusters = cluster_pairs(pairs)
+    assert [cluster["ids"] for cluster in clusters] == [["a", "b", "c"], ["d", "e"]]
+    assert (clusters[0]["min_similarity"], clusters[0]["max_similarity"]) == (0.7, 0.9)
+
+    related = related_entries({"definition": pairs, "example": [("c", "b", 0.95)]}, max_related=1)
+    assert related["b"] == [{"id": "c", "similarity": 0.95}]
+    assert related["a"] == [{"id": "b", "similarity": 0.9}]
+
+
+def test_related_entries_follow_writes(data_file, make_service):
+    related = {"0": [{"id": "2", "similarity": 0.8}], "2": [{"id": "0", "similarity": 0.8}]}
+    with open(related_path(data_file), 'w', encoding='utf-8') as f:
+        json.dump({"related": related}, f)
+    service = make_service()
+    assert [word.id for word in service.get_word_by_id("0").related] == ["2"]
+
+    service.delete_entry("2")
+    assert service.get_word_by_id("0").related == []
+    service.put_entry("2", ENTRIES["2"])
+    assert [word.id for word in service.get_word_by_id("0").related] == ["2"]
@@ -0,0 +1,35 @@
+import pytest
+from pipeline.transliteration import romanize_entries, transliterate
+
+
+@pytest.mark.parametrize("text, romanization", [
+    ("ઘર", "ghar"),
+    ("પાણી", "pani"),
+    ("કલમ", "kalam"),
+    ("ગુજરાતી", "gujrati"),  # Medial schwa deleted
+    ("અકબંધ", "akbandh"),  # Anusvara before a dental
+    ("બંબ", "bamb"),  # Anusvara before a labial
+    ("જ્ઞાન", "gnan"),  # Conjunct with its own romanization
+    ("સંસ્કૃત", "sanskrut"),
+    ("ઝ઼ેર", "zer"),  # Nukta
+    ("ઘ‍ર", "ghar"),  # Joiners are ignored
+])
+def test_words(text, romanization):
+    assert transliterate(text) == romanization
+
+
+def test_text_keeps_punctuation_and_other_scripts():
+    assert transliterate("આ મારું ઘર છે.") == "a marun ghar chhe."
+    assert transliterate("hello ઘર 12") == "hello ghar 12"
+
+
+def test_romanize_entries():
+    data = {"1": ["ઘર", "", "", "neut.", "house", "આ ઘર છે."], "2": ["પાણી"]}
+
+    assert romanize_entries(data) == {"1": ("ghar", "a ghar chhe."), "2": ("pani", "")}
+
+
+def test_route(client):
+    response = client.get("/api/v1/transliterate", params={"text": "ગુજરાતી"})
+
+    assert response.json() == {"text": "ગુજરાતી", "romanization": "gujrati"}
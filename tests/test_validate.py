@@ -0,0 +1,42 @@
+import pytest
+from pipeline.validate import (
+    DOUBLED_SIGN, LEADING_SIGN, MISPLACED_SIGN, MIXED_SCRIPT, MOJIBAKE, STRAY_JOINER, TRAILING_VIRAMA,
+    UNEXPECTED_SCRIPT, check_gujarati, check_latin, read_report, validate_data, write_report
+)
+from tests.conftest import ENTRIES
+
+
+@pytest.mark.parametrize("text", ["ઘર", "ક્ષ", "કર્‍મ", "આ મારું ઘર છે.", "સંસ્કૃત"])
+def test_valid_gujarati(text):
+    assert check_gujarati(text) == []
+
+
+@pytest.mark.parametrize("text, issue, offset", [
+    ("ાઘર", LEADING_SIGN, 0),
+    ("ઘાા", DOUBLED_SIGN, 2),
+    ("આા", MISPLACED_SIGN, 1),
+    ("ઘર્", TRAILING_VIRAMA, 2),
+    ("ઘ‍ર", STRAY_JOINER, 1),
+    ("ઘરabc", MIXED_SCRIPT, 0),
+    ("àª®àª¾", MOJIBAKE, 0),
+])
+def test_invalid_gujarati(text, issue, offset):
+    assert check_gujarati(text) == [(issue, offset, text)]
+
+
+def test_latin_fields():
+    assert check_latin("house; home") == []
+    assert check_latin("the ઘર of") == [(UNEXPECTED_SCRIPT, 4, "ઘર")]
+
+
+def test_report_round_trip(tmp_path):
+    data = dict(ENTRIES, **{"3": ["ાઘર", "", "gh‍ar", "neut.", "house"]})
+    records = validate_data(data, workers=1)
+
+    assert [(record["id"], record["field"], record["issue"]) for record in records] == [
+        ("3", "word", LEADING_SIGN), ("3", "romanization", STRAY_JOINER)
+    ]
+    for name in ("report.json", "report.csv"):
+        path = str(tmp_path / name)
+        write_report(records, path, {"issues": len(records)})
+        assert read_report(path) == records
@@ -0,0 +1,69 @@
+from tests.conftest import ADMIN_TOKEN
+
+ADMIN = {"X-Admin-Token": ADMIN_TOKEN}
+
+
+def test_patch_rejects_null_required_fields(client):
+    for field in ("word", "definitions"):
+        response = client.patch("/api/v1/words/0", json={field: None}, headers=ADMIN)
+        assert response.status_code == 422, field
+
+    assert client.get("/api/v1/words/0").json()["word"] == "અકબંધ"
+
+
+def test_patch_clears_optional_fields(client):
+    response = client.patch("/api/v1/words/0", json={"ipa": None}, headers=ADMIN)
+
+    assert response.status_code == 200
+    assert not response.json()["ipa"]
+    assert response.json()["word"] == "અકબંધ"
+
+
+RIVER = {"word": "નદી", "romanization": "nadi", "definitions": [{"pos": "fem.", "definition": "river"}]}
+
+
+def test_writes_require_the_admin_token(client):
+    assert client.put("/api/v1/words/3", json=RIVER).status_code == 403
+    assert client.delete("/api/v1/words/0", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert client.get("/api/v1/words/0").status_code == 200
+
+
+def test_put_creates_and_replaces(client, make_service):
+    response = client.put("/api/v1/words/3", json=RIVER, headers=ADMIN)
+
+    assert response.status_code == 200
+    assert response.headers["X-Dictionary-Version"] == "2"
+    assert client.get("/api/v1/words/3").json()["word"] == "નદી"
+    assert [word["word"] for word in client.get("/api/v1/words/search", params={"keyword": "river"}).json()] == ["નદી"]
+
+    replaced = dict(RIVER, definitions=[{"pos": "fem.", "definition": "stream"}])
+    client.put("/api/v1/words/3", json=replaced, headers=ADMIN)
+    assert client.get("/api/v1/words/search", params={"keyword": "river"}).json() == []
+    # Writes are replayed from the change log on restart
+    assert make_service().get_word_by_id("3").definitions[0].definition == "stream"
+
+
+def test_put_requires_one_definition(client):
+    response = client.put("/api/v1/words/3", json=dict(RIVER, definitions=[]), headers=ADMIN)
+
+    assert response.status_code == 422
+
+
+def test_patch_updates_given_fields(client):
+    response = client.patch("/api/v1/words/1", json={"romanization": "ghara"}, headers=ADMIN)
+
+    assert response.status_code == 200
+    assert response.json()["romanization"] == "ghara"
+    assert response.json()["definitions"] == [{"pos": "neut.", "definition": "house; home"}]
+    assert client.patch("/api/v1/words/9", json={"romanization": "x"}, headers=ADMIN).status_code == 404
+
+
+def test_delete(client, make_service):
+    response = client.delete("/api/v1/words/2", headers=ADMIN)
+
+    assert response.status_code == 204
+    assert response.headers["X-Dictionary-Version"] == "2"
+    assert client.get("/api/v1/words/2").status_code == 404
+    assert [word["word"] for word in client.get("/api/v1/words").json()] == ["અકબંધ", "ઘર"]
+    assert client.delete("/api/v1/words/2", headers=ADMIN).status_code == 404
+    assert make_service().get_word_by_id("2") is None